@@ -0,0 +1,96 @@
+# File: /benchmarks/bench_ai_helpers.py
+"""
+ai_helpers numerics at --size elements: the original list-comprehension / `gamma ** t` loop
+implementations vs. the vectorized NumPy versions (scipy.signal.lfilter for the discounted sums).
+
+    python benchmarks/bench_ai_helpers.py [--size 1000000] [--columns 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.ai_helpers import PredictionHelper, ReinforcementLearningHelper  # noqa: E402
+
+
+def loop_normalize(data):
+    min_val, max_val = min(data), max(data)
+    return [(x - min_val) / (max_val - min_val) for x in data]
+
+
+def loop_accuracy(predictions, actual):
+    return sum(1 for pred, act in zip(predictions, actual) if pred == act) / len(predictions) * 100
+
+
+def loop_discounted_reward(rewards, gamma):
+    total = 0
+    for t, reward in enumerate(rewards):
+        total += gamma ** t * reward
+    return total
+
+
+def loop_discounted_returns(rewards, gamma):
+    returns, running = [0.0] * len(rewards), 0.0
+    for t in reversed(range(len(rewards))):
+        running = rewards[t] + gamma * running
+        returns[t] = running
+    return returns
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=args.size)
+    labels = rng.integers(0, 3, args.size)
+    guesses = rng.integers(0, 3, args.size)
+    data_list, labels_list, guesses_list = data.tolist(), labels.tolist(), guesses.tolist()
+    batch = data.reshape(-1, args.columns)
+    ReinforcementLearningHelper.discounted_returns(data[:10])  # Import scipy.signal outside the timings
+
+    rows = []
+    expected, loop_ms = timed(loop_normalize, data_list)
+    result, vector_ms = timed(PredictionHelper.normalize_array, data)
+    np.testing.assert_allclose(result, expected)
+    rows.append(("min-max normalize", loop_ms, vector_ms))
+
+    expected, loop_ms = timed(loop_accuracy, guesses_list, labels_list)
+    result, vector_ms = timed(PredictionHelper.accuracy_metrics, guesses, labels)
+    np.testing.assert_allclose(result["accuracy"], expected)
+    rows.append(("accuracy (+MAE, direction)", loop_ms, vector_ms))
+
+    expected, loop_ms = timed(loop_discounted_reward, data_list, 0.99)
+    result, vector_ms = timed(ReinforcementLearningHelper.compute_discounted_reward, data, 0.99)
+    np.testing.assert_allclose(result, expected)
+    rows.append(("discounted reward (total)", loop_ms, vector_ms))
+
+    expected, loop_ms = timed(lambda: [loop_discounted_returns(column, 0.99) for column in batch.T.tolist()])
+    result, vector_ms = timed(ReinforcementLearningHelper.discounted_returns, batch, 0.99)
+    np.testing.assert_allclose(result, np.array(expected).T)
+    rows.append((f"discounted returns ({args.columns} cols)", loop_ms, vector_ms))
+
+    _, vector_ms = timed(ReinforcementLearningHelper.generalized_advantages, batch, batch[::-1], 0.99, 0.95)
+    rows.append(("GAE (vectorized only)", float("nan"), vector_ms))
+
+    print(f"{args.size:,} elements")
+    for name, loop_ms, vector_ms in rows:
+        speedup = "" if np.isnan(loop_ms) else f"  ({loop_ms / vector_ms:.0f}x)"
+        print(f"{name:<28}: loop {loop_ms:>9.1f} ms  vectorized {vector_ms:>8.1f} ms{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# File: /benchmarks/bench_event_loop_lag.py
+"""
+Event-loop lag with 16 concurrent async bots, each writing its agent state and a log row every cycle.
+
+"blocking" runs the mysql.connector calls directly inside the coroutines, as the bots used to;
+"async" routes them through AsyncDatabase. A probe task sleeps 5 ms in a loop and records how late it
+wakes up, which is the delay every other coroutine (price feeds, order submission) also experiences.
+Uses a fake connection with a configurable round trip, so no MySQL server is needed.
+
+    python benchmarks/bench_event_loop_lag.py [--bots 16] [--cycles 20] [--rtt-ms 2]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.async_db import AsyncDatabase  # noqa: E402
+from src.database.connection_pool import ConnectionPool  # noqa: E402
+
+STATE_QUERY = "INSERT INTO agents (strategy_name, status, timestamp) VALUES (%s, %s, NOW())"
+LOG_QUERY = "INSERT INTO logs (log_type, message, timestamp) VALUES (%s, %s, NOW())"
+
+
+class SimulatedCursor:
+    def __init__(self, rtt):
+        self.rtt = rtt
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        time.sleep(self.rtt)
+        self.rowcount = 1
+
+    def close(self):
+        pass
+
+
+class SimulatedConnection:
+    def __init__(self, rtt):
+        self.rtt = rtt
+
+    def cursor(self):
+        return SimulatedCursor(self.rtt)
+
+    def commit(self):
+        time.sleep(self.rtt)
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+def blocking_write(pool, query, params):
+    with pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute(query, params)
+        connection.commit()
+        cursor.close()
+
+
+async def bot(name, cycles, pool, async_db):
+    for _ in range(cycles):
+        if async_db is None:
+            blocking_write(pool, STATE_QUERY, (name, "running"))
+            blocking_write(pool, LOG_QUERY, ("info", f"{name} completed a cycle"))
+        else:
+            await async_db.execute(STATE_QUERY, (name, "running"))
+            await async_db.execute(LOG_QUERY, ("info", f"{name} completed a cycle"))
+        await asyncio.sleep(0.01)
+
+
+async def probe(lags, stop, interval=0.005):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def scenario(args, use_async):
+    pool = ConnectionPool({}, max_size=args.pool_size, connect=lambda: SimulatedConnection(args.rtt_ms / 1000))
+    async_db = AsyncDatabase(pool) if use_async else None
+    lags, stop = [], asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(bot(f"bot{i}", args.cycles, pool, async_db) for i in range(args.bots)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe_task
+    if async_db is not None:
+        async_db.close()
+    lags.sort()
+    return {
+        "elapsed_s": elapsed,
+        "lag_mean_ms": statistics.mean(lags),
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] if len(lags) > 1 else lags[0],
+        "lag_max_ms": lags[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bots", type=int, default=16)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    parser.add_argument("--pool-size", type=int, default=8)
+    args = parser.parse_args()
+
+    for label, use_async in (("blocking", False), ("async", True)):
+        result = asyncio.run(scenario(args, use_async))
+        print(f"{label:<9} elapsed {result['elapsed_s']:6.2f}s  loop lag mean {result['lag_mean_ms']:7.2f} ms  "
+              f"p99 {result['lag_p99_ms']:7.2f} ms  max {result['lag_max_ms']:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# File: /benchmarks/bench_inference_server.py
+"""
+Decisions per second for N bots on one event loop sharing a model: each bot calling the model directly
+(one forward pass per decision) vs. awaiting the micro-batching InferenceServer (one forward pass per
+batch). The model is a small NumPy MLP, so the per-call overhead dominates as it does for a policy network.
+
+    python benchmarks/bench_inference_server.py [--bots 16] [--decisions 500]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.inference_server import InferenceServer  # noqa: E402
+
+
+class MLPPolicy:
+    def __init__(self, obs_dim=32, hidden=1024, actions=3):
+        rng = np.random.default_rng(0)
+        self.w1 = rng.standard_normal((obs_dim, hidden)).astype(np.float32)
+        self.w2 = rng.standard_normal((hidden, hidden)).astype(np.float32)
+        self.w3 = rng.standard_normal((hidden, actions)).astype(np.float32)
+
+    def decide_actions(self, observations):
+        x = np.asarray(observations, dtype=np.float32)
+        x = np.maximum(x @ self.w1, 0)
+        x = np.maximum(x @ self.w2, 0)
+        return list(np.argmax(x @ self.w3, axis=1))
+
+    def decide_action(self, observation):
+        return self.decide_actions([observation])[0]
+
+
+async def run_bots(decide, bots, decisions, obs):
+    async def bot():
+        for _ in range(decisions):
+            await decide(obs)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bot() for _ in range(bots)))
+    return bots * decisions / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bots", type=int, default=16)
+    parser.add_argument("--decisions", type=int, default=500)
+    args = parser.parse_args()
+
+    model = MLPPolicy()
+    obs = np.random.default_rng(1).standard_normal(32).astype(np.float32)
+
+    async def direct(observation):
+        return model.decide_action(observation)
+
+    direct_rate = asyncio.run(run_bots(direct, args.bots, args.decisions, obs))
+
+    server = InferenceServer(max_batch_size=args.bots, max_latency_ms=2)
+    server.register("policy", model=model)
+    batched_rate = asyncio.run(run_bots(lambda o: server.apredict("policy", o), args.bots, args.decisions, obs))
+    metrics = server.metrics("policy")
+    server.close()
+
+    print(f"direct  : {direct_rate:>10,.0f} decisions/s")
+    print(f"batched : {batched_rate:>10,.0f} decisions/s ({batched_rate / direct_rate:.1f}x)")
+    print(f"mean batch {metrics['batch_size_mean']:.1f}, queue latency p99 {metrics['queue_latency_ms_p99']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# File: /benchmarks/bench_list_lookups.py
+"""
+Lookups per second for ListManager membership checks, per-query MySQL (before) vs the in-memory ListIndex (after).
+
+Runs against the MySQL instance in the MYSQL_* environment variables with --mysql, otherwise against an
+in-process fake connection that simulates a network round trip per query.
+
+    python benchmarks/bench_list_lookups.py [--mysql] [--lookups 20000] [--rtt-us 250]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.connection_pool import ConnectionPool  # noqa: E402
+from src.database.list_index import ListIndex  # noqa: E402
+from src.list_manager import ListManager  # noqa: E402
+
+
+class SimulatedCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, query, params=None):
+        time.sleep(self.conn.rtt)
+        if "list_changes" in query:
+            self.rows = [(0,)] if "MAX(id)" in query else []
+        elif params:
+            self.rows = [(params[0],)] if params[0] in self.conn.tokens else []
+        else:
+            self.rows = [(token,) for token in self.conn.tokens]
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class SimulatedConnection:
+    def __init__(self, tokens, rtt):
+        self.tokens = tokens
+        self.rtt = rtt
+
+    def cursor(self):
+        return SimulatedCursor(self)
+
+    def commit(self):
+        pass
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+def build_manager(args, tokens, use_index):
+    if args.mysql:
+        config = {
+            'host': os.getenv('MYSQL_HOST'),
+            'user': os.getenv('MYSQL_USER'),
+            'password': os.getenv('MYSQL_PASSWORD'),
+            'database': os.getenv('MYSQL_DATABASE'),
+        }
+        return ListManager(config, use_index=use_index)
+    # Skip connect_db() and wire a pool of simulated connections in directly
+    manager = ListManager.__new__(ListManager)
+    manager.pool = ConnectionPool({}, connect=lambda: SimulatedConnection(tokens, args.rtt_us / 1e6))
+    manager.index = ListIndex(manager.pool.connection, refresh_interval=5.0) if use_index else None
+    return manager
+
+
+def run(manager, probes):
+    start = time.perf_counter()
+    for token in probes:
+        manager.is_blacklisted(token)
+    return len(probes) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mysql", action="store_true", help="benchmark against the real MySQL instance")
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=10000)
+    parser.add_argument("--rtt-us", type=float, default=250.0, help="simulated round trip per query")
+    args = parser.parse_args()
+
+    tokens = {f"0x{i:040x}" for i in range(args.tokens)}
+    universe = list(tokens) + [f"0x{i:040x}" for i in range(args.tokens, 2 * args.tokens)]
+    probes = [random.choice(universe) for _ in range(args.lookups)]
+
+    # The per-query path is slow, so it gets a smaller sample
+    before = run(build_manager(args, tokens, use_index=False), probes[:max(1, args.lookups // 20)])
+    indexed = build_manager(args, tokens, use_index=True)
+    after = run(indexed, probes)
+
+    print(f"per-query MySQL : {before:>14,.0f} lookups/s")
+    print(f"ListIndex       : {after:>14,.0f} lookups/s  ({after / before:,.0f}x)")
+    print(f"index stats     : {indexed.index_stats()}")
+
+
+if __name__ == "__main__":
+    main()
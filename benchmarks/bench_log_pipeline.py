@@ -0,0 +1,91 @@
+# File: /benchmarks/bench_log_pipeline.py
+"""
+Caller-side cost of a log call, synchronous INSERT + COMMIT per message (the old CentralizedLogger path)
+vs enqueueing into LogPipeline, plus the pipeline's sustained write rate with batched inserts.
+
+Uses a fake MySQL connection that charges a round trip per statement, so it runs without a database.
+
+    python benchmarks/bench_log_pipeline.py [--messages 5000] [--rtt-us 300]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.connection_pool import ConnectionPool  # noqa: E402
+from src.logging.log_pipeline import DatabaseLogSink, LogPipeline  # noqa: E402
+
+LOG_QUERY = "INSERT INTO logs (log_type, message, timestamp) VALUES (%s, %s, %s)"
+
+
+class SimulatedCursor:
+    def __init__(self, rtt):
+        self.rtt = rtt
+
+    def execute(self, query, params=None):
+        time.sleep(self.rtt)
+
+    def executemany(self, query, rows):
+        time.sleep(self.rtt + len(rows) * 2e-6)
+
+    def close(self):
+        pass
+
+
+class SimulatedConnection:
+    def __init__(self, rtt):
+        self.rtt = rtt
+
+    def cursor(self):
+        return SimulatedCursor(self.rtt)
+
+    def commit(self):
+        time.sleep(self.rtt)
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--rtt-us", type=float, default=300.0)
+    args = parser.parse_args()
+    pool = ConnectionPool({}, connect=lambda: SimulatedConnection(args.rtt_us / 1e6))
+
+    sync_count = max(1, args.messages // 10)
+    start = time.perf_counter()
+    for i in range(sync_count):
+        with pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(LOG_QUERY, ("info", f"message {i}", datetime.now()))
+            connection.commit()
+            cursor.close()
+    sync_us = (time.perf_counter() - start) / sync_count * 1e6
+
+    pipeline = LogPipeline(DatabaseLogSink(pool.connection, "logs", ("log_type", "message", "timestamp")),
+                           max_queue=args.messages)
+    start = time.perf_counter()
+    for i in range(args.messages):
+        pipeline.emit("info", ("info", f"message {i}", datetime.now()))
+    enqueue_us = (time.perf_counter() - start) / args.messages * 1e6
+    pipeline.flush()
+    sustained = args.messages / (time.perf_counter() - start)
+    stats = pipeline.stats()
+    pipeline.close()
+
+    print(f"synchronous insert : {sync_us:10.1f} us per log call")
+    print(f"pipeline emit      : {enqueue_us:10.1f} us per log call ({sync_us / enqueue_us:,.0f}x less), "
+          f"{sustained:,.0f} rows/s sustained")
+    print(f"pipeline stats     : {stats}")
+
+
+if __name__ == "__main__":
+    main()
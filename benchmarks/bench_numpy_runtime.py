@@ -0,0 +1,87 @@
+# File: /benchmarks/bench_numpy_runtime.py
+"""
+Single-sample latency of NumpyModel for the DNNModel (128-64-32-1 Dense) and LSTMModel
+(LSTM 50 -> LSTM 50 -> Dense 25 -> Dense 1) architectures, with random weights, and the per-tick cost of
+StreamingLSTM for --assets assets vs. re-running every asset's full window. If torch is installed the
+same DNN is timed under torch for comparison.
+
+    python benchmarks/bench_numpy_runtime.py [--features 20] [--timesteps 60] [--assets 100] [--repeats 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.numpy_runtime import NumpyModel, StreamingLSTM  # noqa: E402
+
+
+def dense(rng, n_in, n_out, activation):
+    return {"type": "dense", "activation": activation}, {"kernel": rng.normal(0, 0.1, (n_in, n_out)),
+                                                         "bias": np.zeros(n_out)}
+
+
+def lstm(rng, n_in, units, return_sequences):
+    return ({"type": "lstm", "units": units, "return_sequences": return_sequences, "activation": "tanh",
+             "recurrent_activation": "sigmoid"},
+            {"kernel": rng.normal(0, 0.1, (n_in, 4 * units)), "recurrent_kernel": rng.normal(0, 0.1, (units, 4 * units)),
+             "bias": np.zeros(4 * units)})
+
+
+def time_call(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--features", type=int, default=20)
+    parser.add_argument("--timesteps", type=int, default=60)
+    parser.add_argument("--assets", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    dnn = NumpyModel([dense(rng, args.features, 128, "relu"), dense(rng, 128, 64, "relu"),
+                      dense(rng, 64, 32, "relu"), dense(rng, 32, 1, "linear")])
+    x = rng.normal(size=args.features).astype(np.float32)
+    print(f"numpy DNN  : {time_call(lambda: dnn.predict(x), args.repeats):8.1f} us/prediction")
+
+    lstm_model = NumpyModel([lstm(rng, args.features, 50, True), lstm(rng, 50, 50, False),
+                             dense(rng, 50, 25, "linear"), dense(rng, 25, 1, "linear")])
+    seq = rng.normal(size=(args.timesteps, args.features)).astype(np.float32)
+    print(f"numpy LSTM : {time_call(lambda: lstm_model.predict(seq), args.repeats // 10):8.1f} us/prediction "
+          f"({args.timesteps} timesteps)")
+
+    windows = rng.normal(size=(args.assets, args.timesteps, args.features)).astype(np.float32)
+    full = time_call(lambda: lstm_model.predict(windows), 10)
+    stream = StreamingLSTM(lstm_model, window=args.timesteps)
+    assets = list(range(args.assets))
+    for t in range(args.timesteps):
+        stream.update(assets, windows[:, t])
+    tick = windows[:, -1]
+    streamed = time_call(lambda: stream.update(assets, tick), args.repeats // 10)
+    print(f"{args.assets} assets, full windows : {full:10.1f} us/tick")
+    print(f"{args.assets} assets, streaming    : {streamed:10.1f} us/tick ({full / streamed:.0f}x, "
+          f"resync every {stream.resync_interval} bars included)")
+
+    try:
+        import torch
+    except ImportError:
+        return
+    net = torch.nn.Sequential(torch.nn.Linear(args.features, 128), torch.nn.ReLU(), torch.nn.Linear(128, 64),
+                              torch.nn.ReLU(), torch.nn.Linear(64, 32), torch.nn.ReLU(), torch.nn.Linear(32, 1))
+    tx = torch.from_numpy(x)[None]
+    with torch.no_grad():
+        print(f"torch DNN  : {time_call(lambda: net(tx), args.repeats):8.1f} us/prediction")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# File: /benchmarks/bench_online_learner.py
+"""
+Caller-side latency of a real-time loop that feeds each new labelled sample to the model and then
+predicts: synchronous fit(epochs=1) per sample (the old update_with_real_time_data) vs. OnlineLearner
+(queue the sample, train mini-batches on a background thread, predict from the published copy).
+
+Uses a NumPy MLP trained by SGD as the model so it runs without TensorFlow.
+
+    python benchmarks/bench_online_learner.py [--ticks 2000] [--features 32] [--hidden 256] [--batch-size 64]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.online_learner import OnlineLearner  # noqa: E402
+
+
+class NumpyMLP:
+    def __init__(self, features, hidden, seed=0):
+        rng = np.random.default_rng(seed)
+        self.w1 = rng.normal(0, 1 / np.sqrt(features), (features, hidden))
+        self.w2 = rng.normal(0, 1 / np.sqrt(hidden), (hidden, 1))
+
+    def predict(self, X):
+        return np.maximum(X @ self.w1, 0) @ self.w2
+
+    def fit(self, X, y, epochs=1, batch_size=32, verbose=0, lr=1e-3):
+        for _ in range(epochs):
+            for start in range(0, len(X), batch_size):
+                xb, yb = X[start:start + batch_size], y[start:start + batch_size].reshape(-1, 1)
+                hidden = np.maximum(xb @ self.w1, 0)
+                grad = 2 * (hidden @ self.w2 - yb) / len(xb)
+                grad_hidden = (grad @ self.w2.T) * (hidden > 0)
+                self.w2 -= lr * hidden.T @ grad
+                self.w1 -= lr * xb.T @ grad_hidden
+
+
+def percentiles(latencies):
+    return np.percentile(np.asarray(latencies) * 1e3, [50, 99])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--features", type=int, default=32)
+    parser.add_argument("--hidden", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(args.ticks, args.features))
+    y = X[:, :4].sum(axis=1)
+
+    model, sync = NumpyMLP(args.features, args.hidden), []
+    for t in range(args.ticks):
+        started = time.perf_counter()
+        model.fit(X[t:t + 1], y[t:t + 1], epochs=1, verbose=0)
+        model.predict(X[t:t + 1])
+        sync.append(time.perf_counter() - started)
+
+    learner, online = OnlineLearner(NumpyMLP(args.features, args.hidden), batch_size=args.batch_size), []
+    for t in range(args.ticks):
+        started = time.perf_counter()
+        learner.add_samples(X[t:t + 1], y[t:t + 1])
+        learner.predict(X[t:t + 1])
+        online.append(time.perf_counter() - started)
+    learner.close()
+
+    print(f"{args.ticks} ticks, MLP {args.features}-{args.hidden}-1")
+    print("synchronous fit + predict : p50 {:.3f} ms  p99 {:.3f} ms".format(*percentiles(sync)))
+    print("OnlineLearner             : p50 {:.3f} ms  p99 {:.3f} ms".format(*percentiles(online)))
+    print(f"background batches {learner.stats['batches']}, published version {learner.version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# File: /benchmarks/bench_replay_buffer.py
+"""
+Push and sample throughput and memory of ExperienceReplayBuffer at 1M transitions, against the previous
+list-of-tuples buffer sampled with random.sample and unpacked with zip(*batch), plus the cost of a
+PrioritizedReplayBuffer sample + update_priorities step at the same size.
+
+    python benchmarks/bench_replay_buffer.py [--transitions 1000000] [--state-dim 10] [--batch-size 64]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.replay_buffer import ExperienceReplayBuffer, PrioritizedReplayBuffer  # noqa: E402
+
+
+class ListReplayBuffer:
+    """The previous implementation, kept here as the baseline."""
+
+    def __init__(self, capacity=10000):
+        self.capacity = capacity
+        self.buffer = []
+        self.position = 0
+
+    def push(self, state, action, reward, next_state, done):
+        if len(self.buffer) < self.capacity:
+            self.buffer.append(None)
+        self.buffer[self.position] = (state, action, reward, next_state, done)
+        self.position = (self.position + 1) % self.capacity
+
+    def sample(self, batch_size):
+        return random.sample(self.buffer, batch_size)
+
+    def __len__(self):
+        return len(self.buffer)
+
+
+def measure(buffer, transitions, base_states, batch_size, samples, unpack):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(transitions):
+        # A fresh array per step, as the environment hands them over; the list buffer keeps them alive
+        state = base_states[i % len(base_states)].copy()
+        buffer.push(state, i % 3, 0.5, state, False)
+    push_rate = transitions / (time.perf_counter() - start)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(samples):
+        batch = buffer.sample(batch_size)
+        if unpack:
+            batch = [np.array(column) for column in zip(*batch)]
+    sample_rate = samples / (time.perf_counter() - start)
+    return push_rate, sample_rate, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transitions", type=int, default=1_000_000)
+    parser.add_argument("--state-dim", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--samples", type=int, default=2000)
+    args = parser.parse_args()
+
+    base_states = np.random.default_rng(0).random((1000, args.state_dim), dtype=np.float32)
+
+    results = {
+        "list of tuples": measure(ListReplayBuffer(args.transitions), args.transitions, base_states,
+                                  args.batch_size, args.samples, unpack=True),
+        "numpy ring": measure(ExperienceReplayBuffer(args.transitions), args.transitions, base_states,
+                              args.batch_size, args.samples, unpack=False),
+    }
+    for label, (push_rate, sample_rate, memory) in results.items():
+        print(f"{label:<15} push {push_rate:>12,.0f}/s  sample({args.batch_size}) {sample_rate:>10,.0f}/s  "
+              f"memory {memory / 2**20:8.1f} MiB")
+
+    # Vectorized ingestion, e.g. a vectorized environment or a log replay handing over 1000 steps at once
+    buffer = ExperienceReplayBuffer(args.transitions)
+    chunk = base_states
+    start = time.perf_counter()
+    for _ in range(args.transitions // len(chunk)):
+        buffer.push_batch(chunk, np.zeros(len(chunk), dtype=np.int64), np.zeros(len(chunk)), chunk,
+                          np.zeros(len(chunk), dtype=bool))
+    print(f"{'push_batch':<15} push {args.transitions / (time.perf_counter() - start):>12,.0f}/s")
+
+    prioritized = PrioritizedReplayBuffer(args.transitions, seed=0)
+    for _ in range(args.transitions // len(chunk)):
+        prioritized.push_batch(chunk, np.zeros(len(chunk), dtype=np.int64), np.zeros(len(chunk)), chunk,
+                               np.zeros(len(chunk), dtype=bool))
+    errors = np.random.default_rng(1).random(args.batch_size)
+    start = time.perf_counter()
+    for _ in range(args.samples):
+        batch = prioritized.sample(args.batch_size)
+        prioritized.update_priorities(batch[5], errors)
+    print(f"{'prioritized':<15} sample({args.batch_size}) + update_priorities "
+          f"{args.samples / (time.perf_counter() - start):>10,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# File: /benchmarks/bench_rl_training.py
+"""
+Training throughput of RLTradingAgent.train_from_experience on CPU, in replayed samples per second.
+
+"legacy" is the previous behaviour: one model.learn(total_timesteps=1) call per sampled experience, which
+runs a full PPO rollout + update each time. "mini-batch" is the vectorized actor-critic step that
+consumes the sampled arrays directly. Requires torch and stable-baselines3.
+
+    python benchmarks/bench_rl_training.py [--batch-size 256] [--steps 200] [--obs-dim 16]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import gymnasium as gym
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.replay_buffer import RLTradingAgent  # noqa: E402
+
+
+class RandomWalkEnv(gym.Env):
+    """Minimal trading-like environment: observe the last obs_dim returns, choose hold/buy/sell."""
+
+    def __init__(self, obs_dim):
+        self.observation_space = gym.spaces.Box(-np.inf, np.inf, shape=(obs_dim,), dtype=np.float32)
+        self.action_space = gym.spaces.Discrete(3)
+        self.rng = np.random.default_rng(0)
+
+    def reset(self, seed=None, options=None):
+        return self.rng.standard_normal(self.observation_space.shape).astype(np.float32), {}
+
+    def step(self, action):
+        obs = self.rng.standard_normal(self.observation_space.shape).astype(np.float32)
+        return obs, float(obs[0] * (action - 1)), False, False, {}
+
+
+def make_agent(obs_dim, buffer_size):
+    agent = RLTradingAgent(RandomWalkEnv(obs_dim), buffer_size=buffer_size)
+    agent.model.verbose = 0
+    rng = np.random.default_rng(1)
+    states = rng.standard_normal((buffer_size, obs_dim)).astype(np.float32)
+    agent.buffer.push_batch(states, rng.integers(0, 3, buffer_size), rng.standard_normal(buffer_size),
+                            np.roll(states, -1, axis=0), rng.random(buffer_size) < 0.01)
+    return agent
+
+
+def legacy_step(agent, batch_size):
+    agent.buffer.sample(batch_size)
+    for _ in range(batch_size):
+        agent.model.learn(total_timesteps=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--legacy-steps", type=int, default=1)
+    parser.add_argument("--obs-dim", type=int, default=16)
+    args = parser.parse_args()
+
+    agent = make_agent(args.obs_dim, 100_000)
+
+    start = time.perf_counter()
+    for _ in range(args.legacy_steps):
+        legacy_step(agent, args.batch_size)
+    legacy_rate = args.legacy_steps * args.batch_size / (time.perf_counter() - start)
+
+    agent.train_from_experience(args.batch_size)  # warm-up
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        stats = agent.train_from_experience(args.batch_size)
+    batched_rate = args.steps * args.batch_size / (time.perf_counter() - start)
+
+    print(f"legacy     : {legacy_rate:>12,.0f} samples/s")
+    print(f"mini-batch : {batched_rate:>12,.0f} samples/s ({batched_rate / legacy_rate:,.0f}x)")
+    print(f"last step  : {stats}")
+
+
+if __name__ == "__main__":
+    main()
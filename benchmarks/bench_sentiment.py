@@ -0,0 +1,118 @@
+# File: /benchmarks/bench_sentiment.py
+"""
+Sentiment scoring throughput: one pipeline call per text (the old analyze_text loop) vs.
+SentimentAnalysis.score_texts (dedup by content hash, LRU/TTL cache, fixed-size batches on a worker thread).
+
+Runs offline. With transformers + torch installed the pipeline is a tiny randomly initialised BERT built
+in memory with a word-level tokenizer; otherwise it is a small NumPy bag-of-words MLP.
+The workload is --cycles rounds of --texts headlines drawn from --unique distinct ones, as when the same
+news is picked up from several feeds; a second run scores --texts all-distinct headlines once, so only
+batching (no dedup or cache hits) contributes.
+
+    python benchmarks/bench_sentiment.py [--texts 512] [--unique 128] [--cycles 5] [--batch-size 32]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.models.sentiment_analysis import SentimentAnalysis  # noqa: E402
+
+WORDS = ("btc eth pool liquidity rally dump pump surge crash whale buys sells exploit hack upgrade listing "
+         "delisting bullish bearish record low high volume inflow outflow bridge fees").split()
+
+
+def transformers_pipeline(batch_size):
+    import torch  # noqa: F401
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import BertConfig, BertForSequenceClassification, PreTrainedTokenizerFast, pipeline
+
+    vocab = {"[PAD]": 0, "[UNK]": 1, **{word: i + 2 for i, word in enumerate(WORDS)}}
+    backend = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    backend.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=backend, unk_token="[UNK]", pad_token="[PAD]")
+    config = BertConfig(vocab_size=len(vocab), hidden_size=64, num_hidden_layers=2, num_attention_heads=2,
+                        intermediate_size=128, num_labels=2, id2label={0: "NEGATIVE", 1: "POSITIVE"},
+                        label2id={"NEGATIVE": 0, "POSITIVE": 1})
+    model = BertForSequenceClassification(config).eval()
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, batch_size=batch_size)
+
+
+class NumpyBagOfWordsPipeline:
+    """Hashed bag-of-words -> 256-unit MLP -> softmax over NEGATIVE/POSITIVE."""
+
+    def __init__(self, dim=4096, hidden=256):
+        rng = np.random.default_rng(0)
+        self.dim = dim
+        self.w1 = rng.normal(0, 0.05, (dim, hidden)).astype(np.float32)
+        self.w2 = rng.normal(0, 0.05, (hidden, 2)).astype(np.float32)
+
+    def __call__(self, texts):
+        texts = [texts] if isinstance(texts, str) else texts
+        x = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                x[row, hash(word) % self.dim] += 1
+        logits = np.maximum(x @ self.w1, 0) @ self.w2
+        probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probs /= probs.sum(axis=1, keepdims=True)
+        return [{"label": "POSITIVE" if p[1] >= p[0] else "NEGATIVE", "score": float(p.max())} for p in probs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--unique", type=int, default=128)
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    try:
+        pipe, kind = transformers_pipeline(args.batch_size), "tiny BERT (transformers)"
+    except ImportError:
+        pipe, kind = NumpyBagOfWordsPipeline(), "NumPy bag-of-words MLP"
+
+    rng = np.random.default_rng(1)
+    headlines = [" ".join(rng.choice(WORDS, 12)) for _ in range(args.unique)]
+    cycles = [[headlines[i] for i in rng.integers(0, args.unique, args.texts)] for _ in range(args.cycles)]
+
+    start = time.perf_counter()
+    for texts in cycles:
+        naive = [SentimentAnalysis.to_score(pipe(text)[0]) for text in texts]
+    naive_rate = args.texts * args.cycles / (time.perf_counter() - start)
+
+    model = SentimentAnalysis(pipe, batch_size=args.batch_size)
+    start = time.perf_counter()
+    for texts in cycles:
+        batched = model.score_texts(texts)
+    batched_rate = args.texts * args.cycles / (time.perf_counter() - start)
+    model.close()
+
+    np.testing.assert_allclose(batched, naive, rtol=1e-4, atol=1e-5)
+
+    distinct = [" ".join(rng.choice(WORDS, 12)) + f" #{i}" for i in range(args.texts)]
+    start = time.perf_counter()
+    distinct_naive = [SentimentAnalysis.to_score(pipe(text)[0]) for text in distinct]
+    distinct_naive_rate = args.texts / (time.perf_counter() - start)
+    distinct_model = SentimentAnalysis(pipe, batch_size=args.batch_size)
+    start = time.perf_counter()
+    distinct_batched = distinct_model.score_texts(distinct)
+    distinct_batched_rate = args.texts / (time.perf_counter() - start)
+    distinct_model.close()
+    np.testing.assert_allclose(distinct_batched, distinct_naive, rtol=1e-4, atol=1e-5)
+
+    print(f"model           : {kind}")
+    print(f"per-text calls  : {naive_rate:>10,.0f} texts/s")
+    print(f"batched + cache : {batched_rate:>10,.0f} texts/s ({batched_rate / naive_rate:.0f}x, "
+          f"cache hits {model.cache.hits}, misses {model.cache.misses})")
+    print(f"all distinct    : {distinct_naive_rate:>10,.0f} texts/s per-text, "
+          f"{distinct_batched_rate:>10,.0f} texts/s batched ({distinct_batched_rate / distinct_naive_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
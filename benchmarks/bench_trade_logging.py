@@ -0,0 +1,100 @@
+# File: /benchmarks/bench_trade_logging.py
+"""
+Sustained trades per second through DatabaseManager.log_trade, synchronous (one INSERT + COMMIT per trade)
+vs write-behind (queued, flushed with executemany).
+
+Uses a fake MySQL connection that charges a round trip per statement and a commit cost per transaction,
+so it runs without a database.
+
+    python benchmarks/bench_trade_logging.py [--trades 2000] [--rtt-us 300] [--commit-us 1000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.connection_pool import ConnectionPool  # noqa: E402
+from src.database.database_manager import DatabaseManager  # noqa: E402
+
+
+class SimulatedCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        time.sleep(self.conn.rtt)
+        self.conn.rows += 1
+
+    def executemany(self, query, rows):
+        # One multi-row round trip, plus a little per-row work on the server
+        time.sleep(self.conn.rtt + len(rows) * 2e-6)
+        self.conn.rows += len(rows)
+
+    def close(self):
+        pass
+
+
+class SimulatedConnection:
+    def __init__(self, rtt, commit_cost):
+        self.rtt = rtt
+        self.commit_cost = commit_cost
+        self.rows = 0
+
+    def cursor(self):
+        return SimulatedCursor(self)
+
+    def commit(self):
+        time.sleep(self.rtt + self.commit_cost)
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+def run(manager, trades):
+    trade = {"symbol": "ETH", "action": "buy", "size": 1.0, "price": 3000.0, "timestamp": "2024-01-01 00:00:00"}
+    start = time.perf_counter()
+    for _ in range(trades):
+        manager.log_trade(trade)
+    enqueue_elapsed = time.perf_counter() - start
+    manager.flush_trades()
+    return trades / enqueue_elapsed, trades / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=2000)
+    parser.add_argument("--rtt-us", type=float, default=300.0)
+    parser.add_argument("--commit-us", type=float, default=1000.0)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    def make_pool():
+        return ConnectionPool({}, connect=lambda: SimulatedConnection(args.rtt_us / 1e6, args.commit_us / 1e6))
+
+    sync_manager = DatabaseManager(pool=make_pool(), write_behind=False)
+    _, sync_rate = run(sync_manager, max(1, args.trades // 10))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        batched_manager = DatabaseManager(
+            pool=make_pool(), write_behind=True, batch_size=args.batch_size,
+            spill_path=os.path.join(tmpdir, "spill.jsonl")
+        )
+        caller_rate, sustained_rate = run(batched_manager, args.trades)
+        stats = batched_manager.trade_writer.stats()
+        batched_manager.close_connection()
+
+    print(f"synchronous   : {sync_rate:>12,.0f} trades/s")
+    print(f"write-behind  : {sustained_rate:>12,.0f} trades/s sustained ({sustained_rate / sync_rate:,.0f}x), "
+          f"{caller_rate:,.0f} trades/s as seen by the trading path")
+    print(f"writer stats  : {stats}")
+
+
+if __name__ == "__main__":
+    main()
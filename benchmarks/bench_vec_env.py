@@ -0,0 +1,55 @@
+# File: /benchmarks/bench_vec_env.py
+"""
+Environment steps per second: N trading episodes stepped one at a time (the DummyVecEnv pattern) vs
+VectorizedTradingEnv stepping all N on NumPy arrays in one call.
+
+    python benchmarks/bench_vec_env.py [--envs 64] [--steps 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.vec_env import SingleTradingEnv, VectorizedTradingEnv  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--envs", type=int, default=64)
+    parser.add_argument("--steps", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, 500_000)))
+    actions = rng.integers(0, 3, (args.steps, args.envs))
+
+    envs = [SingleTradingEnv(prices, seed=i) for i in range(args.envs)]
+    for env in envs:
+        env.reset()
+    serial_steps = max(1, args.steps // 10)
+    start = time.perf_counter()
+    for step in range(serial_steps):
+        for i, env in enumerate(envs):
+            _, _, _, truncated, _ = env.step(actions[step, i])
+            if truncated:
+                env.reset()
+    serial_rate = serial_steps * args.envs / (time.perf_counter() - start)
+
+    vec_env = VectorizedTradingEnv(prices, num_envs=args.envs, seed=0)
+    vec_env.reset()
+    start = time.perf_counter()
+    for step in range(args.steps):
+        vec_env.step(actions[step])
+    vec_rate = args.steps * args.envs / (time.perf_counter() - start)
+
+    print(f"one env at a time : {serial_rate:>12,.0f} env-steps/s")
+    print(f"vectorized        : {vec_rate:>12,.0f} env-steps/s ({vec_rate / serial_rate:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
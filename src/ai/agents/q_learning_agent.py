@@ -1,13 +1,13 @@
 # File: /src/ai/agents/q_learning_agent.py
 
-import numpy as np
+from src.ai.agents.tabular_q import TabularQEngine
 
 class QLearningAgent:
     """
     Q-Learning Agent for training trading bots using reinforcement learning techniques.
     """
 
-    def __init__(self, actions, learning_rate=0.1, discount_factor=0.9, exploration_rate=1.0):
+    def __init__(self, actions, learning_rate=0.1, discount_factor=0.9, exploration_rate=1.0, discretizer=None):
         """
         Initialize the Q-Learning agent.
         
@@ -15,12 +15,18 @@ class QLearningAgent:
         :param learning_rate: Rate at which the agent learns from new experiences.
         :param discount_factor: Discount factor for future rewards.
         :param exploration_rate: Probability of exploring new actions vs exploiting known rewards.
+        :param discretizer: Optional StateDiscretizer for numeric observations (default: hashable states).
         """
         self.actions = actions
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.exploration_rate = exploration_rate
-        self.q_table = {}  # Dictionary storing state-action pairs
+        self.engine = TabularQEngine(actions, discretizer=discretizer)  # Dense Q-array of state ids x action ids
+
+    @property
+    def q_table(self):
+        """Q-values as a (num_states, num_actions) array, rows in state-id order."""
+        return self.engine.q[:self.engine.num_states]
 
     def choose_action(self, state):
         """
@@ -29,11 +35,16 @@ class QLearningAgent:
         :param state: The current state.
         :return: The selected action.
         """
-        if np.random.rand() < self.exploration_rate:
-            return np.random.choice(self.actions)
-        if state not in self.q_table:
-            return np.random.choice(self.actions)
-        return self.actions[np.argmax(self.q_table[state])]
+        return self.engine.choose_action(state, self.exploration_rate)
+
+    def choose_actions(self, states):
+        """
+        Choose actions for a batch of states (e.g. every asset a bot watches) in one vectorized call.
+
+        :param states: Sequence of states.
+        :return: List of selected actions.
+        """
+        return [self.actions[i] for i in self.engine.select_actions(states, self.exploration_rate)]
 
     def update_q_table(self, state, action, reward, next_state):
         """
@@ -44,9 +55,4 @@ class QLearningAgent:
         :param reward: The reward received for taking the action.
         :param next_state: The state resulting from the action.
         """
-        if state not in self.q_table:
-            self.q_table[state] = np.zeros(len(self.actions))
-        
-        best_next_action = np.argmax(self.q_table.get(next_state, np.zeros(len(self.actions))))
-        self.q_table[state][self.actions.index(action)] += self.learning_rate * (
-            reward + self.discount
+        self.engine.update(state, action, reward, next_state, self.learning_rate, self.discount_factor)
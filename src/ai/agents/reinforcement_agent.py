@@ -1,9 +1,8 @@
 # File: /src/ai/agents/reinforcement_learning_agent.py
 
-import numpy as np
 import logging
 from centralized_logger import CentralizedLogger
-from src.ai.ai_helpers import RLHelper  # AI Helper for optimizing reinforcement learning strategies
+from src.ai.agents.tabular_q import TabularQEngine
 
 # Initialize logger and centralized logging
 logger = logging.getLogger(__name__)
@@ -25,46 +24,38 @@ class RLTradingAgent:
         self.discount_factor = discount_factor
         self.exploration_rate = exploration_rate
         self.exploration_decay = exploration_decay
-        self.q_table = {}  # Q-values for each state-action pair
         self.actions = ["buy", "sell", "hold"]  # Available actions
-        self.rl_helper = RLHelper()  # AI Helper for advanced reinforcement learning
+        self.engine = TabularQEngine(self.actions)  # Q-values for each state-action pair, as a dense array
+
+    @property
+    def q_table(self):
+        """Q-values as a (num_states, num_actions) array, rows in state-id order."""
+        return self.engine.q[:self.engine.num_states]
 
     def choose_action(self, state):
         """
-        Chooses the best action based on the current state, balancing exploration vs. exploitation.
-        AI Helper is used to optimize the decision-making process.
+        Chooses the best action based on the current state, balancing exploration vs. exploitation
+        (epsilon-greedy over the state's Q-values).
         """
-        # Initialize state with zero Q-values if it's not in the Q-table
-        if state not in self.q_table:
-            self.q_table[state] = [0] * len(self.actions)
-
-        # Exploration: Choose a random action
-        if np.random.uniform(0, 1) < self.exploration_rate:
-            action = np.random.choice(self.actions)
-        else:
-            # Exploitation: Choose the action with the highest Q-value
-            action = self.rl_helper.optimize_action(self.q_table[state], self.actions)
+        # Explore with probability exploration_rate, otherwise take the action with the highest Q-value
+        action = self.engine.choose_action(state, self.exploration_rate)
 
         logger.info(f"Action chosen: {action} for state {state}")
         return action
 
+    def choose_actions(self, states):
+        """
+        Chooses actions for a batch of states (all bots / assets) with one vectorized epsilon-greedy pass.
+        """
+        return [self.actions[i] for i in self.engine.select_actions(states, self.exploration_rate)]
+
     def update_q_table(self, state, action, reward, next_state):
         """
         Updates the Q-table based on the reward received and the next state.
         Uses AI-driven logic to optimize the learning process.
         """
-        if state not in self.q_table:
-            self.q_table[state] = [0] * len(self.actions)
-
-        if next_state not in self.q_table:
-            self.q_table[next_state] = [0] * len(self.actions)
-
         # Q-learning update formula
-        action_index = self.actions.index(action)
-        best_next_action = max(self.q_table[next_state])
-        self.q_table[state][action_index] += self.learning_rate * (
-            reward + self.discount_factor * best_next_action - self.q_table[state][action_index]
-        )
+        self.engine.update(state, action, reward, next_state, self.learning_rate, self.discount_factor)
 
         # Log the update to the Q-table
         centralized_logger.log_event(f"Q-table updated for state {state}, action {action}, reward {reward}")
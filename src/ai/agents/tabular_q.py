@@ -0,0 +1,221 @@
+# File: /src/ai/agents/tabular_q.py
+
+import threading
+import numpy as np
+
+
+def q_learning_batch_update(q, states, actions, rewards, next_states, learning_rate, discount_factor,
+                            dones=None, duplicates="mean"):
+    """
+    Apply the Q-learning rule to a batch of integer transitions in place, with NumPy fancy indexing.
+
+    All TD targets are computed from the Q-array as it was before the batch, and the updates for repeated
+    (state, action) pairs are accumulated with np.add.at, so the result does not depend on the order of
+    transitions inside the batch.
+
+    :param q: 2D Q-array (num_states, num_actions), modified in place.
+    :param states: int array of state ids.
+    :param actions: int array of action ids.
+    :param rewards: float array of rewards.
+    :param next_states: int array of next-state ids.
+    :param learning_rate: Step size alpha.
+    :param discount_factor: Discount gamma.
+    :param dones: Optional bool array; terminal transitions do not bootstrap from next_state.
+    :param duplicates: 'mean' applies the average TD error of repeated pairs once (stable for any batch),
+                       'sum' applies each of them (same as sequential updates for small alpha).
+    :return: Array of TD errors, one per transition.
+    """
+    states = np.asarray(states, dtype=np.int64)
+    actions = np.asarray(actions, dtype=np.int64)
+    rewards = np.asarray(rewards, dtype=q.dtype)
+    next_states = np.asarray(next_states, dtype=np.int64)
+
+    bootstrap = q[next_states].max(axis=1)
+    if dones is not None:
+        bootstrap = np.where(np.asarray(dones, dtype=bool), 0.0, bootstrap)
+    td_errors = rewards + discount_factor * bootstrap - q[states, actions]
+
+    if duplicates == "sum":
+        np.add.at(q, (states, actions), learning_rate * td_errors)
+    elif duplicates == "mean":
+        flat = states * q.shape[1] + actions
+        pairs, inverse = np.unique(flat, return_inverse=True)
+        totals = np.zeros(len(pairs), dtype=q.dtype)
+        np.add.at(totals, inverse, td_errors)
+        counts = np.bincount(inverse, minlength=len(pairs))
+        q[pairs // q.shape[1], pairs % q.shape[1]] += learning_rate * totals / counts
+    else:
+        raise ValueError(f"duplicates must be 'mean' or 'sum', got {duplicates!r}")
+    return td_errors
+
+
+class StateDiscretizer:
+    """
+    Maps raw observations to contiguous integer state ids (0, 1, 2, ...) for TabularQEngine.
+
+    The default implementation interns hashable states (strings, tuples, ints): each new state gets the next
+    id. Subclasses override ids() to discretize numeric observations instead.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        """Number of state ids handed out so far (an upper bound for ids())."""
+        return len(self._ids)
+
+    def id(self, state):
+        """State id of a single observation."""
+        state_id = self._ids.get(state)
+        if state_id is None:
+            with self._lock:
+                state_id = self._ids.setdefault(state, len(self._ids))
+        return state_id
+
+    def ids(self, states):
+        """State ids of a batch of observations, as an int64 array."""
+        return np.fromiter((self.id(state) for state in states), dtype=np.int64, count=len(states))
+
+
+class BinningStateDiscretizer(StateDiscretizer):
+    """
+    Discretizes numeric feature vectors by per-feature bin edges and ravels the bin indices into one id,
+    fully vectorized over a batch of observations: ids = ravel_multi_index(digitize(x_j, edges_j)).
+    """
+
+    def __init__(self, bin_edges):
+        """
+        :param bin_edges: One increasing sequence of edges per feature; feature j gets len(edges_j) + 1 bins.
+        """
+        super().__init__()
+        self.bin_edges = [np.asarray(edges, dtype=np.float64) for edges in bin_edges]
+        self.shape = tuple(len(edges) + 1 for edges in self.bin_edges)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def id(self, state):
+        return int(self.ids(np.asarray(state, dtype=np.float64)[None, :])[0])
+
+    def ids(self, states):
+        states = np.asarray(states, dtype=np.float64).reshape(-1, len(self.bin_edges))
+        bins = [np.digitize(states[:, j], edges) for j, edges in enumerate(self.bin_edges)]
+        return np.ravel_multi_index(bins, self.shape).astype(np.int64)
+
+
+class TabularQEngine:
+    """
+    Shared tabular Q-learning engine: a dense 2D NumPy Q-array indexed by (state id, action id).
+
+    States go through a pluggable StateDiscretizer, actions are mapped to integer ids once, and the array
+    grows geometrically as new state ids appear. select_actions() does epsilon-greedy selection for a
+    whole batch of states (all bots and assets) in one vectorized call.
+    """
+
+    def __init__(self, actions, discretizer=None, initial_states=1024, seed=None):
+        """
+        :param actions: Action labels, e.g. ["buy", "sell", "hold"]; their positions are the action ids.
+        :param discretizer: StateDiscretizer mapping observations to ids (default: interns hashable states).
+        :param initial_states: Initial number of Q-array rows.
+        :param seed: Optional seed for exploration.
+        """
+        self.actions = list(actions)
+        self.action_ids = {action: i for i, action in enumerate(self.actions)}
+        self.discretizer = discretizer or StateDiscretizer()
+        self.rng = np.random.default_rng(seed)
+        self.q = np.zeros((max(1, initial_states), len(self.actions)), dtype=np.float64)
+
+    @property
+    def num_actions(self):
+        return len(self.actions)
+
+    @property
+    def num_states(self):
+        return min(self.discretizer.size, len(self.q))
+
+    def _ensure_rows(self, max_id):
+        if max_id >= len(self.q):
+            rows = len(self.q)
+            while rows <= max_id:
+                rows *= 2
+            grown = np.zeros((rows, self.num_actions), dtype=self.q.dtype)
+            grown[:len(self.q)] = self.q
+            self.q = grown
+
+    def state_ids(self, states):
+        """Discretize a batch of observations and make sure the Q-array has rows for them."""
+        ids = self.discretizer.ids(states)
+        if len(ids):
+            self._ensure_rows(int(ids.max()))
+        return ids
+
+    def state_id(self, state):
+        """Discretize one observation and make sure the Q-array has a row for it."""
+        state_id = self.discretizer.id(state)
+        self._ensure_rows(state_id)
+        return state_id
+
+    def action_id(self, action):
+        """Integer id of an action label (ids themselves are accepted as well)."""
+        action_id = self.action_ids.get(action)
+        if action_id is None:
+            if isinstance(action, (int, np.integer)) and 0 <= action < self.num_actions:
+                return int(action)
+            raise ValueError(f"Unknown action {action!r}")
+        return action_id
+
+    def q_values(self, state):
+        """Row of Q-values for one observation."""
+        return self.q[self.state_id(state)]
+
+    def greedy_actions(self, state_ids):
+        """Greedy action ids for an array of state ids; ties (e.g. unseen states) are broken at random."""
+        q = self.q[state_ids]
+        ties = q == q.max(axis=1, keepdims=True)
+        return np.argmax(self.rng.random(q.shape) * ties, axis=1)
+
+    def select_actions(self, states, epsilon):
+        """
+        Epsilon-greedy action ids for a batch of observations in one vectorized pass.
+
+        :param states: Sequence of observations (or 2D array for numeric discretizers).
+        :param epsilon: Exploration probability, scalar or one per state.
+        :return: int64 array of action ids; map back with engine.actions[i].
+        """
+        state_ids = self.state_ids(states)
+        chosen = self.greedy_actions(state_ids)
+        explore = self.rng.random(len(state_ids)) < epsilon
+        chosen[explore] = self.rng.integers(0, self.num_actions, int(explore.sum()))
+        return chosen
+
+    def choose_action(self, state, epsilon):
+        """Epsilon-greedy action label for a single observation."""
+        return self.actions[int(self.select_actions([state], epsilon)[0])]
+
+    def update(self, state, action, reward, next_state, learning_rate, discount_factor, done=False):
+        """
+        One Q-learning step: Q(s, a) += lr * (r + gamma * max_a' Q(s', a') - Q(s, a)).
+
+        :return: The TD error.
+        """
+        state_id, next_id = self.state_id(state), self.state_id(next_state)
+        action_id = self.action_id(action)
+        target = reward if done else reward + discount_factor * self.q[next_id].max()
+        td_error = target - self.q[state_id, action_id]
+        self.q[state_id, action_id] += learning_rate * td_error
+        return td_error
+
+    def update_batch(self, states, actions, rewards, next_states, learning_rate, discount_factor, dones=None,
+                     duplicates="mean"):
+        """
+        Vectorized Q-learning step over a batch of transitions (see q_learning_batch_update).
+
+        :return: Array of TD errors.
+        """
+        state_ids, next_ids = self.state_ids(states), self.state_ids(next_states)
+        action_ids = np.fromiter((self.action_id(a) for a in actions), dtype=np.int64, count=len(actions))
+        return q_learning_batch_update(self.q, state_ids, action_ids, rewards, next_ids, learning_rate,
+                                       discount_factor, dones=dones, duplicates=duplicates)
@@ -1,5 +1,36 @@
 # File: /src/ai/ai_helpers.py
 
+import numpy as np
+
+
+def discount_filter(x, factor, axis=0, initial=None):
+    """
+    y[t] = x[t] + factor * y[t + 1] along `axis`, computed as a first-order linear filter over the
+    reversed sequence (scipy.signal.lfilter) instead of a Python loop.
+
+    :param x: Float array with time along `axis`.
+    :param factor: Discount factor.
+    :param axis: Time axis.
+    :param initial: Optional value of y just past the end of the sequence (e.g. a bootstrap value),
+                    broadcastable to x with `axis` removed.
+    :return: Array shaped like x.
+    """
+    from scipy.signal import lfilter
+
+    x = np.asarray(x, dtype=np.float64)
+    if x.shape[axis] == 0:
+        return x.copy()
+    reversed_x = np.flip(x, axis=axis)
+    if initial is None:
+        y = lfilter([1.0], [1.0, -factor], reversed_x, axis=axis)
+    else:
+        shape = list(x.shape)
+        shape[axis] = 1
+        zi = factor * np.broadcast_to(np.expand_dims(np.asarray(initial, dtype=np.float64), axis), shape)
+        y, _ = lfilter([1.0], [1.0, -factor], reversed_x, axis=axis, zi=zi)
+    return np.flip(y, axis=axis)
+
+
 class PredictionHelper:
     """
     Helper class for making and evaluating predictions in various AI models.
@@ -17,8 +48,39 @@ class PredictionHelper:
         if len(predictions) != len(actual):
             raise ValueError("Predictions and actual values must have the same length.")
         
-        correct = sum(1 for pred, act in zip(predictions, actual) if pred == act)
-        return correct / len(predictions) * 100
+        if len(predictions) == 0:
+            raise ValueError("At least one prediction is required.")
+        # Exact matches only, so labels such as 'buy'/'sell' work as well as numbers
+        return float(np.count_nonzero(np.asarray(predictions) == np.asarray(actual)) / len(predictions) * 100)
+
+    @staticmethod
+    def accuracy_metrics(predictions, actual, axis=0):
+        """
+        Vectorized prediction metrics, per column for 2D batches (one series per column when axis=0).
+
+        :param predictions: Array of predicted values.
+        :param actual: Array of observed values with the same shape.
+        :param axis: Time/sample axis.
+        :return: Dict with "accuracy" (percentage of exact matches), "mae" (mean absolute error) and
+                 "directional_accuracy" (percentage of steps where the predicted change from the previous
+                 actual value has the sign of the actual change; NaN with fewer than two samples).
+        """
+        predictions, actual = np.asarray(predictions), np.asarray(actual)
+        if predictions.shape != actual.shape:
+            raise ValueError("Predictions and actual values must have the same shape.")
+        predictions, actual = np.moveaxis(predictions, axis, 0), np.moveaxis(actual, axis, 0)
+        n = len(actual)
+        if n == 0:
+            raise ValueError("At least one prediction is required.")
+        accuracy = np.count_nonzero(predictions == actual, axis=0) / n * 100
+        mae = np.abs(predictions - actual).mean(axis=0)
+        if n < 2:
+            directional = np.full(np.shape(mae), np.nan)
+        else:
+            predicted_move = np.sign(predictions[1:] - actual[:-1])
+            actual_move = np.sign(actual[1:] - actual[:-1])
+            directional = np.count_nonzero(predicted_move == actual_move, axis=0) / (n - 1) * 100
+        return {"accuracy": accuracy, "mae": mae, "directional_accuracy": directional}
 
     @staticmethod
     def normalize_data(data):
@@ -28,9 +90,21 @@ class PredictionHelper:
         :param data: The data to normalize.
         :return: Normalized data.
         """
-        min_val = min(data)
-        max_val = max(data)
-        return [(x - min_val) / (max_val - min_val) for x in data]
+        return PredictionHelper.normalize_array(data).tolist()
+
+    @staticmethod
+    def normalize_array(data, axis=0):
+        """
+        Vectorized min-max scaling to [0, 1], per column for 2D batches (axis=0).
+
+        :param data: Array of values.
+        :param axis: Axis along which min and max are taken.
+        :return: Float array shaped like data; constant columns map to 0.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        min_val = data.min(axis=axis, keepdims=True)
+        value_range = data.max(axis=axis, keepdims=True) - min_val
+        return (data - min_val) / np.where(value_range == 0, 1.0, value_range)
 
 
 class ReinforcementLearningHelper:
@@ -47,11 +121,45 @@ class ReinforcementLearningHelper:
         :param gamma: The discount factor for future rewards.
         :return: The discounted total reward.
         """
-        discounted_reward = 0
-        for t, reward in enumerate(rewards):
-            discounted_reward += gamma ** t * reward
-        
-        return discounted_reward
+        if len(rewards) == 0:
+            return 0
+        return float(ReinforcementLearningHelper.discounted_returns(rewards, gamma)[0])
+
+    @staticmethod
+    def discounted_returns(rewards, gamma=0.99, last_value=None, axis=0):
+        """
+        Discounted return G[t] = r[t] + gamma * G[t + 1] at every step, for one episode or a 2D batch of
+        episodes (time along `axis`, e.g. (steps, envs) rollouts).
+
+        :param rewards: Array of rewards.
+        :param gamma: Discount factor.
+        :param last_value: Optional bootstrap value V(s_T) per episode for truncated rollouts.
+        :param axis: Time axis.
+        :return: Float array shaped like rewards.
+        """
+        return discount_filter(rewards, gamma, axis=axis, initial=last_value)
+
+    @staticmethod
+    def generalized_advantages(rewards, values, gamma=0.99, lam=0.95, last_value=0.0, axis=0):
+        """
+        Generalized advantage estimates for one episode or a 2D batch of episodes (time along `axis`):
+        A[t] = delta[t] + gamma * lam * A[t + 1] with delta[t] = r[t] + gamma * V[t + 1] - V[t].
+
+        :param rewards: Array of rewards.
+        :param values: Value estimates V[t] with the shape of rewards.
+        :param gamma: Discount factor.
+        :param lam: GAE lambda.
+        :param last_value: Bootstrap value V(s_T) per episode (0 for episodes that terminated).
+        :param axis: Time axis.
+        :return: (advantages, returns) where returns = advantages + values (the critic's targets).
+        """
+        rewards = np.asarray(rewards, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        last = np.expand_dims(np.broadcast_to(last_value, np.delete(values.shape, axis)), axis)
+        next_values = np.concatenate([np.delete(values, 0, axis=axis), last], axis=axis)
+        deltas = rewards + gamma * next_values - values
+        advantages = discount_filter(deltas, gamma * lam, axis=axis)
+        return advantages, advantages + values
 
     @staticmethod
     def choose_greedy_action(q_table, state, actions, exploration_rate=0.1):
@@ -64,7 +172,6 @@ class ReinforcementLearningHelper:
         :param exploration_rate: The exploration rate (epsilon).
         :return: The chosen action.
         """
-        import numpy as np
         if np.random.rand() < exploration_rate:
             return np.random.choice(actions)
         if state not in q_table:
@@ -2,10 +2,14 @@ import tensorflow as tf
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense
 import numpy as np
+from src.ai.online_learner import OnlineLearner
 
 class AIModel:
-    def __init__(self, input_shape):
+    def __init__(self, input_shape, online_batch_size=32, online_max_delay=5.0):
         self.model = self._build_model(input_shape)
+        self.online_batch_size = online_batch_size
+        self.online_max_delay = online_max_delay
+        self.online_learner = None  # Created on the first real-time update
 
     def _build_model(self, input_shape):
         """Builds an LSTM model for market prediction."""
@@ -18,12 +22,21 @@ class AIModel:
 
     def train(self, X_train, y_train, epochs=10, batch_size=64):
         """Trains the model on historical data."""
-        self.model.fit(X_train, y_train, epochs=epochs, batch_size=batch_size)
+        fit = lambda model: model.fit(X_train, y_train, epochs=epochs, batch_size=batch_size)
+        if self.online_learner is not None:
+            self.online_learner.train(fit)  # Serialized with the background updates, then published
+        else:
+            fit(self.model)
 
     def predict(self, X):
-        """Makes predictions based on input data."""
+        """Makes predictions based on input data (the last published weights once online learning runs)."""
+        if self.online_learner is not None:
+            return self.online_learner.predict(X)
         return self.model.predict(X)
 
     def update_with_real_time_data(self, real_time_data, y_real_time):
-        """Updates the model with real-time data to retrain it periodically."""
-        self.model.fit(real_time_data, y_real_time, epochs=1, verbose=0)
+        """Queues real-time data for background mini-batch training (see OnlineLearner); returns immediately."""
+        if self.online_learner is None:
+            self.online_learner = OnlineLearner(self.model, batch_size=self.online_batch_size,
+                                                max_delay=self.online_max_delay)
+        self.online_learner.add_samples(real_time_data, y_real_time)
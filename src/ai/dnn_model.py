@@ -1,5 +1,6 @@
 import torch
 import torch.nn as nn
+from src.ai.numpy_runtime import export_torch_layers
 
 class DNNTradingModel(nn.Module):
     """Deep Neural Network model for processing trading data."""
@@ -18,3 +19,7 @@ class DNNTradingModel(nn.Module):
         x = self.relu(self.fc2(x))
         x = self.fc3(x)
         return x
+
+    def export_numpy(self, path):
+        """Export the weights for src.ai.numpy_runtime.NumpyModel (torch-free inference)."""
+        export_torch_layers([self.fc1, self.relu, self.fc2, self.relu, self.fc3], path)
@@ -1,40 +1,159 @@
+import numpy as np
 import gymnasium as gym
 from gymnasium import spaces
+from numpy.lib.stride_tricks import sliding_window_view
+from src.ai.feature_engine import FeatureEngine
+from src.ai.vec_env import pnl_reward, target_positions
 
 class TradingEnv(gym.Env):
-    """Custom environment for trading that follows the gym interface."""
+    """
+    Custom environment for trading that follows the gym interface.
 
-    def __init__(self, market_data):
-        """Initialize the environment with market data."""
+    Trades a historical price/feature array bar by bar. Observations are the last `window` rows of the
+    feature array, served as read-only sliding-window views of the data (no copy per step), so the array
+    can be a np.memmap over years of minute bars. Indicators of the traded price (moving average,
+    momentum, ...) come from a FeatureEngine that is fed the bars since the previous query, so steps that
+    nobody reads indicators for cost nothing extra. Rewards are the PnL of the held position net of fees
+    and slippage on every position change.
+    """
+
+    def __init__(self, market_data, window=10, price_column=0, fee=0.001, slippage=0.0005, episode_length=None,
+                 allow_short=True, random_start=False, seed=None, feature_engine=None):
+        """
+        Initialize the environment with market data.
+
+        :param market_data: Array of shape (T,) (prices) or (T, F) (features, one column being the price),
+                            or a path to a .npy file, which is memory-mapped read-only.
+        :raises ValueError: If market_data is not a numeric 1D/2D array of at least two bars.
+        :param window: Number of past bars in each observation.
+        :param price_column: Column of a 2D market_data used as the traded price.
+        :param fee: Proportional exchange fee per unit traded.
+        :param slippage: Proportional slippage per unit traded.
+        :param episode_length: Maximum steps per episode (None runs to the end of the data).
+        :param allow_short: Whether 'sell' opens a short position or just goes flat.
+        :param random_start: Start each episode at a random bar instead of the first full window.
+        :param seed: Optional seed for random starts.
+        :param feature_engine: FeatureEngine for the price indicators (default: a private one).
+        """
         super(TradingEnv, self).__init__()
-        self.market_data = market_data
+        self.market_data = self._load_market_data(market_data)
+        self.prices = self.market_data if self.market_data.ndim == 1 else self.market_data[:, price_column]
+
+        # Short histories (e.g. a handful of test prices) get a correspondingly short window
+        self.window = max(1, min(window, len(self.prices) - 1))
+        self.fee = fee
+        self.slippage = slippage
+        self.episode_length = episode_length
+        self.allow_short = allow_short
+        self.random_start = random_start
+        self._start_rng = np.random.default_rng(seed)
+
+        # windows[i] is a view of rows [i, i + window); shape (T - window + 1, window[, F])
+        self.windows = sliding_window_view(self.market_data, self.window, axis=0)
+        if self.market_data.ndim == 2:
+            self.windows = self.windows.swapaxes(1, 2)
+
+        # Define action and observation spaces (buy, sell, hold)
+        self.action_space = spaces.Discrete(3)
+        dtype = self.market_data.dtype if np.issubdtype(self.market_data.dtype, np.floating) else np.float64
+        self.observation_space = spaces.Box(low=-np.inf, high=np.inf, shape=self.windows.shape[1:], dtype=dtype)
+
+        self.feature_engine = feature_engine or FeatureEngine()
+        # Bars of history replayed into the feature engine so every indicator is defined from the first bar
+        self._feature_warm_up = max(self.feature_engine.ring_size, self.feature_engine.rsi_period,
+                                    self.feature_engine.volatility_window) + 1
+        self._features_t = None  # Last bar fed to the feature engine
+
+        self.t = self.window - 1
+        self.start = self.t
+        self.position = 0.0
+        self.equity = 1.0
 
-        # Define action and observation spaces (using Box or Discrete)
-        self.action_space = spaces.Discrete(3)  # Example action space (buy, sell, hold)
-        self.observation_space = spaces.Box(low=0, high=1, shape=(10,), dtype=float)  # Example observation space
+    @staticmethod
+    def _load_market_data(market_data):
+        if isinstance(market_data, str) and market_data.endswith(".npy"):
+            return np.load(market_data, mmap_mode="r")
+        try:
+            data = np.asarray(market_data)
+        except (TypeError, ValueError):
+            data = None
+        if data is None or data.ndim not in (1, 2) or not np.issubdtype(data.dtype, np.number) or len(data) < 2:
+            raise ValueError(f"TradingEnv needs a numeric array of shape (T,) or (T, F) with T >= 2, or a .npy "
+                             f"path; got {type(market_data).__name__} {market_data!r:.80}")
+        return data
 
-    def reset(self, **kwargs):
+    def reset(self, seed=None, **kwargs):
         """Reset the state of the environment to an initial state."""
+        if seed is not None:
+            self._start_rng = np.random.default_rng(seed)
+        first, last = self.window - 1, len(self.prices) - 2
+        if self.random_start and last > first:
+            if self.episode_length is not None:
+                last = max(first, last - self.episode_length)
+            self.t = int(self._start_rng.integers(first, last + 1))
+        else:
+            self.t = first
+        self.start = self.t
+        self.position = 0.0
+        self.equity = 1.0
+        self._features_t = None
         observation = self._get_observation()  # Get initial observation
-        self.info = {}  # Initialize an empty info dictionary
+        self.info = {"position": self.position, "equity": self.equity}
         return observation, self.info  # Return observation and info dictionary
 
     def step(self, action):
         """Execute one time step within the environment."""
-        observation = self._get_observation()
         reward = self._calculate_reward(action)
-        done = self._is_done()
-        info = {}
-        return observation, reward, done, info
+        self.t += 1
+        observation = self._get_observation()
+        terminated = self.equity <= 0
+        truncated = self._is_done()
+        info = {"position": self.position, "equity": self.equity}
+        return observation, reward, terminated, truncated, info
+
+    def _sync_features(self):
+        """Feed the feature engine the bars up to the current one, replaying its history after a reset."""
+        if self._features_t is None or self._features_t > self.t or self.t - self._features_t > self._feature_warm_up:
+            self.feature_engine.reset(("price",))
+            self._features_t = max(0, self.t - self._feature_warm_up + 1) - 1
+        for price in self.prices[self._features_t + 1:self.t + 1]:
+            self.feature_engine.update(("price",), (price,))
+        self._features_t = self.t
+
+    def get_current_price(self):
+        """Price of the current bar."""
+        return float(self.prices[self.t])
+
+    def get_moving_average(self):
+        """Simple moving average of the price (NaN until the feature engine window has filled)."""
+        self._sync_features()
+        return self.feature_engine.value("price", "sma")
+
+    def get_momentum(self):
+        """Price change over the feature engine's momentum period."""
+        self._sync_features()
+        return self.feature_engine.value("price", "momentum")
+
+    def get_features(self):
+        """Every indicator of the price at the current bar."""
+        self._sync_features()
+        return self.feature_engine.features("price")
 
     def _get_observation(self):
-        """Return the current observation."""
-        return self.observation_space.sample()  # Sample random observation
+        """Return the current observation: a read-only view of the last `window` bars."""
+        return self.windows[self.t - self.window + 1]
 
     def _calculate_reward(self, action):
-        """Calculate the reward for the given action."""
-        return 1.0  # Placeholder reward calculation
+        """Calculate the reward for the given action: next-bar PnL of the new position minus trading costs."""
+        new_position = float(target_positions(action, self.position, self.allow_short))
+        reward = float(pnl_reward(self.position, new_position, self.prices[self.t], self.prices[self.t + 1],
+                                  self.fee, self.slippage))
+        self.position = new_position
+        self.equity *= 1.0 + reward
+        return reward
 
     def _is_done(self):
         """Check if the environment is done."""
-        return False  # Placeholder for done flag
+        if self.t >= len(self.prices) - 1:
+            return True
+        return self.episode_length is not None and self.t - self.start >= self.episode_length
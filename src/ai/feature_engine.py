@@ -0,0 +1,233 @@
+# File: /src/ai/feature_engine.py
+
+import threading
+
+import numpy as np
+
+FEATURES = ("price", "sma", "ema", "std", "zscore", "momentum", "rsi", "vwap", "realized_volatility")
+
+
+class FeatureEngine:
+    """
+    Streaming technical indicators for many assets with O(1) work per tick.
+
+    Each asset owns a row in fixed-size NumPy ring buffers (prices, volumes, log returns) plus running
+    sums, so an update adds the new value and subtracts the one leaving the window instead of recomputing
+    over history. update() advances any subset of assets in one vectorized call; update_all() takes one
+    price per registered asset. Running sums are recomputed exactly from the rings every `resync_interval`
+    ticks to stop floating-point drift.
+
+    Indicators (NaN until enough history): SMA, rolling std (ddof=1) and z-score over `window`; EMA with
+    span `ema_span`; momentum (price change over `momentum_period` ticks); Wilder RSI over `rsi_period`;
+    VWAP over `window`; realized volatility (root mean squared log return over `volatility_window`).
+    """
+
+    def __init__(self, window=20, ema_span=None, momentum_period=10, rsi_period=14, volatility_window=None,
+                 capacity=64, resync_interval=1000):
+        """
+        :param window: Window for SMA, std, z-score and VWAP.
+        :param ema_span: EMA span (alpha = 2 / (span + 1)); defaults to window.
+        :param momentum_period: Lag of the momentum indicator.
+        :param rsi_period: RSI period.
+        :param volatility_window: Number of log returns in realized volatility; defaults to window.
+        :param capacity: Initial number of asset rows (grows as needed).
+        :param resync_interval: Ticks between exact recomputations of the running sums.
+        """
+        self.window = window
+        self.alpha = 2.0 / ((ema_span or window) + 1)
+        self.momentum_period = momentum_period
+        self.rsi_period = rsi_period
+        self.volatility_window = volatility_window or window
+        self.resync_interval = resync_interval
+        # Ring long enough for the SMA window and the momentum lag
+        self.ring_size = max(window, momentum_period + 1)
+        self._rows = {}
+        self._lock = threading.Lock()
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity):
+        old = getattr(self, "_arrays", None)
+        arrays = {
+            "prices": np.zeros((capacity, self.ring_size)),
+            "volumes": np.zeros((capacity, self.window)),
+            "returns": np.zeros((capacity, self.volatility_window)),
+            "count": np.zeros(capacity, dtype=np.int64),
+            "last": np.full(capacity, np.nan),
+            "sum": np.zeros(capacity),
+            "sumsq": np.zeros(capacity),
+            "pv_sum": np.zeros(capacity),
+            "v_sum": np.zeros(capacity),
+            "ret_sumsq": np.zeros(capacity),
+            "ema": np.full(capacity, np.nan),
+            "avg_gain": np.zeros(capacity),
+            "avg_loss": np.zeros(capacity),
+        }
+        if old is not None:
+            used = len(old["count"])
+            for name, array in arrays.items():
+                array[:used] = old[name]
+        self._arrays = arrays
+        for name, array in arrays.items():
+            setattr(self, f"_{name}", array)
+
+    @property
+    def assets(self):
+        return list(self._rows)
+
+    def row_ids(self, assets):
+        """Row of each asset, registering new assets."""
+        rows = np.empty(len(assets), dtype=np.int64)
+        for i, asset in enumerate(assets):
+            row = self._rows.get(asset)
+            if row is None:
+                row = self._rows[asset] = len(self._rows)
+                if row >= len(self._count):
+                    self._allocate(2 * len(self._count))
+            rows[i] = row
+        return rows
+
+    def update_all(self, prices, volumes=None):
+        """Advance every registered asset, with `prices` ordered like `assets`."""
+        with self._lock:
+            self._update(np.arange(len(self._rows)), prices, volumes)
+
+    def update(self, assets, prices, volumes=None):
+        """
+        Advance the given assets by one tick.
+
+        :param assets: Sequence of distinct asset keys.
+        :param prices: Latest price per asset.
+        :param volumes: Optional traded volume per asset (VWAP weights; 1 when omitted).
+        """
+        with self._lock:
+            self._update(self.row_ids(assets), prices, volumes)
+
+    def _update(self, rows, prices, volumes):
+        prices = np.asarray(prices, dtype=np.float64).reshape(len(rows))
+        volumes = np.ones(len(rows)) if volumes is None else np.asarray(volumes, dtype=np.float64).reshape(len(rows))
+        count = self._count[rows]
+
+        # SMA / std: swap the price leaving the window for the new one
+        slot = count % self.ring_size
+        leaving_slot = (count - self.window) % self.ring_size
+        full = count >= self.window
+        leaving = np.where(full, self._prices[rows, leaving_slot], 0.0)
+        self._sum[rows] += prices - leaving
+        self._sumsq[rows] += prices * prices - leaving * leaving
+        self._prices[rows, slot] = prices
+
+        # VWAP
+        vslot = count % self.window
+        old_v = np.where(full, self._volumes[rows, vslot], 0.0)
+        old_p = np.where(full, leaving, 0.0)
+        self._pv_sum[rows] += prices * volumes - old_p * old_v
+        self._v_sum[rows] += volumes - old_v
+        self._volumes[rows, vslot] = volumes
+
+        # Returns-based indicators start with the second tick
+        last = self._last[rows]
+        has_last = count > 0
+        change = np.where(has_last, prices - last, 0.0)
+        log_return = np.where(has_last, np.log(prices / np.where(has_last, last, 1.0)), 0.0)
+        n_returns = count  # Including the one from this tick
+        rslot = (n_returns - 1) % self.volatility_window
+        old_r = np.where(n_returns > self.volatility_window, self._returns[rows, rslot], 0.0)
+        self._ret_sumsq[rows] += np.where(has_last, log_return * log_return - old_r * old_r, 0.0)
+        self._returns[rows[has_last], rslot[has_last]] = log_return[has_last]
+
+        # Wilder RSI: simple average of the first rsi_period changes, then exponential smoothing
+        gain, loss = np.maximum(change, 0.0), np.maximum(-change, 0.0)
+        seeding = has_last & (n_returns <= self.rsi_period)
+        smoothing = n_returns > self.rsi_period
+        n = self.rsi_period
+        avg_gain, avg_loss = self._avg_gain[rows], self._avg_loss[rows]
+        self._avg_gain[rows] = np.where(seeding, avg_gain + gain / n,
+                                        np.where(smoothing, (avg_gain * (n - 1) + gain) / n, avg_gain))
+        self._avg_loss[rows] = np.where(seeding, avg_loss + loss / n,
+                                        np.where(smoothing, (avg_loss * (n - 1) + loss) / n, avg_loss))
+
+        # EMA seeded with the first price
+        ema = self._ema[rows]
+        self._ema[rows] = np.where(np.isnan(ema), prices, ema + self.alpha * (prices - ema))
+
+        self._last[rows] = prices
+        self._count[rows] = count + 1
+        resync = rows[(count + 1) % self.resync_interval == 0]
+        if len(resync):
+            self._resync(resync)
+
+    def _resync(self, rows):
+        """Recompute the running sums of `rows` exactly from their ring buffers."""
+        count = self._count[rows]
+        # Positions of the last `window` prices in each price ring
+        positions = (count[:, None] - self.window + np.arange(self.window)) % self.ring_size
+        window_prices = self._prices[rows[:, None], positions]
+        self._sum[rows] = window_prices.sum(axis=1)
+        self._sumsq[rows] = (window_prices * window_prices).sum(axis=1)
+        vpositions = (count[:, None] - self.window + np.arange(self.window)) % self.window
+        self._pv_sum[rows] = (window_prices * self._volumes[rows[:, None], vpositions]).sum(axis=1)
+        self._v_sum[rows] = self._volumes[rows].sum(axis=1)
+        self._ret_sumsq[rows] = (self._returns[rows] ** 2).sum(axis=1)
+
+    def _compute(self, rows):
+        count = self._count[rows]
+        n = np.minimum(count, self.window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sma = np.where(count >= self.window, self._sum[rows] / self.window, np.nan)
+            var = (self._sumsq[rows] - self._sum[rows] ** 2 / self.window) / (self.window - 1)
+            std = np.where(count >= self.window, np.sqrt(np.maximum(var, 0.0)), np.nan)
+            price = self._last[rows]
+            zscore = (price - sma) / std
+            base = self._prices[rows, (count - 1 - self.momentum_period) % self.ring_size]
+            momentum = np.where(count > self.momentum_period, price - base, np.nan)
+            avg_gain, avg_loss = self._avg_gain[rows], self._avg_loss[rows]
+            rsi = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0),
+                           100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+            rsi = np.where(count - 1 >= self.rsi_period, rsi, np.nan)
+            vwap = np.where(n > 0, self._pv_sum[rows] / self._v_sum[rows], np.nan)
+            n_returns = np.minimum(count - 1, self.volatility_window)
+            realized = np.where(n_returns >= self.volatility_window,
+                                np.sqrt(np.maximum(self._ret_sumsq[rows], 0.0) / self.volatility_window), np.nan)
+        return {"price": price, "sma": sma, "ema": self._ema[rows].copy(), "std": std, "zscore": zscore,
+                "momentum": momentum, "rsi": rsi, "vwap": vwap, "realized_volatility": realized}
+
+    def snapshot(self, assets=None):
+        """
+        Current indicators as arrays aligned with `assets` (default: every registered asset).
+
+        :return: Dict of feature name -> float array.
+        """
+        with self._lock:
+            rows = np.arange(len(self._rows)) if assets is None else np.array(
+                [self._rows[asset] for asset in assets], dtype=np.int64)
+            return self._compute(rows)
+
+    def features(self, asset):
+        """Current indicators of one asset as a dict of floats."""
+        return {name: float(values[0]) for name, values in self.snapshot([asset]).items()}
+
+    def value(self, asset, feature):
+        """One indicator of one asset."""
+        if feature not in FEATURES:
+            raise KeyError(f"Unknown feature {feature!r}; expected one of {FEATURES}")
+        return float(self.snapshot([asset])[feature][0])
+
+    def reset(self, assets=None):
+        """Clear the history of `assets` (default: all)."""
+        with self._lock:
+            rows = np.arange(len(self._rows)) if assets is None else self.row_ids(assets)
+            for name, array in self._arrays.items():
+                array[rows] = np.nan if name in ("last", "ema") else 0
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_feature_engine():
+    """Return the process-wide FeatureEngine fed by the market data feeds."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FeatureEngine()
+        return _engine
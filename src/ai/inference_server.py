@@ -0,0 +1,267 @@
+# File: /src/ai/inference_server.py
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from src.ai.model_registry import get_model_registry
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def batch_predictor(model):
+    """
+    Return a callable mapping a list of observations to a list of outputs for `model`: its own batched
+    method when it has one (decide_actions / predict_batch), otherwise one decide_action call per item.
+    """
+    for method in ("decide_actions", "predict_batch"):
+        if callable(getattr(model, method, None)):
+            return getattr(model, method)
+    return lambda observations: [model.decide_action(observation) for observation in observations]
+
+
+class _LazyBatchPredictor:
+    """Builds the model from its factory on the first batch (on the worker thread), not at registration."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self._predict = None
+
+    def __call__(self, observations):
+        if self._predict is None:
+            self._predict = batch_predictor(self.factory())
+        return self._predict(observations)
+
+
+class _Request:
+    __slots__ = ("observation", "future", "enqueued_at")
+
+    def __init__(self, observation):
+        self.observation = observation
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class ModelMetrics:
+    """Rolling batch-size, queue-latency and inference-time statistics for one served model."""
+
+    def __init__(self, window=2048):
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.batch_sizes = deque(maxlen=window)
+        self.queue_latencies = deque(maxlen=window)
+        self.inference_times = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, batch_size, queue_latencies, inference_time, failed=False):
+        with self._lock:
+            self.requests += batch_size
+            self.batches += 1
+            self.errors += batch_size if failed else 0
+            self.batch_sizes.append(batch_size)
+            self.queue_latencies.extend(queue_latencies)
+            self.inference_times.append(inference_time)
+
+    def snapshot(self):
+        with self._lock:
+            sizes = np.array(self.batch_sizes, dtype=np.float64)
+            waits = np.array(self.queue_latencies, dtype=np.float64) * 1000
+            infer = np.array(self.inference_times, dtype=np.float64) * 1000
+            requests, batches, errors = self.requests, self.batches, self.errors
+        return {
+            "requests": requests,
+            "batches": batches,
+            "errors": errors,
+            "batch_size_mean": float(sizes.mean()) if len(sizes) else 0.0,
+            "batch_size_max": int(sizes.max()) if len(sizes) else 0,
+            "queue_latency_ms_mean": float(waits.mean()) if len(waits) else 0.0,
+            "queue_latency_ms_p99": float(np.percentile(waits, 99)) if len(waits) else 0.0,
+            "inference_ms_mean": float(infer.mean()) if len(infer) else 0.0,
+        }
+
+
+class _ModelWorker:
+    """Owns one model: collects requests into micro-batches and runs one forward pass per batch."""
+
+    def __init__(self, name, predict_batch, max_batch_size, max_latency):
+        self.name = name
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.metrics = ModelMetrics()
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=f"inference-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, observation):
+        request = _Request(observation)
+        self._queue.put(request)
+        return request.future
+
+    def stop(self, timeout=5.0):
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _collect(self, first):
+        batch = [first]
+        # The latency budget starts when the oldest request was submitted, not when the worker woke up
+        deadline = first.enqueued_at + self.max_latency
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)  # Finish this batch, then stop
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = self._collect(first)
+            started = time.perf_counter()
+            waits = [started - request.enqueued_at for request in batch]
+            try:
+                outputs = self.predict_batch([request.observation for request in batch])
+                if len(outputs) != len(batch):
+                    raise ValueError(f"Model {self.name} returned {len(outputs)} outputs for {len(batch)} inputs")
+            except Exception as e:
+                logger.error(f"Inference failed for model {self.name} (batch of {len(batch)}): {e}")
+                self.metrics.record(len(batch), waits, time.perf_counter() - started, failed=True)
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            self.metrics.record(len(batch), waits, time.perf_counter() - started)
+            for request, output in zip(batch, outputs):
+                request.future.set_result(output)
+
+
+class InferenceServer:
+    """
+    In-process inference service shared by all bots.
+
+    Each registered model is loaded once and served by its own worker thread. Callers submit single
+    observations; the worker groups whatever arrives within the latency budget (or until max_batch_size)
+    into one batch and runs a single forward pass for it. Per-model batch-size, queue-latency and
+    inference-time metrics are available from metrics().
+    """
+
+    def __init__(self, max_batch_size=None, max_latency_ms=None):
+        """
+        :param max_batch_size: Default largest batch (INFERENCE_MAX_BATCH, 64).
+        :param max_latency_ms: Default time the oldest request may wait for a batch to fill
+                               (INFERENCE_MAX_LATENCY_MS, 2 ms).
+        """
+        self.max_batch_size = max_batch_size or int(os.getenv("INFERENCE_MAX_BATCH", "64"))
+        self.max_latency = (max_latency_ms if max_latency_ms is not None
+                            else float(os.getenv("INFERENCE_MAX_LATENCY_MS", "2"))) / 1000
+        self._workers = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, model=None, factory=None, predict_batch=None, max_batch_size=None, max_latency_ms=None):
+        """
+        Serve a model under `name`. If the name is already registered the existing model is kept.
+
+        :param name: Model key used by clients.
+        :param model: Model object (see batch_predictor for the methods used).
+        :param factory: Zero-argument callable building the model, called when the first batch arrives.
+        :param predict_batch: Explicit callable(list of observations) -> list of outputs.
+        :param max_batch_size: Per-model override of the batch size cap.
+        :param max_latency_ms: Per-model override of the latency budget.
+        """
+        with self._lock:
+            if name in self._workers:
+                return
+            if predict_batch is None:
+                predict_batch = batch_predictor(model) if model is not None else _LazyBatchPredictor(factory)
+            latency = self.max_latency if max_latency_ms is None else max_latency_ms / 1000
+            self._workers[name] = _ModelWorker(name, predict_batch, max_batch_size or self.max_batch_size, latency)
+            logger.info(f"Serving model {name} (batch <= {max_batch_size or self.max_batch_size}, "
+                        f"latency budget {latency * 1000:.1f} ms)")
+
+    def _worker(self, name):
+        worker = self._workers.get(name)
+        if worker is None:
+            raise KeyError(f"No model registered as {name!r}")
+        return worker
+
+    def submit(self, name, observation):
+        """Queue one observation; returns a concurrent.futures.Future with the model output."""
+        return self._worker(name).submit(observation)
+
+    def predict(self, name, observation, timeout=None):
+        """Blocking single prediction (batched with concurrent callers)."""
+        return self.submit(name, observation).result(timeout)
+
+    async def apredict(self, name, observation):
+        """Awaitable single prediction, so many bots on one event loop share a batch."""
+        return await asyncio.wrap_future(self.submit(name, observation))
+
+    def metrics(self, name=None):
+        """Metrics for one model, or a dict of metrics for every model."""
+        if name is not None:
+            return self._worker(name).metrics.snapshot()
+        return {model: worker.metrics.snapshot() for model, worker in list(self._workers.items())}
+
+    def close(self):
+        """Stop every worker after it finishes its current batch."""
+        with self._lock:
+            workers, self._workers = list(self._workers.values()), {}
+        for worker in workers:
+            worker.stop()
+
+
+class InferenceClient:
+    """Drop-in stand-in for a model object in the bots: decide_action() goes through the shared server."""
+
+    def __init__(self, server, name):
+        self.server = server
+        self.name = name
+
+    def decide_action(self, observation, timeout=None):
+        return self.server.predict(self.name, observation, timeout)
+
+    async def adecide_action(self, observation):
+        return await self.server.apredict(self.name, observation)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def get_inference_server():
+    """Return the process-wide InferenceServer."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = InferenceServer()
+        return _server
+
+
+def get_inference_client(name, factory=None, **options):
+    """
+    Return a client for the shared model `name`. The factory goes into the model registry, so the model is
+    only constructed when the first request arrives (or when the registry warms it up), once per process.
+    Every bot asking for the same name shares one model instance and one batching queue.
+    """
+    registry = get_model_registry()
+    if factory is not None:
+        registry.register(name, factory)
+    server = get_inference_server()
+    server.register(name, factory=lambda: registry.get(name), **options)
+    return InferenceClient(server, name)
@@ -4,20 +4,28 @@ class MeanReversionStrategy:
     """
     Implements a simple mean reversion trading strategy.
     """
-    def __init__(self, trading_env):
+    def __init__(self, trading_env, feature_engine=None, asset=None):
         """
         Initialize the strategy with the given trading environment.
         :param trading_env: The environment that provides price and market data.
+        :param feature_engine: Optional FeatureEngine to read the price and moving average from.
+        :param asset: Asset key of this strategy in the feature engine.
         """
         self.trading_env = trading_env
+        self.feature_engine = feature_engine
+        self.asset = asset
 
     def get_signal(self):
         """
         Determine whether to buy or sell based on mean reversion.
         :return: 'buy', 'sell', or 'hold' based on the price compared to the moving average.
         """
-        current_price = self.trading_env.get_current_price()
-        moving_average = self.trading_env.get_moving_average()
+        if self.feature_engine is not None:
+            features = self.feature_engine.features(self.asset)
+            current_price, moving_average = features["price"], features["sma"]
+        else:
+            current_price = self.trading_env.get_current_price()
+            moving_average = self.trading_env.get_moving_average()
 
         if current_price < moving_average:
             return "buy"
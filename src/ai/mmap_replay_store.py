@@ -0,0 +1,205 @@
+# File: /src/ai/mmap_replay_store.py
+
+import fcntl
+import logging
+import os
+import threading
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RPLSTOR1"
+HEADER_SIZE = 4096  # Records start on a page boundary
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("state_dim", "<u4"),
+    ("action_dim", "<u4"),
+    ("action_kind", "<u4"),  # 0 = int64 actions, 1 = float32 actions
+    ("capacity", "<u8"),
+    ("record_size", "<u8"),
+    ("cursor", "<u8"),  # Total records ever reserved; slot = sequence % capacity
+])
+
+
+def record_dtype(state_dim, action_dim=1, discrete_actions=True):
+    """
+    Fixed on-disk layout of one transition. `seq` is written last by the writer and acts as the commit
+    flag: 0 while the slot is being (re)written, otherwise the record's sequence number + 1.
+    """
+    action_type = "<i8" if discrete_actions else "<f4"
+    action_field = ("action", action_type) if action_dim == 1 else ("action", action_type, (action_dim,))
+    return np.dtype([
+        ("seq", "<u8"),
+        ("state", "<f4", (state_dim,)),
+        action_field,
+        ("reward", "<f4"),
+        ("next_state", "<f4", (state_dim,)),
+        ("done", "u1"),
+    ], align=True)
+
+
+class MemmapReplayStore:
+    """
+    File-backed replay store shared by several processes (e.g. the rl_agent_manager replicas).
+
+    The file is a 4 KiB header followed by `capacity` fixed-size records, mapped with np.memmap, so the OS
+    page cache holds the hot part and the store can be far larger than RAM. Writers reserve slots by
+    advancing the header cursor under an exclusive fcntl lock (the only locked step), then fill the records
+    and set each record's commit flag. Readers never lock: sample() draws slots from the committed range,
+    gathers the fields straight from the mapped pages and drops any record whose commit flag changed while
+    it was being read (seqlock). The store keeps its contents and cursor across restarts.
+
+    Exposes the same push/sample/__len__ API as ExperienceReplayBuffer.
+    """
+
+    def __init__(self, path, capacity=None, state_dim=None, action_dim=1, discrete_actions=True, seed=None):
+        """
+        Open the store at `path`, creating it when it does not exist.
+
+        :param path: Data file; its directory is created if needed.
+        :param capacity: Number of record slots (required when creating; checked when reopening).
+        :param state_dim: Length of the flat float32 state vector (required when creating).
+        :param action_dim: Action vector length (1 stores a scalar action).
+        :param discrete_actions: Store actions as int64 (True) or float32 (False).
+        :param seed: Optional seed for the sampling generator.
+        """
+        self.path = path
+        self.rng = np.random.default_rng(seed)
+        self._thread_lock = threading.Lock()
+        if not os.path.exists(path):
+            if capacity is None or state_dim is None:
+                raise ValueError(f"Replay store {path} does not exist; capacity and state_dim are required to create it")
+            self._create(capacity, state_dim, action_dim, discrete_actions)
+
+        self._lock_file = open(path, "r+b")
+        self.header = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", offset=0, shape=(1,))
+        meta = self.header[0]
+        if meta["magic"] != MAGIC:
+            raise ValueError(f"{path} is not a replay store file")
+        self.capacity = int(meta["capacity"])
+        self.state_dim = int(meta["state_dim"])
+        self.action_dim = int(meta["action_dim"])
+        self.discrete_actions = int(meta["action_kind"]) == 0
+        for name, expected, actual in (("capacity", capacity, self.capacity), ("state_dim", state_dim, self.state_dim)):
+            if expected is not None and expected != actual:
+                raise ValueError(f"Replay store {path} has {name}={actual}, requested {expected}")
+
+        self.dtype = record_dtype(self.state_dim, self.action_dim, self.discrete_actions)
+        if int(meta["record_size"]) != self.dtype.itemsize:
+            raise ValueError(f"Replay store {path} record layout does not match this version")
+        self.records = np.memmap(path, dtype=self.dtype, mode="r+", offset=HEADER_SIZE, shape=(self.capacity,))
+
+    def _create(self, capacity, state_dim, action_dim, discrete_actions):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        dtype = record_dtype(state_dim, action_dim, discrete_actions)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            header = np.zeros(1, dtype=HEADER_DTYPE)
+            header[0] = (MAGIC, 1, state_dim, action_dim, 0 if discrete_actions else 1, capacity, dtype.itemsize, 0)
+            f.write(header.tobytes().ljust(HEADER_SIZE, b"\0"))
+            # Sparse file: pages are only allocated once written
+            f.truncate(HEADER_SIZE + capacity * dtype.itemsize)
+        try:
+            # Atomic publish; if another process created the store first, use theirs
+            os.link(tmp_path, self.path)
+            logger.info(f"Created replay store {self.path} ({capacity} x {dtype.itemsize} bytes)")
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp_path)
+
+    # --- Writers ---
+    def reserve(self, count):
+        """
+        Atomically claim `count` consecutive sequence numbers across all processes.
+
+        :return: First reserved sequence number.
+        """
+        with self._thread_lock:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                start = int(self.header[0]["cursor"])
+                self.header[0]["cursor"] = start + count
+            finally:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+        return start
+
+    def push(self, state, action, reward, next_state, done):
+        """Append one transition."""
+        self.push_batch([state], [action], [reward], [next_state], [done])
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        """Append many transitions with one cursor reservation."""
+        states = np.asarray(states, dtype=np.float32).reshape(-1, self.state_dim)
+        count = len(states)
+        if count == 0:
+            return
+        if count > self.capacity:
+            raise ValueError(f"Batch of {count} exceeds store capacity {self.capacity}")
+        seqs = self.reserve(count) + np.arange(count, dtype=np.uint64)
+        slots = (seqs % self.capacity).astype(np.int64)
+        records = self.records
+        # Invalidate first so readers never accept a half-written slot, then fill, then commit
+        records["seq"][slots] = 0
+        records["state"][slots] = states
+        records["action"][slots] = np.asarray(actions).reshape((count,) + records.dtype["action"].shape)
+        records["reward"][slots] = rewards
+        records["next_state"][slots] = np.asarray(next_states, dtype=np.float32).reshape(-1, self.state_dim)
+        records["done"][slots] = dones
+        records["seq"][slots] = seqs + 1
+
+    # --- Readers ---
+    @property
+    def cursor(self):
+        return int(self.header[0]["cursor"])
+
+    def __len__(self):
+        """Number of slots holding data (committed or in flight)."""
+        return min(self.cursor, self.capacity)
+
+    def _valid(self, seqs, cursor):
+        low = max(0, cursor - self.capacity)
+        return (seqs > low) & (seqs <= cursor)
+
+    def sample(self, batch_size, max_attempts=3):
+        """
+        Sample committed transitions uniformly.
+
+        :return: Tuple of arrays (states, actions, rewards, next_states, dones). Slots still being written
+                 are skipped, so the batch can be slightly smaller than batch_size under heavy writing.
+        """
+        size = len(self)
+        if size == 0:
+            raise ValueError("Cannot sample from an empty replay store")
+        records = self.records
+        for _ in range(max_attempts):
+            cursor = self.cursor
+            slots = self.rng.integers(0, min(cursor, self.capacity), size=batch_size)
+            before = records["seq"][slots]
+            batch = records[slots]  # One gather from the mapped pages into the batch
+            after = records["seq"][slots]
+            keep = self._valid(before, cursor) & (after == before)
+            if keep.any():
+                batch = batch[keep]
+                return batch["state"], batch["action"], batch["reward"], batch["next_state"], batch["done"].astype(bool)
+        raise RuntimeError("No committed transitions could be read from the replay store")
+
+    def window(self, start, count):
+        """
+        Zero-copy structured view of `count` slots starting at slot `start` (no wrap-around), for trainers
+        that stream the store sequentially. Check the `seq` field before trusting a row.
+        """
+        return self.records[start:start + count]
+
+    def flush(self):
+        """Write dirty pages back to the file."""
+        self.records.flush()
+        self.header.flush()
+
+    def close(self):
+        """Flush and unmap the store."""
+        self.flush()
+        self._lock_file.close()
+        del self.records, self.header
@@ -0,0 +1,240 @@
+# File: /src/ai/model_registry.py
+
+import importlib
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss():
+    """Resident set size of this process in bytes (peak RSS where /proc is not available)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        import sys
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def model_factory(target, *args, **kwargs):
+    """
+    Build a zero-argument factory that imports and constructs a model only when called.
+
+    :param target: Class or callable, or an import path "package.module:Name" so that the module (and
+                   heavy frameworks it imports, e.g. TensorFlow or torch) is only imported on first use.
+    :param args: Positional arguments for the constructor.
+    :param kwargs: Keyword arguments for the constructor.
+    """
+    def factory():
+        constructor = target
+        if isinstance(target, str):
+            module_name, _, attribute = target.partition(":")
+            constructor = getattr(importlib.import_module(module_name), attribute)
+        return constructor(*args, **kwargs)
+
+    factory.target = target
+    factory.args = args
+    factory.kwargs = kwargs
+    return factory
+
+
+def _factory_spec(factory):
+    """What a factory builds: (target, args, kwargs) for model_factory factories, else the callable itself."""
+    if hasattr(factory, "target"):
+        return factory.target, getattr(factory, "args", ()), getattr(factory, "kwargs", {})
+    return factory
+
+
+class _Entry:
+    __slots__ = ("factory", "instance", "lock", "load_seconds", "rss_delta", "error", "loaded_at")
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.instance = None
+        self.lock = threading.Lock()
+        self.load_seconds = None
+        self.rss_delta = None
+        self.error = None
+        self.loaded_at = None
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of lazily constructed models.
+
+    Bots register a factory per model name at import time (cheap) and the model is built or loaded the
+    first time it is actually used, once per process; later registrations of the same name share the
+    first instance. warm_up() builds models ahead of time on a background thread, and stats() reports
+    each model's load time and the resident-memory growth measured around its construction.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, factory):
+        """
+        Register a factory for `name` (no-op if the name is already registered; the first factory wins).
+        Re-registering a name with a factory building something else logs a warning, since the caller
+        will silently get the first model instead.
+
+        :param factory: Zero-argument callable, or an import path "module:Name" constructed without arguments.
+        """
+        if isinstance(factory, str):
+            factory = model_factory(factory)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                self._entries[name] = _Entry(factory)
+                return
+        if _factory_spec(entry.factory) != _factory_spec(factory):
+            logger.warning(f"Model {name} is already registered with {_factory_spec(entry.factory)!r}; "
+                           f"ignoring {_factory_spec(factory)!r}")
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def is_loaded(self, name):
+        entry = self._entries.get(name)
+        return entry is not None and entry.instance is not None
+
+    def get(self, name):
+        """Return the shared instance of `name`, constructing it on first use."""
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"No model registered as {name!r}")
+        if entry.instance is not None:
+            return entry.instance
+        with entry.lock:
+            if entry.instance is None:
+                rss_before = current_rss()
+                started = time.perf_counter()
+                try:
+                    instance = entry.factory()
+                except Exception as e:
+                    entry.error = f"{type(e).__name__}: {e}"
+                    logger.error(f"Failed to load model {name}: {e}")
+                    raise
+                entry.load_seconds = time.perf_counter() - started
+                entry.rss_delta = current_rss() - rss_before
+                entry.loaded_at = time.time()
+                entry.error = None
+                entry.instance = instance
+                logger.info(f"Loaded model {name} in {entry.load_seconds:.2f}s "
+                            f"(+{entry.rss_delta / 2 ** 20:.1f} MiB RSS)")
+        return entry.instance
+
+    def lazy(self, name, factory=None):
+        """
+        Register `factory` (if given) and return a LazyModel proxy that loads the model on first use,
+        suitable as a module-level global in place of an eagerly built model.
+        """
+        if factory is not None:
+            self.register(name, factory)
+        return LazyModel(self, name)
+
+    def warm_up(self, names=None, background=True):
+        """
+        Construct models ahead of their first use.
+
+        :param names: Model names to load (default: every registered model).
+        :param background: Load on a daemon thread and return it; False loads before returning.
+        :return: The warm-up thread, or None when loading in the foreground.
+        """
+        names = list(self._entries) if names is None else list(names)
+
+        def load_all():
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception:
+                    pass  # Recorded in stats(); the next get() retries
+
+        if not background:
+            load_all()
+            return None
+        thread = threading.Thread(target=load_all, name="model-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def errors(self):
+        """Load errors of the models whose last construction failed, by name."""
+        return {name: entry.error for name, entry in list(self._entries.items()) if entry.error is not None}
+
+    def unload(self, name):
+        """Drop the shared instance so the next get() constructs it again (e.g. after retraining)."""
+        entry = self._entries.get(name)
+        if entry is not None:
+            with entry.lock:
+                entry.instance = None
+
+    def stats(self):
+        """Per-model load state, load time and RSS growth, plus the current process RSS."""
+        models = {
+            name: {
+                "loaded": entry.instance is not None,
+                "load_seconds": entry.load_seconds,
+                "rss_delta_bytes": entry.rss_delta,
+                "error": entry.error,
+            }
+            for name, entry in list(self._entries.items())
+        }
+        return {"process_rss_bytes": current_rss(), "models": models}
+
+
+class LazyModel:
+    """Stand-in for a registered model: attribute access loads the shared instance and delegates to it."""
+
+    __slots__ = ("_registry", "_name")
+
+    def __init__(self, registry, name):
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_name", name)
+
+    @property
+    def instance(self):
+        return self._registry.get(self._name)
+
+    def __getattr__(self, attribute):
+        return getattr(self._registry.get(self._name), attribute)
+
+    def __setattr__(self, attribute, value):
+        setattr(self._registry.get(self._name), attribute, value)
+
+    def __call__(self, *args, **kwargs):
+        return self._registry.get(self._name)(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self._registry.is_loaded(self._name) else "not loaded"
+        return f"<LazyModel {self._name} ({state})>"
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry():
+    """Return the process-wide ModelRegistry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
+
+
+def lazy_model(name, target, *args, **kwargs):
+    """
+    Shared, lazily constructed model for module-level use in the bots:
+
+        lstm_model = lazy_model("lstm_model", "src.ai.models.lstm_model:LSTMModel")
+
+    :param name: Registry name shared by every bot in the process.
+    :param target: Class/callable or "module:Name" import path (see model_factory).
+    """
+    return get_model_registry().lazy(name, model_factory(target, *args, **kwargs))
@@ -1,7 +1,15 @@
 # File: /src/ai/models/arima_model.py
 
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
 from statsmodels.tsa.arima.model import ARIMA
 
+logger = logging.getLogger(__name__)
+
 class ARIMAModel:
     """
     ARIMA Model used for time-series prediction in the trading bot.
@@ -44,3 +52,190 @@ class ARIMAModel:
         
         # Predict future steps based on the trained model
         return self.model_fit.forecast(steps=steps)
+
+    def update(self, new_data):
+        """
+        Incorporate new observations without refitting: the fitted parameters are kept and the state-space
+        (Kalman filter) state is advanced over the new data only, so the cost does not grow with history.
+
+        :param new_data: New observations following the data the model was trained/updated on.
+        :return: Updated fitted model
+        """
+        if not self.model_fit:
+            raise ValueError("The model must be trained before it can be updated.")
+        self.model_fit = self.model_fit.extend(np.asarray(new_data, dtype=np.float64))
+        return self.model_fit
+
+    def standardized_errors(self):
+        """One-step-ahead forecast errors of the last train/update, divided by their predicted std."""
+        if not self.model_fit:
+            raise ValueError("The model must be trained first.")
+        return np.asarray(self.model_fit.filter_results.standardized_forecasts_error[0])
+
+
+class _AssetARIMA:
+    __slots__ = ("model", "history", "observed", "fitting", "since_fit", "drift_score", "last_used")
+
+    def __init__(self, history_size):
+        self.model = None
+        self.history = deque(maxlen=history_size)
+        self.observed = 0
+        self.fitting = False
+        self.since_fit = 0
+        self.drift_score = 1.0
+        self.last_used = time.monotonic()
+
+
+class ARIMAModelCache:
+    """
+    Per-asset cache of fitted ARIMA models for live forecasting.
+
+    New observations are folded into each asset's fitted model with ARIMAModel.update() (a Kalman filter
+    step with the fitted parameters), so forecasts stay in the millisecond range. The parameters are
+    re-estimated on the last `history_size` observations only when `refit_interval` observations have
+    arrived since the last fit, or when the model drifts: an exponentially weighted mean of the squared
+    standardized one-step errors (about 1 for a well-specified model) exceeds `drift_threshold`.
+    The least recently used assets are evicted beyond `max_assets`, as are assets idle for `idle_timeout`.
+    Fits run outside the cache-wide lock, at most one per asset at a time; observations arriving meanwhile
+    keep updating the old model and are folded into the new one when it is swapped in.
+    """
+
+    def __init__(self, order=(5, 1, 0), max_assets=256, history_size=500, min_observations=50,
+                 refit_interval=500, drift_threshold=4.0, drift_alpha=0.05, drift_cooldown=25, idle_timeout=None):
+        """
+        :param order: ARIMA (p, d, q) order used for every asset.
+        :param max_assets: Number of assets kept before evicting the least recently used one.
+        :param history_size: Observations kept per asset for refits.
+        :param min_observations: Observations needed before the first fit.
+        :param refit_interval: Full refit after this many new observations (None disables).
+        :param drift_threshold: Refit when the EWMA of squared standardized errors exceeds this (None disables).
+        :param drift_alpha: EWMA weight of each new standardized error.
+        :param drift_cooldown: Minimum observations between a fit and a drift-triggered refit.
+        :param idle_timeout: Seconds after which an unused asset is evicted (None keeps it until LRU eviction).
+        """
+        self.order = order
+        self.max_assets = max_assets
+        self.history_size = history_size
+        self.min_observations = max(min_observations, sum(order) + 2)
+        self.refit_interval = refit_interval
+        self.drift_threshold = drift_threshold
+        self.drift_alpha = drift_alpha
+        self.drift_cooldown = drift_cooldown
+        self.idle_timeout = idle_timeout
+        self._assets = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {"fits": 0, "scheduled_refits": 0, "drift_refits": 0, "updates": 0, "evictions": 0}
+
+    def __contains__(self, asset):
+        return asset in self._assets
+
+    def __len__(self):
+        return len(self._assets)
+
+    def _entry(self, asset):
+        entry = self._assets.get(asset)
+        if entry is None:
+            entry = self._assets[asset] = _AssetARIMA(self.history_size)
+            self._evict()
+        else:
+            self._assets.move_to_end(asset)
+        entry.last_used = time.monotonic()
+        return entry
+
+    def _evict(self):
+        if self.idle_timeout is not None:
+            cutoff = time.monotonic() - self.idle_timeout
+            for asset in [a for a, e in self._assets.items() if e.last_used < cutoff]:
+                del self._assets[asset]
+                self.stats["evictions"] += 1
+        while len(self._assets) > self.max_assets:
+            asset, _ = self._assets.popitem(last=False)
+            self.stats["evictions"] += 1
+            logger.debug(f"Evicted ARIMA model for {asset}")
+
+    def _fit(self, asset, entry, reason, history, observed):
+        """Fit on a history snapshot without holding the cache lock, then swap the model in under it."""
+        try:
+            model = ARIMAModel(order=self.order)
+            model.train(history)
+        except Exception:
+            with self._lock:
+                entry.fitting = False
+            raise
+        with self._lock:
+            pending = min(entry.observed - observed, len(entry.history))
+            if pending:
+                model.update(list(entry.history)[-pending:])
+            entry.model = model
+            entry.fitting = False
+            entry.since_fit = pending
+            entry.drift_score = 1.0
+            self.stats["fits"] += 1
+            if reason:
+                self.stats[f"{reason}_refits"] += 1
+                logger.info(f"Refitted ARIMA model for {asset} ({reason} refit)")
+
+    def update(self, asset, observations):
+        """
+        Add new observations (a scalar or a sequence) for an asset, updating or refitting its model.
+
+        :return: True if the asset has a fitted model afterwards.
+        """
+        new = np.atleast_1d(np.asarray(observations, dtype=np.float64))
+        with self._lock:
+            entry = self._entry(asset)
+            entry.history.extend(new)
+            entry.observed += len(new)
+            if entry.model is None:
+                if entry.fitting or len(entry.history) < self.min_observations:
+                    return False
+                reason = None
+            else:
+                if not len(new):
+                    return True
+                entry.model.update(new)
+                entry.since_fit += len(new)
+                self.stats["updates"] += 1
+                for error in entry.model.standardized_errors():
+                    if np.isfinite(error):
+                        entry.drift_score += self.drift_alpha * (error * error - entry.drift_score)
+
+                if entry.fitting:
+                    return True
+                if self.refit_interval is not None and entry.since_fit >= self.refit_interval:
+                    reason = "scheduled"
+                elif (self.drift_threshold is not None and entry.drift_score > self.drift_threshold
+                      and entry.since_fit >= self.drift_cooldown):
+                    reason = "drift"
+                else:
+                    return True
+            entry.fitting = True
+            history = np.fromiter(entry.history, dtype=np.float64, count=len(entry.history))
+            observed = entry.observed
+
+        self._fit(asset, entry, reason, history, observed)
+        return True
+
+    def forecast(self, asset, steps=5):
+        """
+        Forecast the next `steps` values for an asset from its cached model.
+
+        :return: Array of forecasts, or None if the asset has no fitted model yet.
+        """
+        with self._lock:
+            entry = self._assets.get(asset)
+            if entry is None or entry.model is None:
+                return None
+            self._assets.move_to_end(asset)
+            entry.last_used = time.monotonic()
+            return np.asarray(entry.model.predict(steps))
+
+    def update_and_forecast(self, observations, steps=5):
+        """
+        Update several assets and forecast each of them.
+
+        :param observations: Mapping of asset -> new observation(s).
+        :return: Mapping of asset -> forecast array (None while an asset is still collecting history).
+        """
+        return {asset: self.forecast(asset, steps) if self.update(asset, values) else None
+                for asset, values in observations.items()}
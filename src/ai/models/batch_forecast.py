@@ -0,0 +1,170 @@
+# File: /src/ai/models/batch_forecast.py
+
+import logging
+import math
+import multiprocessing
+import os
+import time
+import warnings
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def arima_forecast(series, steps, order=(5, 1, 0)):
+    """Fit an ARIMA model on one series and forecast `steps` values (the default batch model)."""
+    from statsmodels.tsa.arima.model import ARIMA
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # Convergence warnings for hundreds of series would flood the logs
+        return ARIMA(series, order=order).fit().forecast(steps=steps)
+
+
+def _forecast_chunk(input_name, output_name, total_length, num_series, steps, indices, offsets, lengths, model_fn):
+    """Worker: forecast the series at `indices`, writing each result straight into its row of the output."""
+    # Pool workers share the parent's resource tracker, so attaching here does not take over the unlink
+    source, target = shared_memory.SharedMemory(name=input_name), shared_memory.SharedMemory(name=output_name)
+    try:
+        data = np.ndarray((total_length,), dtype=np.float64, buffer=source.buf)
+        out = np.ndarray((num_series, steps), dtype=np.float64, buffer=target.buf)
+        errors = {}
+        for index, offset, length in zip(indices, offsets, lengths):
+            try:
+                out[index] = np.asarray(model_fn(data[offset:offset + length].copy(), steps), dtype=np.float64)
+            except Exception as e:
+                errors[int(index)] = f"{type(e).__name__}: {e}"
+        del data, out
+        return errors
+    finally:
+        source.close()
+        target.close()
+
+
+class BatchForecaster:
+    """
+    Forecasts many series at once on a persistent process pool.
+
+    All series are packed into one shared-memory block and every worker writes its forecasts into a
+    shared (num_series, steps) output block, so only chunk offsets and error messages are pickled. Series
+    are sent in chunks, and chunks that have not finished `task_timeout` seconds after forecast() submitted
+    them are reported as timed out (their rows stay NaN) and the pool is restarted so a hung fit cannot
+    block the next cycle.
+    """
+
+    def __init__(self, model_fn=None, max_workers=None, chunk_size=None, task_timeout=120.0, start_method=None):
+        """
+        :param model_fn: Picklable callable(series, steps) -> forecasts (default: ARIMA(5, 1, 0) fit + forecast).
+        :param max_workers: Worker processes (default: CPU count).
+        :param chunk_size: Series per task (default: about four tasks per worker).
+        :param task_timeout: Seconds forecast() waits for all of its chunks (one deadline, not per chunk).
+        :param start_method: multiprocessing start method for the pool.
+        """
+        self.model_fn = model_fn or arima_forecast
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.task_timeout = task_timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = self._context.Pool(self.max_workers)
+        return self._pool
+
+    def _restart_pool(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def forecast(self, series_by_asset, steps=5):
+        """
+        Forecast every series.
+
+        :param series_by_asset: Mapping of asset -> 1D series.
+        :param steps: Forecast horizon.
+        :return: (assets, forecasts, errors): the asset keys in order, a float array (len(assets), steps)
+                 aligned with them (NaN rows for failed or timed-out series), and a dict asset -> error.
+        """
+        assets = list(series_by_asset)
+        if not assets:
+            return assets, np.empty((0, steps)), {}
+        series = [np.asarray(series_by_asset[asset], dtype=np.float64).ravel() for asset in assets]
+        lengths = np.array([len(s) for s in series], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        total = int(lengths.sum())
+
+        source = shared_memory.SharedMemory(create=True, size=max(1, total * 8))
+        target = shared_memory.SharedMemory(create=True, size=len(assets) * steps * 8)
+        try:
+            data = np.ndarray((total,), dtype=np.float64, buffer=source.buf)
+            np.concatenate(series, out=data)
+            out = np.ndarray((len(assets), steps), dtype=np.float64, buffer=target.buf)
+            out.fill(np.nan)
+
+            started = time.perf_counter()
+            chunk_size = self.chunk_size or max(1, math.ceil(len(assets) / (self.max_workers * 4)))
+            pool = self._get_pool()
+            tasks = []
+            for start in range(0, len(assets), chunk_size):
+                indices = np.arange(start, min(start + chunk_size, len(assets)))
+                task = pool.apply_async(_forecast_chunk, (source.name, target.name, total, len(assets), steps, indices,
+                                                          offsets[indices], lengths[indices], self.model_fn))
+                tasks.append((indices, task))
+
+            errors = {}
+            timed_out = False
+            deadline = time.monotonic() + self.task_timeout
+            for indices, task in tasks:
+                try:
+                    for index, message in task.get(max(0.0, deadline - time.monotonic())).items():
+                        errors[assets[index]] = message
+                except multiprocessing.TimeoutError:
+                    timed_out = True
+                    for index in indices:
+                        errors[assets[index]] = f"Timed out after {self.task_timeout}s"
+                except Exception as e:
+                    for index in indices:
+                        errors[assets[index]] = f"{type(e).__name__}: {e}"
+            if timed_out:
+                # Hung workers would keep their slots (and the shared blocks) busy; start over next cycle
+                self._restart_pool()
+            result = out.copy()
+            # A timed-out chunk may still be writing rows; report all of them as missing
+            position = {asset: i for i, asset in enumerate(assets)}
+            result[[position[asset] for asset in errors]] = np.nan
+            del data, out
+        finally:
+            source.close()
+            source.unlink()
+            target.close()
+            target.unlink()
+
+        logger.info(f"Forecast {len(assets) - len(errors)}/{len(assets)} series in "
+                    f"{time.perf_counter() - started:.2f}s ({len(tasks)} tasks, {self.max_workers} workers)")
+        return assets, result, errors
+
+    def close(self):
+        """Shut the worker pool down."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def forecast_batch(series_by_asset, steps=5, order=(5, 1, 0), **options):
+    """
+    One-off batch ARIMA forecast of many series (see BatchForecaster; keep a BatchForecaster around to
+    reuse its pool across cycles).
+    """
+    with BatchForecaster(partial(arima_forecast, order=order), **options) as forecaster:
+        return forecaster.forecast(series_by_asset, steps)
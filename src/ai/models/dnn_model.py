@@ -3,6 +3,8 @@ from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import Dense
 import logging
 from src.ai.ai_helpers import PredictionHelper
+from src.ai.numpy_runtime import export_keras_model
+from src.ai.online_learner import OnlineLearner
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -13,15 +15,20 @@ class DNNModel:
     Trained on historical price data to make market predictions.
     """
 
-    def __init__(self, input_shape, epochs=10, batch_size=32):
+    def __init__(self, input_shape, epochs=10, batch_size=32, online_batch_size=32, online_max_delay=5.0):
         """
         Initialize the DNN model with specified input shape, epochs, and batch size.
+        online_batch_size and online_max_delay control the mini-batches of real-time updates
+        (see src.ai.online_learner.OnlineLearner).
         """
         self.input_shape = input_shape
         self.epochs = epochs
         self.batch_size = batch_size
+        self.online_batch_size = online_batch_size
+        self.online_max_delay = online_max_delay
         self.model = self._build_model()
         self.prediction_helper = PredictionHelper()
+        self.online_learner = None  # Created on the first real-time update
 
     def _build_model(self):
         """
@@ -41,14 +48,22 @@ class DNNModel:
         Train the DNN model using historical data.
         """
         logger.info("Training DNN model...")
-        self.model.fit(X_train, y_train, epochs=self.epochs, batch_size=self.batch_size)
+        fit = lambda model: model.fit(X_train, y_train, epochs=self.epochs, batch_size=self.batch_size)
+        if self.online_learner is not None:
+            self.online_learner.train(fit)  # Serialized with the background updates, then published
+        else:
+            fit(self.model)
         logger.info("DNN model training completed.")
 
     def predict(self, X):
         """
         Make price predictions based on input features.
         """
-        predictions = self.model.predict(X)
+        # With online learning enabled, predict with the last published weights; never waits for training
+        if self.online_learner is not None:
+            predictions = self.online_learner.predict(X)
+        else:
+            predictions = self.model.predict(X)
         refined_predictions = self.prediction_helper.refine_predictions(predictions)
         logger.info(f"DNN model predictions made: {refined_predictions}")
         return refined_predictions
@@ -56,6 +71,20 @@ class DNNModel:
     def update_with_real_time_data(self, real_time_data, y_real_time):
         """
         Update the model with real-time data to improve predictions continuously.
+
+        The samples are queued and trained on in mini-batches by a background worker; predict() switches
+        to the new weights once a mini-batch has been trained, so this call returns immediately.
+        """
+        if self.online_learner is None:
+            self.online_learner = OnlineLearner(self.model, batch_size=self.online_batch_size,
+                                                max_delay=self.online_max_delay)
+        self.online_learner.add_samples(real_time_data, y_real_time)
+        logger.debug(f"Queued {len(real_time_data)} real-time samples for the DNN model.")
+
+    def export_numpy(self, path):
+        """
+        Export the trained weights for src.ai.numpy_runtime.NumpyModel, which runs the same forward pass
+        in pure NumPy without importing TensorFlow.
         """
-        self.model.fit(real_time_data, y_real_time, epochs=1, verbose=0)
-        logger.info("DNN model updated with real-time data.")
+        export_keras_model(self.model, path)
+        logger.info(f"DNN model exported for NumPy inference to {path}")
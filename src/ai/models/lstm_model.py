@@ -6,6 +6,7 @@ from keras.models import Sequential
 from keras.layers import LSTM, Dense
 import logging
 from src.ai.ai_helpers import PredictionHelper  # AI Helper for enhancing prediction accuracy
+from src.ai.numpy_runtime import NumpyModel, StreamingLSTM, export_keras_model, keras_layers
 from centralized_logger import CentralizedLogger
 
 # Initialize logger and centralized logging
@@ -62,6 +63,16 @@ class LSTMModel:
         logger.info(f"LSTM model predictions made: {refined_predictions}")
         return refined_predictions
 
+    def streaming_predictor(self, resync_interval=None):
+        """
+        Returns a StreamingLSTM over the current weights for tick-by-tick predictions across many assets.
+        Instead of re-running the whole input window per prediction, it keeps each asset's hidden/cell
+        state and advances it by one timestep per new bar, rebuilding it from the stored window every
+        `resync_interval` bars (default: the window length). Call again after retraining.
+        """
+        runtime = NumpyModel(keras_layers(self.model), {"framework": "keras"})
+        return StreamingLSTM(runtime, window=self.input_shape[0], resync_interval=resync_interval)
+
     def save_model(self, path):
         """
         Saves the trained LSTM model to a file.
@@ -69,6 +80,14 @@ class LSTMModel:
         self.model.save(path)
         logger.info(f"LSTM model saved to {path}")
 
+    def export_numpy(self, path):
+        """
+        Exports the trained weights for src.ai.numpy_runtime.NumpyModel, so live predictions can run in
+        pure NumPy without importing Keras/TensorFlow.
+        """
+        export_keras_model(self.model, path)
+        logger.info(f"LSTM model exported for NumPy inference to {path}")
+
     def load_model(self, path):
         """
         Loads a pre-trained LSTM model from a file.
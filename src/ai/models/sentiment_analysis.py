@@ -1,16 +1,103 @@
 # /src/ai/models/sentiment_analysis.py
 
-from transformers import pipeline
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+from src.ai.inference_server import InferenceServer
+
+
+class SentimentCache:
+    """
+    Thread-safe LRU cache of sentiment scores keyed by content hash, with a time-to-live per entry.
+    """
+
+    def __init__(self, max_size=10000, ttl=300.0, clock=time.monotonic):
+        """
+        :param max_size: Maximum number of cached scores (least recently used are evicted first).
+        :param ttl: Seconds a score stays valid (None never expires).
+        :param clock: Time source, injectable for tests.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, score = entry
+                if expires is None or expires > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return score
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, score):
+        with self._lock:
+            self._entries[key] = (None if self.ttl is None else self.clock() + self.ttl, score)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+def text_key(text):
+    """Content hash used to deduplicate and cache texts."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
 
 class SentimentAnalysis:
     """
     Sentiment Analysis model for analyzing market sentiment from news and social media.
     Uses a pre-trained model from the Hugging Face 'transformers' library.
+
+    score_texts() scores many texts at once: texts are deduplicated by content hash, repeats are served
+    from an LRU/TTL cache (and texts already being scored by another caller are awaited, not resubmitted),
+    and the remaining ones run through the pipeline in batches of up to `batch_size` on a worker thread.
     """
 
-    def __init__(self):
-        # Initialize the sentiment analysis pipeline
-        self.sentiment_pipeline = pipeline('sentiment-analysis')
+    def __init__(self, sentiment_pipeline=None, batch_size=32, cache_size=10000, cache_ttl=300.0,
+                 max_latency_ms=5.0):
+        """
+        :param sentiment_pipeline: Callable(list of texts) -> list of {'label', 'score'} dicts
+                                   (default: transformers' 'sentiment-analysis' pipeline).
+        :param batch_size: Texts per pipeline call.
+        :param cache_size: Number of cached scores.
+        :param cache_ttl: Seconds a cached score stays valid.
+        :param max_latency_ms: How long the worker waits for a batch to fill before running it.
+        """
+        if sentiment_pipeline is None:
+            from transformers import pipeline
+
+            # Initialize the sentiment analysis pipeline
+            sentiment_pipeline = pipeline('sentiment-analysis', batch_size=batch_size)
+        self.sentiment_pipeline = sentiment_pipeline
+        self.cache = SentimentCache(cache_size, cache_ttl)
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._server = InferenceServer(max_batch_size=batch_size, max_latency_ms=max_latency_ms)
+        self._server.register("sentiment", predict_batch=self._score_batch)
+
+    @staticmethod
+    def to_score(sentiment):
+        """Positive sentiment maps to a positive score; negative sentiment to a negative score."""
+        return sentiment['score'] if sentiment['label'] == 'POSITIVE' else -sentiment['score']
+
+    def _score_batch(self, texts):
+        return [self.to_score(sentiment) for sentiment in self.sentiment_pipeline(list(texts))]
 
     def analyze_text(self, text):
         """
@@ -19,10 +106,57 @@ class SentimentAnalysis:
         sentiment = self.sentiment_pipeline(text)
         return sentiment
 
+    def _settle(self, key, future):
+        # Cache before leaving _in_flight, so a concurrent submit always finds the score in one of them
+        if future.exception() is None:
+            self.cache.put(key, future.result())
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def submit_texts(self, texts):
+        """
+        Start scoring texts; returns one future per input (shared between duplicates).
+        """
+        futures = []
+        submitted = {}
+        for text in texts:
+            key = text_key(text)
+            future = submitted.get(key)
+            if future is None:
+                score = self.cache.get(key)
+                if score is not None:
+                    future = Future()
+                    future.set_result(score)
+                else:
+                    with self._lock:
+                        future = self._in_flight.get(key)
+                        new = future is None
+                        if new:
+                            future = self._in_flight[key] = self._server.submit("sentiment", text)
+                    if new:
+                        # Outside the lock: the callback runs right away if scoring already finished
+                        future.add_done_callback(lambda done, key=key: self._settle(key, done))
+                submitted[key] = future
+            futures.append(future)
+        return futures
+
+    def score_texts(self, texts, timeout=None):
+        """
+        Scores many texts (e.g., a batch of headlines).
+
+        :param texts: Sequence of strings.
+        :param timeout: Seconds to wait for the pipeline.
+        :return: float array of scores aligned with `texts`.
+        """
+        return np.array([future.result(timeout) for future in self.submit_texts(texts)], dtype=np.float64)
+
     def get_sentiment_score(self, market_news):
         """
         Analyzes the sentiment of market news and returns a sentiment score.
         Positive sentiment returns a positive score; negative sentiment returns a negative score.
         """
-        sentiment = self.analyze_text(market_news)
-        return sentiment[0]['score'] if sentiment[0]['label'] == 'POSITIVE' else -sentiment[0]['score']
+        return float(self.score_texts([market_news])[0])
+
+    def close(self):
+        """Stop the scoring worker."""
+        self._server.close()
@@ -1,11 +1,35 @@
-import statsmodels.api as sm
+from src.ai.models.arima_model import ARIMAModelCache
+from src.ai.models.batch_forecast import forecast_batch
 
 class TrendForecaster:
-    def __init__(self, historical_data):
+    def __init__(self, historical_data, order=(5, 1, 0), cache=None, asset="trend"):
+        """
+        :param historical_data: Price history to forecast from.
+        :param order: ARIMA order (ignored when a shared cache is passed).
+        :param cache: Optional ARIMAModelCache shared with other forecasters.
+        :param asset: Key of this series in the cache.
+        """
         self.historical_data = historical_data
+        self.asset = asset
+        self.cache = cache or ARIMAModelCache(order=order, min_observations=0)
+        self.cache.update(self.asset, historical_data)
+
+    def update(self, new_data):
+        """Append new observations; the fitted model is updated in place rather than refitted."""
+        self.cache.update(self.asset, new_data)
 
     def forecast_trend(self, steps=10):
         """Uses ARIMA to forecast future trends based on historical data."""
-        model = sm.tsa.ARIMA(self.historical_data, order=(5,1,0))
-        model_fit = model.fit(disp=0)
-        return model_fit.forecast(steps=steps)[0]
+        forecast = self.cache.forecast(self.asset, steps=steps)
+        if forecast is None:
+            raise ValueError("Not enough historical data to fit the ARIMA model.")
+        return forecast
+
+    @staticmethod
+    def forecast_many(series_by_asset, steps=10, order=(5, 1, 0), **options):
+        """
+        Forecast many series at once on a process pool (see src.ai.models.batch_forecast.BatchForecaster).
+
+        :return: (assets, forecasts array aligned with assets, errors dict)
+        """
+        return forecast_batch(series_by_asset, steps=steps, order=order, **options)
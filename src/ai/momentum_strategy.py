@@ -4,19 +4,26 @@ class MomentumStrategy:
     """
     Implements a momentum-based trading strategy.
     """
-    def __init__(self, trading_env):
+    def __init__(self, trading_env, feature_engine=None, asset=None):
         """
         Initialize the strategy with the given trading environment.
         :param trading_env: The environment that provides price and momentum data.
+        :param feature_engine: Optional FeatureEngine to read the momentum from.
+        :param asset: Asset key of this strategy in the feature engine.
         """
         self.trading_env = trading_env
+        self.feature_engine = feature_engine
+        self.asset = asset
 
     def get_signal(self):
         """
         Generate buy/sell signals based on the momentum.
         :return: 'buy', 'sell', or 'hold' based on the momentum value.
         """
-        momentum = self.trading_env.get_momentum()
+        if self.feature_engine is not None:
+            momentum = self.feature_engine.value(self.asset, "momentum")
+        else:
+            momentum = self.trading_env.get_momentum()
 
         if momentum > 0:
             return "buy"
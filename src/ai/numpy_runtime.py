@@ -0,0 +1,450 @@
+# File: /src/ai/numpy_runtime.py
+
+import json
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Gate order of the exported LSTM kernels. Keras (i, f, c, o) and PyTorch (i, f, g, o) already agree.
+LSTM_GATES = ("i", "f", "g", "o")
+
+ACTIVATIONS = ("linear", "relu", "tanh", "sigmoid", "hard_sigmoid", "softmax")
+
+
+def _activate(x, activation):
+    """Apply an activation in place."""
+    if activation == "linear":
+        return x
+    if activation == "relu":
+        return np.maximum(x, 0, out=x)
+    if activation == "tanh":
+        return np.tanh(x, out=x)
+    if activation == "sigmoid":
+        # 1 / (1 + exp(-x)), without temporaries
+        np.negative(x, out=x)
+        np.exp(x, out=x)
+        x += 1
+        return np.reciprocal(x, out=x)
+    if activation == "hard_sigmoid":
+        # Keras 3 definition, relu6(x + 3) / 6 (Keras 2 used 0.2 * x + 0.5)
+        x /= 6
+        x += 0.5
+        return np.clip(x, 0, 1, out=x)
+    if activation == "softmax":
+        x -= x.max(axis=-1, keepdims=True)
+        np.exp(x, out=x)
+        x /= x.sum(axis=-1, keepdims=True)
+        return x
+    raise ValueError(f"Unsupported activation {activation!r}; expected one of {ACTIVATIONS}")
+
+
+def _lstm_cell(projected, h, c, recurrent, spec, gates, scratch):
+    """
+    Advance LSTM states (h, c) in place by one timestep.
+
+    :param projected: Input projection x_t @ W + b for this step, shape (batch, 4 * units).
+    :param gates: Scratch buffer (batch, 4 * units); scratch: buffer (batch, units).
+    """
+    units = h.shape[1]
+    np.matmul(h, recurrent, out=gates)
+    gates += projected
+    gate_i, gate_f, gate_g, gate_o = (gates[:, k * units:(k + 1) * units] for k in range(4))
+    _activate(gates[:, :2 * units], spec["recurrent_activation"])  # i, f
+    _activate(gate_g, spec["activation"])
+    _activate(gate_o, spec["recurrent_activation"])
+    c *= gate_f
+    np.multiply(gate_i, gate_g, out=scratch)
+    c += scratch
+    np.copyto(scratch, c)
+    _activate(scratch, spec["activation"])
+    np.multiply(gate_o, scratch, out=h)
+
+
+def save_exported_model(path, layers, metadata=None):
+    """
+    Write layers to a .npz file readable by NumpyModel.load().
+
+    :param path: Destination path.
+    :param layers: List of (spec dict, weights dict) pairs. Dense specs carry "activation" and weights
+                   "kernel" (in, out) / "bias" (out,); LSTM specs carry "units", "return_sequences",
+                   "activation", "recurrent_activation" and weights "kernel" (in, 4H), "recurrent_kernel"
+                   (H, 4H), "bias" (4H,) in LSTM_GATES order.
+    :param metadata: Optional JSON-serializable dict stored alongside (e.g. the source framework).
+    """
+    arrays = {}
+    specs = []
+    for i, (spec, weights) in enumerate(layers):
+        specs.append(spec)
+        for name, value in weights.items():
+            arrays[f"layer{i}.{name}"] = np.asarray(value, dtype=np.float32)
+    header = {"layers": specs, "metadata": metadata or {}}
+    np.savez(path, __spec__=np.array(json.dumps(header)), **arrays)
+    logger.info(f"Exported {len(specs)} layers to {path}")
+
+
+def keras_layers(model):
+    """
+    Convert a trained Keras Sequential model made of Dense / LSTM layers into the (spec, weights) layer list
+    used by NumpyModel (Dropout and InputLayer are skipped, being no-ops at inference time).
+    """
+    layers = []
+    for layer in model.layers:
+        kind = type(layer).__name__
+        config = layer.get_config()
+        if kind == "Dense":
+            kernel, bias = layer.get_weights()
+            layers.append(({"type": "dense", "activation": config.get("activation", "linear")},
+                           {"kernel": kernel, "bias": bias}))
+        elif kind == "LSTM":
+            kernel, recurrent_kernel, bias = layer.get_weights()
+            layers.append(({
+                "type": "lstm",
+                "units": int(config["units"]),
+                "return_sequences": bool(config.get("return_sequences", False)),
+                "activation": config.get("activation", "tanh"),
+                "recurrent_activation": config.get("recurrent_activation", "sigmoid"),
+            }, {"kernel": kernel, "recurrent_kernel": recurrent_kernel, "bias": bias}))
+        elif kind in ("Dropout", "InputLayer"):
+            continue
+        else:
+            raise ValueError(f"Cannot export Keras layer {layer.name} of type {kind}")
+    return layers
+
+
+def export_keras_model(model, path):
+    """Export a trained Keras Sequential model of Dense / LSTM layers (see keras_layers)."""
+    save_exported_model(path, keras_layers(model), {"framework": "keras"})
+
+
+def export_torch_layers(modules, path):
+    """
+    Export PyTorch modules applied in sequence: nn.Linear, nn.LSTM (batch_first, unidirectional) and the
+    nn.ReLU / nn.Tanh / nn.Sigmoid / nn.Softmax activations, which are folded into the preceding Linear.
+    An LSTM feeds its whole sequence to a following LSTM and only its last step to anything else.
+
+    :param modules: Ordered modules (e.g. [model.fc1, model.relu, model.fc2] or an nn.Sequential).
+    :param path: Destination path.
+    """
+    activation_names = {"ReLU": "relu", "Tanh": "tanh", "Sigmoid": "sigmoid", "Softmax": "softmax",
+                        "Identity": "linear"}
+    modules = list(modules)
+    layers = []
+    for position, module in enumerate(modules):
+        kind = type(module).__name__
+        if kind == "Linear":
+            bias = module.bias if module.bias is not None else np.zeros(module.out_features)
+            layers.append(({"type": "dense", "activation": "linear"},
+                           {"kernel": _to_numpy(module.weight).T, "bias": _to_numpy(bias)}))
+        elif kind in activation_names:
+            if not layers or layers[-1][0]["type"] != "dense" or layers[-1][0]["activation"] != "linear":
+                raise ValueError(f"{kind} at position {position} does not follow a Linear layer")
+            layers[-1][0]["activation"] = activation_names[kind]
+        elif kind == "LSTM":
+            if module.bidirectional or not module.batch_first or getattr(module, "proj_size", 0):
+                raise ValueError("Only unidirectional, batch_first LSTMs without projection can be exported")
+            next_is_lstm = position + 1 < len(modules) and type(modules[position + 1]).__name__ == "LSTM"
+            for k in range(module.num_layers):
+                weights = {
+                    "kernel": _to_numpy(getattr(module, f"weight_ih_l{k}")).T,
+                    "recurrent_kernel": _to_numpy(getattr(module, f"weight_hh_l{k}")).T,
+                    "bias": (_to_numpy(getattr(module, f"bias_ih_l{k}")) + _to_numpy(getattr(module, f"bias_hh_l{k}"))
+                             if module.bias else np.zeros(4 * module.hidden_size)),
+                }
+                last = k == module.num_layers - 1
+                layers.append(({"type": "lstm", "units": module.hidden_size,
+                                "return_sequences": not last or next_is_lstm,
+                                "activation": "tanh", "recurrent_activation": "sigmoid"}, weights))
+        elif kind == "Dropout":
+            continue
+        else:
+            raise ValueError(f"Cannot export PyTorch module of type {kind}")
+    save_exported_model(path, layers, {"framework": "torch"})
+
+
+def _to_numpy(tensor):
+    return tensor.detach().cpu().numpy() if hasattr(tensor, "detach") else np.asarray(tensor)
+
+
+class NumpyModel:
+    """
+    Pure-NumPy forward pass for exported Dense / LSTM stacks, so trading processes can run trained models
+    without importing TensorFlow or PyTorch.
+
+    Weights are float32 and every intermediate result is written into buffers that are allocated once per
+    input shape and then reused, so repeated live predictions of the same shape do not allocate beyond
+    the returned copy. Because of those shared buffers an instance must not be used from several threads
+    at once.
+    """
+
+    def __init__(self, layers, metadata=None):
+        """
+        :param layers: List of (spec dict, weights dict) pairs, as described in save_exported_model().
+        :param metadata: Optional metadata dict from the export.
+        """
+        self.layers = [(dict(spec), {name: np.ascontiguousarray(value, dtype=np.float32)
+                                     for name, value in weights.items()}) for spec, weights in layers]
+        if not self.layers:
+            raise ValueError("NumpyModel needs at least one layer")
+        self.metadata = metadata or {}
+        # Dense-first models take (batch, features), LSTM-first models (batch, timesteps, features)
+        self.input_ndim = 3 if self.layers[0][0]["type"] == "lstm" else 2
+        self._buffers = {}
+
+    @classmethod
+    def load(cls, path):
+        """Load a model written by export_keras_model / export_torch_layers / save_exported_model."""
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(str(data["__spec__"]))
+            layers = []
+            for i, spec in enumerate(header["layers"]):
+                prefix = f"layer{i}."
+                layers.append((spec, {key[len(prefix):]: data[key] for key in data.files if key.startswith(prefix)}))
+        model = cls(layers, header.get("metadata"))
+        logger.info(f"Loaded NumPy model with {len(layers)} layers from {path}")
+        return model
+
+    def _buffer(self, key, shape):
+        buffer = self._buffers.get((key, shape))
+        if buffer is None:
+            if len(self._buffers) > 256:
+                self._buffers.clear()  # Many distinct input shapes: start over rather than grow forever
+            buffer = self._buffers[(key, shape)] = np.empty(shape, dtype=np.float32)
+        return buffer
+
+    def _dense(self, i, x, spec, weights):
+        kernel, bias = weights["kernel"], weights["bias"]
+        rows = x.reshape(-1, x.shape[-1])
+        out = self._buffer(i, (rows.shape[0], kernel.shape[1]))
+        np.matmul(rows, kernel, out=out)
+        out += bias
+        _activate(out, spec["activation"])
+        return out.reshape(x.shape[:-1] + (kernel.shape[1],))
+
+    def _lstm(self, i, x, spec, weights):
+        kernel, recurrent, bias = weights["kernel"], weights["recurrent_kernel"], weights["bias"]
+        units = spec["units"]
+        batch, steps, features = x.shape
+        # Input projections for all timesteps in one matmul; only h @ U stays inside the loop
+        projected = self._buffer((i, "x"), (batch * steps, 4 * units))
+        np.matmul(x.reshape(batch * steps, features), kernel, out=projected)
+        projected += bias
+        projected = projected.reshape(batch, steps, 4 * units)
+
+        h = self._buffer((i, "h"), (batch, units))
+        c = self._buffer((i, "c"), (batch, units))
+        gates = self._buffer((i, "gates"), (batch, 4 * units))
+        scratch = self._buffer((i, "scratch"), (batch, units))
+        outputs = self._buffer((i, "out"), (batch, steps, units)) if spec["return_sequences"] else None
+        h.fill(0)
+        c.fill(0)
+        for t in range(steps):
+            _lstm_cell(projected[:, t], h, c, recurrent, spec, gates, scratch)
+            if outputs is not None:
+                outputs[:, t] = h
+        return outputs if outputs is not None else h
+
+    def predict(self, x):
+        """
+        Run the forward pass.
+
+        :param x: Batch of inputs (batch, features) or (batch, timesteps, features) for LSTM-first models;
+                  a single unbatched sample is accepted too.
+        :return: float32 array of outputs (a fresh copy, safe to keep).
+        """
+        x = np.asarray(x, dtype=np.float32)
+        single = x.ndim == self.input_ndim - 1
+        if single:
+            x = x[None]
+        for i, (spec, weights) in enumerate(self.layers):
+            if spec["type"] == "dense":
+                x = self._dense(i, x, spec, weights)
+            elif spec["type"] == "lstm":
+                x = self._lstm(i, x, spec, weights)
+            else:
+                raise ValueError(f"Unknown layer type {spec['type']!r}")
+        return x[0].copy() if single else x.copy()
+
+    @property
+    def recurrent_depth(self):
+        """Number of leading LSTM layers (the part of the network that carries state between timesteps)."""
+        depth = 0
+        while depth < len(self.layers) and self.layers[depth][0]["type"] == "lstm":
+            depth += 1
+        return depth
+
+    def init_state(self, batch):
+        """Zero (h, c) state per leading LSTM layer for `batch` sequences, for step()."""
+        return [(np.zeros((batch, spec["units"]), dtype=np.float32), np.zeros((batch, spec["units"]), dtype=np.float32))
+                for spec, _ in self.layers[:self.recurrent_depth]]
+
+    def step(self, x_t, state, head=True):
+        """
+        Streaming inference: feed one timestep per sequence and advance `state` in place.
+
+        Running step() over a window from init_state() gives the same output as predict() on that window,
+        at O(1) cost per new timestep. Requires the LSTM layers to come first, followed only by Dense layers.
+
+        :param x_t: Inputs for this timestep, shape (batch, features).
+        :param state: List of (h, c) arrays from init_state() (or gathered rows of one).
+        :param head: Also run the Dense layers and return their output; False only advances the state.
+        :return: Output array (batch, outputs) as a fresh copy, or None when head is False.
+        """
+        depth = self.recurrent_depth
+        if depth == 0 or any(spec["type"] != "dense" for spec, _ in self.layers[depth:]):
+            raise ValueError("step() needs a model made of leading LSTM layers followed by Dense layers")
+        x = np.asarray(x_t, dtype=np.float32)
+        batch = x.shape[0]
+        for i, ((spec, weights), (h, c)) in enumerate(zip(self.layers[:depth], state)):
+            units = spec["units"]
+            projected = self._buffer((i, "step"), (batch, 4 * units))
+            np.matmul(x, weights["kernel"], out=projected)
+            projected += weights["bias"]
+            _lstm_cell(projected, h, c, weights["recurrent_kernel"], spec,
+                       self._buffer((i, "gates"), (batch, 4 * units)), self._buffer((i, "scratch"), (batch, units)))
+            x = h
+        if not head:
+            return None
+        for i in range(depth, len(self.layers)):
+            spec, weights = self.layers[i]
+            x = self._dense(i, x, spec, weights)
+        return x.copy()
+
+    def predict_batch(self, observations):
+        """List-in, list-out form used by the inference server."""
+        return list(self.predict(np.stack([np.asarray(o, dtype=np.float32) for o in observations])))
+
+
+class StreamingLSTM:
+    """
+    Stateful per-asset streaming inference for an LSTM-first NumpyModel.
+
+    Each asset keeps its own (h, c) state per LSTM layer and a ring buffer of its last `window` inputs.
+    update() advances the states of all assets that received a new bar in one batched step, so a tick
+    costs O(1) instead of re-running the whole window. Every `resync_interval` bars an asset's state is
+    rebuilt from its stored window, which makes the output exactly equal to a full-window predict() at
+    that point and bounds how much older history the streamed state carries.
+    """
+
+    def __init__(self, model, window, resync_interval=None, capacity=64):
+        """
+        :param model: NumpyModel made of LSTM layers followed by Dense layers.
+        :param window: Input window length the model was trained on.
+        :param resync_interval: Bars between state rebuilds per asset (default: window; 0 disables).
+        :param capacity: Initial number of asset slots (grows as needed).
+        """
+        if model.recurrent_depth == 0:
+            raise ValueError("StreamingLSTM needs a model whose first layer is an LSTM")
+        self.model = model
+        self.window = window
+        self.resync_interval = window if resync_interval is None else resync_interval
+        self.features = model.layers[0][1]["kernel"].shape[0]
+        self._rows = {}
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity):
+        state = self.model.init_state(capacity)
+        history = np.zeros((capacity, self.window, self.features), dtype=np.float32)
+        counts = np.zeros(capacity, dtype=np.int64)
+        since_resync = np.zeros(capacity, dtype=np.int64)
+        if hasattr(self, "_counts"):
+            used = len(self._counts)
+            for (h, c), (old_h, old_c) in zip(state, self._state):
+                h[:used], c[:used] = old_h[:used], old_c[:used]
+            history[:used] = self._history[:used]
+            counts[:used] = self._counts[:used]
+            since_resync[:used] = self._since_resync[:used]
+        self._state, self._history, self._counts, self._since_resync = state, history, counts, since_resync
+
+    def _row_ids(self, assets):
+        rows = np.empty(len(assets), dtype=np.int64)
+        for i, asset in enumerate(assets):
+            row = self._rows.get(asset)
+            if row is None:
+                row = self._rows[asset] = len(self._rows)
+                if row >= len(self._counts):
+                    self._allocate(2 * len(self._counts))
+            rows[i] = row
+        return rows
+
+    @property
+    def assets(self):
+        return list(self._rows)
+
+    def update(self, assets, observations):
+        """
+        Feed one new bar per asset and return the model outputs.
+
+        :param assets: Sequence of asset keys (each at most once per call).
+        :param observations: Array (len(assets), features) with the newest bar of each asset.
+        :return: Array (len(assets), outputs).
+        """
+        x = np.asarray(observations, dtype=np.float32).reshape(len(assets), self.features)
+        rows = self._row_ids(assets)
+        self._history[rows, self._counts[rows] % self.window] = x
+        self._counts[rows] += 1
+        self._since_resync[rows] += 1
+
+        resync = self._since_resync[rows] >= self.resync_interval if self.resync_interval else np.zeros(len(rows), bool)
+        outputs = None
+        if not resync.all():
+            streamed = ~resync
+            state = self._gather(rows[streamed])
+            streamed_out = self.model.step(x[streamed], state)
+            self._scatter(rows[streamed], state)
+            outputs = np.empty((len(rows), streamed_out.shape[1]), dtype=np.float32)
+            outputs[streamed] = streamed_out
+        if resync.any():
+            resynced_out = self._resync_rows(rows[resync])
+            if outputs is None:
+                outputs = np.empty((len(rows), resynced_out.shape[1]), dtype=np.float32)
+            outputs[resync] = resynced_out
+        return outputs
+
+    def resync(self, assets=None):
+        """Rebuild the state of `assets` (default: all) from their stored windows, e.g. after a data gap."""
+        assets = self.assets if assets is None else assets
+        if assets:
+            self._resync_rows(self._row_ids(assets))
+
+    def reset(self, assets=None):
+        """Forget the state and history of `assets` (default: all)."""
+        rows = np.arange(len(self._rows)) if assets is None else self._row_ids(assets)
+        for h, c in self._state:
+            h[rows] = 0
+            c[rows] = 0
+        self._counts[rows] = 0
+        self._since_resync[rows] = 0
+
+    def _gather(self, rows):
+        return [(h[rows], c[rows]) for h, c in self._state]
+
+    def _scatter(self, rows, state):
+        for (h, c), (new_h, new_c) in zip(self._state, state):
+            h[rows] = new_h
+            c[rows] = new_c
+
+    def _resync_rows(self, rows):
+        """Re-run each row's stored window from a zero state; returns the outputs for the newest bar."""
+        lengths = np.minimum(self._counts[rows], self.window)
+        outputs = None
+        # Assets with fewer bars than the window have shorter histories; replay each length group together
+        for length in np.unique(lengths):
+            group = np.flatnonzero(lengths == length)
+            group_rows = rows[group]
+            if length == 0:
+                self._scatter(group_rows, self.model.init_state(len(group_rows)))
+                continue
+            # Oldest-to-newest positions in each ring buffer
+            positions = (self._counts[group_rows, None] - length + np.arange(length)) % self.window
+            sequences = self._history[group_rows[:, None], positions]
+            state = self.model.init_state(len(group_rows))
+            for t in range(int(length)):
+                out = self.model.step(sequences[:, t], state, head=t == length - 1)
+            self._scatter(group_rows, state)
+            if outputs is None:
+                outputs = np.empty((len(rows), out.shape[1]), dtype=np.float32)
+            outputs[group] = out
+        self._since_resync[rows] = 0
+        return outputs
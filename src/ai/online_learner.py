@@ -0,0 +1,236 @@
+# File: /src/ai/online_learner.py
+
+import copy
+import logging
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def clone_model(model):
+    """
+    Independent copy of a model with the same weights: Keras models are rebuilt with clone_model and
+    recompiled with a fresh optimizer of the same configuration, anything else (e.g. torch modules,
+    NumPy models) is deep-copied.
+    """
+    if hasattr(model, "get_weights") and hasattr(model, "get_config"):
+        from tensorflow.keras.models import clone_model as keras_clone_model
+
+        clone = keras_clone_model(model)
+        clone.set_weights(model.get_weights())
+        if getattr(model, "optimizer", None) is not None:
+            optimizer = model.optimizer.__class__.from_config(model.optimizer.get_config())
+            clone.compile(optimizer=optimizer, loss=model.loss)
+        return clone
+    return copy.deepcopy(model)
+
+
+def copy_weights(source, target):
+    """Copy the weights of `source` into `target`, which has the same architecture."""
+    if hasattr(source, "get_weights"):
+        target.set_weights(source.get_weights())
+    elif hasattr(source, "state_dict"):
+        target.load_state_dict(source.state_dict())
+    else:
+        target.__dict__.update(copy.deepcopy(source.__dict__))
+
+
+def keras_fit(model, X, y, epochs=1, batch_size=32):
+    """Default training step: `epochs` passes of model.fit over one mini-batch."""
+    model.fit(X, y, epochs=epochs, batch_size=batch_size, verbose=0)
+
+
+class _Buffer:
+    __slots__ = ("model", "readers")
+
+    def __init__(self, model):
+        self.model = model
+        self.readers = 0
+
+
+class OnlineLearner:
+    """
+    Trains a model on real-time samples in the background while predictions keep using the last
+    published weights.
+
+    add_samples() only appends to a pending queue and returns. A worker thread drains the queue into
+    mini-batches (once `batch_size` samples are pending, or `max_delay` seconds after the oldest one
+    arrived), trains a private copy of the model on them and publishes the result by double buffering:
+    the new weights are copied into the standby predictor, which then replaces the live one with a single
+    reference swap. predict() never waits for training; it only registers as a reader of the live buffer
+    so the worker does not overwrite a buffer while a prediction is still running on it.
+    """
+
+    def __init__(self, model, fit=None, predict=None, batch_size=32, max_delay=5.0, max_pending=10000,
+                 clone=clone_model, copy=copy_weights):
+        """
+        :param model: Model to train; it becomes the background training copy and must not be used elsewhere.
+        :param fit: Callable(model, X, y) training on one mini-batch (default: one epoch of model.fit).
+        :param predict: Callable(model, X) (default: model.predict(X)).
+        :param batch_size: Samples per mini-batch.
+        :param max_delay: Seconds after which a partial mini-batch is trained anyway.
+        :param max_pending: Pending samples kept when training falls behind; the oldest are dropped.
+        :param clone: Callable(model) -> independent copy, used to build the two predictor buffers.
+        :param copy: Callable(source, target) copying weights between copies of the model.
+        """
+        self.trainer = model
+        self.fit = fit or keras_fit
+        self.predict_fn = predict or (lambda m, X: m.predict(X))
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.copy = copy
+
+        self._buffers = [_Buffer(clone(model)), _Buffer(clone(model))]
+        self._live = self._buffers[0]
+        self._swap_lock = threading.Condition()
+        self._train_lock = threading.Lock()
+
+        self._pending = []  # (X, y) chunks, oldest first
+        self._pending_count = 0
+        self._oldest_at = None
+        self._received = 0
+        self._consumed = 0  # Samples trained on or dropped
+        self._samples_lock = threading.Condition()
+        self._closed = False
+
+        self.version = 0
+        self.stats = {"samples": 0, "dropped": 0, "batches": 0, "errors": 0, "train_seconds": 0.0}
+        self._worker = threading.Thread(target=self._run, name="online-learner", daemon=True)
+        self._worker.start()
+
+    @property
+    def live_model(self):
+        """The model currently serving predictions."""
+        return self._live.model
+
+    def predict(self, X):
+        """Predict with the most recently published weights."""
+        with self._swap_lock:
+            buffer = self._live
+            buffer.readers += 1
+        try:
+            return self.predict_fn(buffer.model, X)
+        finally:
+            with self._swap_lock:
+                buffer.readers -= 1
+                if buffer.readers == 0:
+                    self._swap_lock.notify_all()
+
+    def add_samples(self, X, y):
+        """
+        Queue labelled samples for the next mini-batch and return immediately.
+
+        :param X: Array of samples (first axis is the sample axis).
+        :param y: Targets aligned with X.
+        """
+        X, y = np.asarray(X), np.asarray(y)
+        if len(X) != len(y):
+            raise ValueError(f"Got {len(X)} samples but {len(y)} targets")
+        with self._samples_lock:
+            if self._closed:
+                raise RuntimeError("OnlineLearner is closed")
+            if not self._pending:
+                self._oldest_at = time.monotonic()
+            self._pending.append((X, y))
+            self._pending_count += len(X)
+            self._received += len(X)
+            self.stats["samples"] += len(X)
+            while self._pending_count > self.max_pending and len(self._pending) > 1:
+                dropped = len(self._pending.pop(0)[0])
+                self._pending_count -= dropped
+                self._consumed += dropped
+                self.stats["dropped"] += dropped
+            if self._pending_count >= self.batch_size or len(self._pending) == 1:
+                self._samples_lock.notify_all()  # A full batch, or start the max_delay timer
+
+    def _take_batch(self):
+        """Wait for a mini-batch worth of samples (or the delay/close) and take every pending sample."""
+        with self._samples_lock:
+            while not self._closed:
+                if self._pending_count >= self.batch_size:
+                    break
+                if self._pending:
+                    remaining = self._oldest_at + self.max_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._samples_lock.wait(remaining)
+                else:
+                    self._samples_lock.wait()
+            chunks, self._pending, self._pending_count = self._pending, [], 0
+        if not chunks:
+            return None
+        return np.concatenate([X for X, _ in chunks]), np.concatenate([y for _, y in chunks])
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return  # Closed with nothing left to train on
+            X, y = batch
+            started = time.perf_counter()
+            try:
+                with self._train_lock:
+                    self.fit(self.trainer, X, y)
+                    self._publish()
+                self.stats["batches"] += 1
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Online training on {len(X)} samples failed: {e}")
+            self.stats["train_seconds"] += time.perf_counter() - started
+            with self._samples_lock:
+                self._consumed += len(X)
+                self._samples_lock.notify_all()
+
+    def _publish(self):
+        """Copy the trainer's weights into the standby predictor and swap it in."""
+        with self._swap_lock:
+            standby = self._buffers[1] if self._live is self._buffers[0] else self._buffers[0]
+            # Predictions that started before the previous swap may still be running on the standby
+            while standby.readers:
+                self._swap_lock.wait()
+        self.copy(self.trainer, standby.model)
+        with self._swap_lock:
+            self._live = standby
+            self.version += 1
+
+    def train(self, train_fn):
+        """
+        Run a synchronous training job on the trainer copy (e.g. a full retrain on historical data)
+        without racing the background worker, then publish the result.
+
+        :param train_fn: Callable(model) training the model in place.
+        """
+        with self._train_lock:
+            train_fn(self.trainer)
+            self._publish()
+
+    def flush(self, timeout=None):
+        """
+        Train on every sample queued so far and wait until the result is published.
+
+        :return: True if everything was trained (or dropped) within `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._samples_lock:
+            target = self._received
+            if self._pending:
+                self._oldest_at = float("-inf")  # Train the partial batch now
+                self._samples_lock.notify_all()
+            while self._consumed < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._samples_lock.wait(remaining)
+        return True
+
+    def close(self, timeout=None):
+        """Train on the remaining samples and stop the worker."""
+        self.flush(timeout)
+        with self._samples_lock:
+            self._closed = True
+            self._samples_lock.notify_all()
+        self._worker.join(timeout)
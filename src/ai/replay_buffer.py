@@ -1,71 +1,329 @@
 import numpy as np
-import random
 
 class ExperienceReplayBuffer:
-    """Experience Replay Buffer for storing and reusing experiences."""
+    """
+    Experience Replay Buffer for storing and reusing experiences.
 
-    def __init__(self, capacity=10000):
-        """Initialize the buffer with a fixed capacity."""
+    Transitions live in preallocated contiguous NumPy arrays (a ring buffer), allocated on the first push
+    from the shapes of that transition. Sampling draws an index array and returns batch arrays by fancy
+    indexing, so no per-transition Python objects are created or stored.
+    """
+
+    def __init__(self, capacity=10000, state_dtype=np.float32, seed=None):
+        """
+        Initialize the buffer with a fixed capacity.
+
+        :param capacity: Maximum number of transitions; the oldest are overwritten once full.
+        :param state_dtype: Storage dtype for states and next_states.
+        :param seed: Optional seed for the sampling generator.
+        """
         self.capacity = capacity
-        self.buffer = []
+        self.state_dtype = np.dtype(state_dtype)
         self.position = 0
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+        self.states = None
+        self.actions = None
+        self.rewards = None
+        self.next_states = None
+        self.dones = None
+
+    def _allocate(self, state, action):
+        state = np.asarray(state, dtype=self.state_dtype)
+        action = np.asarray(action)
+        action_dtype = np.int64 if np.issubdtype(action.dtype, np.integer) else np.float32
+        self.states = np.zeros((self.capacity,) + state.shape, dtype=self.state_dtype)
+        self.next_states = np.zeros_like(self.states)
+        self.actions = np.zeros((self.capacity,) + action.shape, dtype=action_dtype)
+        self.rewards = np.zeros(self.capacity, dtype=np.float32)
+        self.dones = np.zeros(self.capacity, dtype=np.bool_)
 
     def push(self, state, action, reward, next_state, done):
         """Store a transition in the buffer."""
-        if len(self.buffer) < self.capacity:
-            self.buffer.append(None)
-        self.buffer[self.position] = (state, action, reward, next_state, done)
-        self.position = (self.position + 1) % self.capacity
+        if self.states is None:
+            self._allocate(state, action)
+        i = self.position
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self.position = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        """Store many transitions at once (first axis is the transition index), wrapping around the ring."""
+        states = np.asarray(states, dtype=self.state_dtype)
+        count = len(states)
+        if count == 0:
+            return
+        if self.states is None:
+            self._allocate(states[0], np.asarray(actions)[0])
+        start = self.position
+        if count > self.capacity:
+            # Only the newest `capacity` transitions would survive anyway
+            skip = count - self.capacity
+            keep = slice(skip, count)
+            states, actions, rewards = states[keep], np.asarray(actions)[keep], np.asarray(rewards)[keep]
+            next_states, dones = np.asarray(next_states)[keep], np.asarray(dones)[keep]
+            start = (start + skip) % self.capacity
+        idx = (start + np.arange(len(states))) % self.capacity
+        self.states[idx] = states
+        self.actions[idx] = actions
+        self.rewards[idx] = rewards
+        self.next_states[idx] = next_states
+        self.dones[idx] = dones
+        self.position = int((self.position + count) % self.capacity)
+        self.size = min(self.size + count, self.capacity)
+
+    def sample_indices(self, batch_size):
+        """Draw `batch_size` distinct stored indices uniformly at random."""
+        if batch_size > self.size:
+            raise ValueError(f"Sample larger than buffer ({batch_size} > {self.size})")
+        return self.rng.choice(self.size, size=batch_size, replace=False)
 
     def sample(self, batch_size):
-        """Sample a batch of experiences."""
-        return random.sample(self.buffer, batch_size)
+        """
+        Sample a batch of experiences.
+
+        :return: Tuple of arrays (states, actions, rewards, next_states, dones), each with batch_size rows.
+        """
+        idx = self.sample_indices(batch_size)
+        return self.states[idx], self.actions[idx], self.rewards[idx], self.next_states[idx], self.dones[idx]
+
+    @property
+    def nbytes(self):
+        """Bytes held by the preallocated arrays."""
+        if self.states is None:
+            return 0
+        return sum(a.nbytes for a in (self.states, self.actions, self.rewards, self.next_states, self.dones))
 
     def __len__(self):
         """Return the current size of the buffer."""
-        return len(self.buffer)
+        return self.size
 
-from .replay_buffer import ExperienceReplayBuffer
-import numpy as np
+class SumTree:
+    """
+    Array-backed binary sum-tree over `capacity` leaf priorities. Leaves sit at [size, 2 * size) of one
+    float64 array and every internal node holds the sum of its children, so the root is the total.
+    Updates and prefix-sum lookups take O(log n) and are vectorized over whole batches of indices.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.leaf_offset = 1 << max(0, int(capacity - 1).bit_length())
+        self.depth = self.leaf_offset.bit_length() - 1
+        self.tree = np.zeros(2 * self.leaf_offset, dtype=np.float64)
+
+    @property
+    def total(self):
+        return self.tree[1]
+
+    def get(self, indices):
+        """Leaf priorities for the given data indices."""
+        return self.tree[np.asarray(indices) + self.leaf_offset]
+
+    def update(self, indices, priorities):
+        """Set leaf priorities and refresh their ancestors one tree level at a time."""
+        nodes = np.asarray(indices, dtype=np.int64) + self.leaf_offset
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            # Duplicate parents just write the same sum twice, so no de-duplication is needed
+            nodes >>= 1
+            left = nodes << 1
+            self.tree[nodes] = self.tree[left] + self.tree[left + 1]
+
+    def find(self, values):
+        """Data indices whose cumulative-priority interval contains each value (values in [0, total))."""
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(values.shape, dtype=np.int64)
+        for _ in range(self.depth):
+            nodes <<= 1
+            left_sum = self.tree[nodes]
+            go_right = values >= left_sum
+            values -= left_sum * go_right
+            nodes += go_right
+        return nodes - self.leaf_offset
+
+
+class PrioritizedReplayBuffer(ExperienceReplayBuffer):
+    """
+    Proportional prioritized experience replay (Schaul et al.) on top of the array-backed buffer.
+
+    Transition i is drawn with probability p_i^alpha / sum_k p_k^alpha, using stratified sampling over a
+    sum-tree: the total mass is split into batch_size equal segments and one value is drawn per segment.
+    sample() additionally returns the sampled indices and importance-sampling weights
+    (N * P(i))^-beta / max_j w_j, with beta annealed towards 1. After a learning step, feed the absolute
+    TD errors (or advantages) back through update_priorities(). New transitions get the current
+    maximum priority so each one is seen at least once.
+    """
+
+    def __init__(self, capacity=10000, alpha=0.6, beta=0.4, beta_increment=1e-4, epsilon=1e-6,
+                 state_dtype=np.float32, seed=None):
+        """
+        :param capacity: Maximum number of transitions.
+        :param alpha: How strongly priorities skew sampling (0 = uniform).
+        :param beta: Initial importance-sampling exponent, annealed to 1 by beta_increment per sample().
+        :param beta_increment: Amount added to beta after every sample() call.
+        :param epsilon: Added to |error| so no transition's priority drops to zero.
+        :param state_dtype: Storage dtype for states and next_states.
+        :param seed: Optional seed for the sampling generator.
+        """
+        super().__init__(capacity, state_dtype=state_dtype, seed=seed)
+        self.alpha = alpha
+        self.beta = beta
+        self.beta_increment = beta_increment
+        self.epsilon = epsilon
+        self.max_priority = 1.0
+        self.tree = SumTree(capacity)
+
+    def push(self, state, action, reward, next_state, done):
+        """Store a transition with the current maximum priority."""
+        index = self.position
+        super().push(state, action, reward, next_state, done)
+        self.tree.update([index], self.max_priority)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        """Store many transitions, each with the current maximum priority."""
+        written = min(len(states), self.capacity)
+        super().push_batch(states, actions, rewards, next_states, dones)
+        if written:
+            indices = (self.position - written + np.arange(written)) % self.capacity
+            self.tree.update(indices, self.max_priority)
+
+    def sample_indices(self, batch_size):
+        """Stratified proportional draw of `batch_size` indices (with replacement across segments)."""
+        if self.size == 0:
+            raise ValueError("Cannot sample from an empty buffer")
+        total = self.tree.total
+        segment = total / batch_size
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        indices = self.tree.find(np.minimum(values, np.nextafter(total, 0)))
+        # Float rounding at the right edge can land on an empty leaf; clamp to stored data
+        return np.minimum(indices, self.size - 1)
+
+    def sample(self, batch_size, beta=None):
+        """
+        Sample a prioritized batch.
+
+        :param batch_size: Number of transitions.
+        :param beta: Importance-sampling exponent for this call; defaults to the annealed self.beta.
+        :return: (states, actions, rewards, next_states, dones, indices, weights), weights as float32.
+        """
+        indices = self.sample_indices(batch_size)
+        if beta is None:
+            beta = self.beta
+            self.beta = min(1.0, self.beta + self.beta_increment)
+        probabilities = self.tree.get(indices) / self.tree.total
+        weights = (self.size * probabilities) ** -beta
+        weights /= weights.max()
+        return (self.states[indices], self.actions[indices], self.rewards[indices], self.next_states[indices],
+                self.dones[indices], indices, weights.astype(np.float32))
+
+    def update_priorities(self, indices, errors):
+        """
+        Re-prioritize sampled transitions after a learning step, vectorized over the batch.
+
+        :param indices: Indices returned by sample().
+        :param errors: TD errors or advantages for those transitions (sign is ignored).
+        """
+        priorities = (np.abs(np.asarray(errors, dtype=np.float64)) + self.epsilon) ** self.alpha
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self.tree.update(indices, priorities)
+
+from .mmap_replay_store import MemmapReplayStore
+import logging
+import os
 
 class RLTradingAgent:
-    """RL Trading Agent optimized with experience replay and batch processing."""
+    """RL Trading Agent optimized with experience replay and batch processing, with adaptive fine-tuning."""
 
-    def __init__(self, env, model_path=None, buffer_size=10000):
-        """Initialize the RL agent with experience replay buffer."""
+    def __init__(self, env, model_path=None, buffer_size=10000, prioritized=False, replay_store_path=None):
+        """
+        Initialize the RL agent with experience replay buffer (prioritized replay if requested).
+        With replay_store_path (or REPLAY_STORE_PATH) the agent appends to and samples from the file-backed
+        store shared by all agent processes instead.
+        """
         self.env = env
-        self.buffer = ExperienceReplayBuffer(buffer_size)
+        replay_store_path = replay_store_path or os.getenv("REPLAY_STORE_PATH")
+        if replay_store_path:
+            state_dim = int(np.prod(env.observation_space.shape))
+            self.buffer = MemmapReplayStore(replay_store_path, capacity=buffer_size, state_dim=state_dim)
+        elif prioritized:
+            self.buffer = PrioritizedReplayBuffer(buffer_size)
+        else:
+            self.buffer = ExperienceReplayBuffer(buffer_size)
+
+        from stable_baselines3 import PPO
         self.model = PPO("MlpPolicy", self.env, verbose=1)
+        if model_path:
+            self.load_model(model_path)
 
     def store_experience(self, state, action, reward, next_state, done):
         """Store experience in the replay buffer."""
         self.buffer.push(state, action, reward, next_state, done)
 
     def train_from_experience(self, batch_size=64):
-        """Train the agent from a batch of experiences."""
-        if len(self.buffer) >= batch_size:
-            batch = self.buffer.sample(batch_size)
-            states, actions, rewards, next_states, dones = zip(*batch)
-
-            # Use batch processing to update the model
-            for i in range(batch_size):
-                self.model.learn(total_timesteps=1)
-        else:
+        """
+        Train the agent from a batch of experiences with one vectorized actor-critic gradient step.
+
+        The PPO policy's critic is regressed onto one-step TD targets r + gamma * (1 - done) * V(s'), and the
+        actor follows the advantage-weighted log-likelihood of the replayed actions, both computed for the
+        whole batch in a single forward/backward pass through policy.evaluate_actions and the policy's own
+        optimizer. Prioritized batches are importance-weighted and re-prioritized by |TD error|.
+
+        :return: Dict of loss statistics, or None when the buffer holds fewer than batch_size experiences.
+        """
+        if len(self.buffer) < batch_size:
             logging.info("Not enough experiences in the buffer for training.")
+            return None
 
-import numpy as np
-import logging
+        import torch
 
-class RLTradingAgent:
-    """RL Trading Agent with adaptive learning and fine-tuning."""
+        batch = self.buffer.sample(batch_size)
+        states, actions, rewards, next_states, dones = batch[:5]
+        policy = self.model.policy
+        device = policy.device
+        obs_shape = (-1,) + self.model.observation_space.shape
 
-    def __init__(self, env, model_path=None):
-        """Initialize the RL agent."""
-        self.env = env
-        self.model = PPO("MlpPolicy", self.env, verbose=1)
-        
-        if model_path:
-            self.load_model(model_path)
+        obs = torch.as_tensor(states, dtype=torch.float32, device=device).reshape(obs_shape)
+        next_obs = torch.as_tensor(next_states, dtype=torch.float32, device=device).reshape(obs_shape)
+        actions = torch.as_tensor(actions, device=device)
+        if not actions.is_floating_point():
+            actions = actions.long().flatten()  # Discrete action ids
+        rewards = torch.as_tensor(rewards, dtype=torch.float32, device=device)
+        not_done = 1.0 - torch.as_tensor(dones, dtype=torch.float32, device=device)
+        weights = torch.as_tensor(batch[6], device=device) if len(batch) == 7 else torch.ones_like(rewards)
+
+        policy.set_training_mode(True)
+        values, log_prob, entropy = policy.evaluate_actions(obs, actions)
+        values = values.flatten()
+        with torch.no_grad():
+            targets = rewards + self.model.gamma * not_done * policy.predict_values(next_obs).flatten()
+        td_errors = targets - values
+        advantages = td_errors.detach()
+        if len(advantages) > 1:
+            advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
+
+        policy_loss = -(weights * advantages * log_prob).mean()
+        value_loss = (weights * td_errors.pow(2)).mean()
+        entropy_loss = -entropy.mean() if entropy is not None else -log_prob.mean()
+        loss = policy_loss + self.model.vf_coef * value_loss + self.model.ent_coef * entropy_loss
+
+        policy.optimizer.zero_grad()
+        loss.backward()
+        torch.nn.utils.clip_grad_norm_(policy.parameters(), self.model.max_grad_norm)
+        policy.optimizer.step()
+
+        if len(batch) == 7:
+            self.buffer.update_priorities(batch[5], td_errors.detach().abs().cpu().numpy())
+
+        return {
+            "policy_loss": policy_loss.item(),
+            "value_loss": value_loss.item(),
+            "entropy_loss": entropy_loss.item(),
+            "batch_size": len(rewards),
+        }
 
     def fine_tune(self, new_data, fine_tune_steps=10000):
         """Fine-tune the agent based on new data."""
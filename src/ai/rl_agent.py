@@ -1,11 +1,88 @@
-from stable_baselines3.common.vec_env import DummyVecEnv
+import os
+from collections.abc import Mapping
+import numpy as np
+from src.ai.vec_env import BUY, HOLD, SELL, VectorizedTradingEnv, make_vec_env
+
+ACTION_NAMES = {BUY: "buy", SELL: "sell", HOLD: "hold"}
+
+
+def policy_actions(policy, batch):
+    """
+    Discrete actions for a batch of observations in one forward pass: a stable-baselines3 algorithm's
+    deterministic predict(), or the argmax of a model's predict_batch/predict action scores.
+    """
+    if hasattr(policy, "policy"):  # stable-baselines3 algorithm
+        actions, _ = policy.predict(batch, deterministic=True)
+    else:
+        predict = getattr(policy, "predict_batch", None) or policy.predict
+        actions = np.argmax(predict(batch), axis=-1)
+    return [int(action) for action in np.asarray(actions).reshape(len(batch))]
+
+
+def market_features(market_data):
+    """
+    Observation vector for a market-data payload: the numeric fields of a mapping in key order (other
+    fields such as wallet addresses are skipped), or the payload itself as an array.
+    """
+    if isinstance(market_data, Mapping):
+        market_data = [value for _, value in sorted(market_data.items())
+                       if isinstance(value, (int, float, np.number)) and not isinstance(value, bool)]
+    return np.asarray(market_data, dtype=np.float32).ravel()
+
 
 class RLTradingAgent:
     """Reinforcement learning trading agent."""
 
-    def __init__(self, env):
-        """Initialize the agent with the given environment."""
-        self.env = DummyVecEnv([lambda: env])
+    def __init__(self, env, policy=None):
+        """
+        Initialize the agent with the given environment.
+        A VectorizedTradingEnv is stepped natively in batches and an existing VecEnv is used as is;
+        any other single gym environment is wrapped in a DummyVecEnv.
+
+        :param policy: Optional trained policy used by decide_action(s): a stable-baselines3 algorithm or a
+                       model with predict_batch/predict returning action scores (e.g. a NumpyModel).
+        """
+        from stable_baselines3.common.vec_env import DummyVecEnv, VecEnv
+
+        self.policy = policy
+        if isinstance(env, VectorizedTradingEnv):
+            self.env = env.as_sb3_vec_env()
+        elif isinstance(env, VecEnv):
+            self.env = env
+        else:
+            self.env = DummyVecEnv([lambda: env])
+
+    @classmethod
+    def from_prices(cls, prices, num_envs=8, parallel=False, **env_options):
+        """
+        Build an agent over `num_envs` trading episodes on a price series, stepped as one NumPy batch
+        or, with parallel=True, spread over worker processes.
+        """
+        return cls(make_vec_env(prices, num_envs=num_envs, parallel=parallel, **env_options))
+
+    def load_policy(self, path):
+        """Load a trained stable-baselines3 PPO policy for decide_action(s)."""
+        from stable_baselines3 import PPO
+
+        self.policy = PPO.load(path, env=self.env)
+        return self
+
+    def decide_actions(self, observations):
+        """
+        Actions for a batch of observations in a single forward pass of the policy; the inference server
+        calls this with each micro-batch of requests.
+
+        :param observations: Sequence of observations with the same shape.
+        :return: List of action ids (BUY, SELL, HOLD) aligned with observations.
+        """
+        if self.policy is None:
+            raise RuntimeError("RLTradingAgent has no policy; pass policy= or call load_policy() first.")
+        batch = np.stack([np.asarray(observation, dtype=np.float32) for observation in observations])
+        return policy_actions(self.policy, batch)
+
+    def decide_action(self, observation):
+        """Action for one observation."""
+        return self.decide_actions([observation])[0]
 
     def get_signal(self):
         """Simulate signal generation by the agent."""
@@ -25,3 +102,49 @@ class RLTradingAgent:
     def train(self):
         """Train the RL agent."""
         pass  # Placeholder for training logic
+
+
+class RLTradeDecider:
+    """
+    Serves the policy trained for one trading environment to the strategy bots.
+
+    Each market-data payload becomes an observation (see market_features) and a whole micro-batch of them
+    goes through the policy in one forward pass; every decision is returned in the form the bots execute:
+    {"action": "buy" | "sell" | "hold", "source_wallet": ..., "amount": ...}, with amount 0 for hold.
+    """
+
+    def __init__(self, environment, policy=None, model_dir=None, source_wallet=None, trade_amount=1.0):
+        """
+        :param environment: Trading environment name (e.g. "arbitrage_trading").
+        :param policy: Trained policy (see policy_actions); loaded from <model_dir>/<environment>.zip when omitted.
+        :param model_dir: Directory of trained stable-baselines3 PPO policies (default: $RL_MODEL_DIR or models/rl).
+        :param source_wallet: Wallet traded from when the market data does not name one.
+        :param trade_amount: Amount traded when the market data does not give one.
+        """
+        self.environment = environment
+        self.source_wallet = source_wallet
+        self.trade_amount = trade_amount
+        if policy is None:
+            from stable_baselines3 import PPO
+
+            model_dir = model_dir or os.getenv("RL_MODEL_DIR", os.path.join("models", "rl"))
+            policy = PPO.load(os.path.join(model_dir, f"{environment}.zip"))
+        self.policy = policy
+
+    def decide_actions(self, market_data_batch):
+        """Trade decisions for a batch of market-data payloads, in one forward pass of the policy."""
+        batch = np.stack([market_features(market_data) for market_data in market_data_batch])
+        return [self._decision(market_data, action)
+                for market_data, action in zip(market_data_batch, policy_actions(self.policy, batch))]
+
+    def decide_action(self, market_data):
+        """Trade decision for one market-data payload."""
+        return self.decide_actions([market_data])[0]
+
+    def _decision(self, market_data, action):
+        fields = market_data if isinstance(market_data, Mapping) else {}
+        return {
+            "action": ACTION_NAMES[action],
+            "source_wallet": fields.get("source_wallet", self.source_wallet),
+            "amount": 0.0 if action == HOLD else fields.get("amount", self.trade_amount),
+        }
@@ -0,0 +1,237 @@
+# File: /src/ai/vec_env.py
+
+import numpy as np
+import gymnasium as gym
+from gymnasium import spaces
+
+# Discrete actions, in the same order as the agents' ["buy", "sell", "hold"]
+BUY, SELL, HOLD = 0, 1, 2
+
+
+def target_positions(actions, positions, allow_short=True):
+    """
+    Position after each action: buy goes long (+1), sell goes short (-1, or flat when shorting is not
+    allowed), hold keeps the current position. Vectorized over environments.
+    """
+    actions = np.asarray(actions)
+    sell_position = -1.0 if allow_short else 0.0
+    return np.where(actions == BUY, 1.0, np.where(actions == SELL, sell_position, positions))
+
+
+def pnl_reward(positions, new_positions, prices, next_prices, fee, slippage):
+    """
+    Per-step reward as a fraction of equity: return earned by the new position over the next bar, minus
+    fees and slippage paid on the traded size. Vectorized over environments.
+    """
+    traded = np.abs(new_positions - positions)
+    return new_positions * (next_prices / prices - 1.0) - traded * (fee + slippage)
+
+
+class VectorizedTradingEnv:
+    """
+    N independent trading episodes over one price series, stepped together on NumPy arrays.
+
+    Each environment starts at a random bar and observes the last `window` log returns plus its current
+    position. step() takes one action per environment and returns batched observations, rewards, dones
+    and infos. Finished environments reset automatically, and their final observation goes into
+    info["terminal_observation"] the way stable-baselines3 expects. Use as_sb3_vec_env() to hand it to PPO.
+    """
+
+    def __init__(self, prices, num_envs=8, window=10, episode_length=256, fee=0.001, slippage=0.0005,
+                 allow_short=True, reward_fn=pnl_reward, seed=None):
+        """
+        :param prices: 1D array of prices (any array-like, e.g. a np.memmap of minute closes).
+        :param num_envs: Number of parallel episodes.
+        :param window: Number of past log returns in each observation.
+        :param episode_length: Steps per episode before truncation (None runs to the end of the data).
+        :param fee: Proportional exchange fee per unit traded.
+        :param slippage: Proportional slippage per unit traded.
+        :param allow_short: Whether 'sell' opens a short position or just goes flat.
+        :param reward_fn: Callable(positions, new_positions, prices, next_prices, fee, slippage) -> rewards.
+        :param seed: Optional seed for episode start positions.
+        """
+        self.prices = np.asarray(prices, dtype=np.float64)
+        if self.prices.ndim != 1 or len(self.prices) < window + 2:
+            raise ValueError(f"prices must be a 1D series longer than window + 1 ({window + 1})")
+        self.log_returns = np.diff(np.log(self.prices))
+        self.num_envs = num_envs
+        self.window = window
+        self.episode_length = episode_length
+        self.fee = fee
+        self.slippage = slippage
+        self.allow_short = allow_short
+        self.reward_fn = reward_fn
+        self.rng = np.random.default_rng(seed)
+
+        self.action_space = spaces.Discrete(3)
+        self.observation_space = spaces.Box(low=-np.inf, high=np.inf, shape=(window + 1,), dtype=np.float32)
+        self._offsets = np.arange(-window, 0)
+
+        # t indexes the bar whose close was just observed; the position is held from t to t + 1
+        self.t = np.zeros(num_envs, dtype=np.int64)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.positions = np.zeros(num_envs, dtype=np.float64)
+        self.episode_returns = np.zeros(num_envs, dtype=np.float64)
+
+    def _random_starts(self, count):
+        last_start = len(self.prices) - 2
+        if self.episode_length is not None:
+            last_start = max(self.window, last_start - self.episode_length)
+        return self.rng.integers(self.window, last_start + 1, size=count)
+
+    def _observe(self, env_ids=None):
+        t = self.t if env_ids is None else self.t[env_ids]
+        positions = self.positions if env_ids is None else self.positions[env_ids]
+        obs = np.empty((len(t), self.window + 1), dtype=np.float32)
+        # log_returns[k] is the return from bar k to k + 1, so the window ending at bar t is [t - window, t)
+        obs[:, :-1] = self.log_returns[t[:, None] + self._offsets]
+        obs[:, -1] = positions
+        return obs
+
+    def _reset_envs(self, env_ids):
+        self.t[env_ids] = self._random_starts(len(env_ids))
+        self.steps[env_ids] = 0
+        self.positions[env_ids] = 0.0
+        self.episode_returns[env_ids] = 0.0
+
+    def reset(self, seed=None):
+        """Start new episodes in every environment and return the batched observations."""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset_envs(np.arange(self.num_envs))
+        return self._observe()
+
+    def step(self, actions):
+        """
+        Advance every environment by one bar.
+
+        :param actions: Array of num_envs discrete actions (BUY, SELL, HOLD).
+        :return: (observations, rewards, dones, infos) with auto-reset applied to finished environments.
+        """
+        new_positions = target_positions(actions, self.positions, self.allow_short)
+        rewards = self.reward_fn(self.positions, new_positions, self.prices[self.t], self.prices[self.t + 1],
+                                 self.fee, self.slippage)
+        self.positions = new_positions
+        self.episode_returns += rewards
+        self.t += 1
+        self.steps += 1
+
+        out_of_data = self.t >= len(self.prices) - 1
+        truncated = out_of_data.copy()
+        if self.episode_length is not None:
+            truncated |= self.steps >= self.episode_length
+        obs = self._observe()
+
+        infos = [{} for _ in range(self.num_envs)]
+        done_ids = np.flatnonzero(truncated)
+        for i in done_ids:
+            infos[i] = {
+                "terminal_observation": obs[i].copy(),
+                "TimeLimit.truncated": True,
+                "episode": {"r": float(self.episode_returns[i]), "l": int(self.steps[i])},
+            }
+        if len(done_ids):
+            self._reset_envs(done_ids)
+            obs[done_ids] = self._observe(done_ids)
+        return obs, rewards.astype(np.float32), truncated, infos
+
+    def as_sb3_vec_env(self):
+        """Wrap this environment as a stable-baselines3 VecEnv (e.g. PPO('MlpPolicy', env.as_sb3_vec_env()))."""
+        return _sb3_adapter_class()(self)
+
+
+class SingleTradingEnv(gym.Env):
+    """Gymnasium view of a one-episode VectorizedTradingEnv, for process-parallel vector envs."""
+
+    def __init__(self, prices, **options):
+        super().__init__()
+        self.vec_env = VectorizedTradingEnv(prices, num_envs=1, **options)
+        self.action_space = self.vec_env.action_space
+        self.observation_space = self.vec_env.observation_space
+
+    def reset(self, seed=None, options=None):
+        return self.vec_env.reset(seed)[0], {}
+
+    def step(self, action):
+        obs, rewards, dones, infos = self.vec_env.step(np.array([action]))
+        if dones[0]:
+            # Gymnasium semantics: report the final observation and let the caller reset
+            return infos[0]["terminal_observation"], float(rewards[0]), False, True, {}
+        return obs[0], float(rewards[0]), False, False, {}
+
+
+def make_vec_env(prices, num_envs=8, parallel=False, start_method=None, **options):
+    """
+    Build a stable-baselines3 VecEnv of trading episodes.
+
+    :param prices: 1D price array shared by all environments.
+    :param num_envs: Number of environments.
+    :param parallel: False steps all environments in-process on NumPy arrays (fastest for cheap rewards);
+                     True runs one SingleTradingEnv per worker process via SubprocVecEnv, for CPU-heavy
+                     reward functions (reward_fn must then be a picklable module-level function).
+    :param start_method: multiprocessing start method for SubprocVecEnv.
+    :param options: Passed to VectorizedTradingEnv (window, episode_length, fee, slippage, reward_fn, ...).
+    """
+    if not parallel:
+        return VectorizedTradingEnv(prices, num_envs=num_envs, **options).as_sb3_vec_env()
+
+    from functools import partial
+    from stable_baselines3.common.vec_env import SubprocVecEnv
+
+    base_seed = options.pop("seed", None)
+    env_fns = [
+        partial(SingleTradingEnv, prices, seed=None if base_seed is None else base_seed + i, **options)
+        for i in range(num_envs)
+    ]
+    return SubprocVecEnv(env_fns, start_method=start_method)
+
+
+_adapter_class = None
+
+
+def _sb3_adapter_class():
+    """Defined lazily so this module does not require stable-baselines3 unless it is used."""
+    global _adapter_class
+    if _adapter_class is not None:
+        return _adapter_class
+
+    from stable_baselines3.common.vec_env import VecEnv
+
+    class VectorizedTradingVecEnv(VecEnv):
+        def __init__(self, env):
+            self.env = env
+            self._actions = None
+            super().__init__(env.num_envs, env.observation_space, env.action_space)
+
+        def reset(self):
+            # Like VecEnv.reset: a seed set with seed() applies to the next reset only.
+            seeds = getattr(self, "_seeds", None)
+            obs = self.env.reset(seeds[0] if seeds else None)
+            if seeds:
+                self._reset_seeds()
+            return obs
+
+        def step_async(self, actions):
+            self._actions = actions
+
+        def step_wait(self):
+            return self.env.step(self._actions)
+
+        def close(self):
+            pass
+
+        def get_attr(self, attr_name, indices=None):
+            return [getattr(self.env, attr_name)] * len(self._get_indices(indices))
+
+        def set_attr(self, attr_name, value, indices=None):
+            setattr(self.env, attr_name, value)
+
+        def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+            result = getattr(self.env, method_name)(*method_args, **method_kwargs)
+            return [result] * len(self._get_indices(indices))
+
+        def env_is_wrapped(self, wrapper_class, indices=None):
+            return [False] * len(self._get_indices(indices))
+
+    _adapter_class = VectorizedTradingVecEnv
+    return _adapter_class
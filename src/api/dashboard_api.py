@@ -1,7 +1,7 @@
 from flask import Flask, jsonify, request, redirect, url_for, render_template
 from flask_login import LoginManager, login_required, login_user, logout_user, current_user, UserMixin
-import mysql.connector
 from mysql.connector import Error
+from src.database.connection_pool import get_pool
 import subprocess  # To control bot processes
 import os
 
@@ -45,15 +45,17 @@ def logout():
     return redirect(url_for('login'))
 
 # MySQL Database Connection Function
+DB_CONFIG = {
+    "host": "your_host",
+    "user": "your_user",
+    "password": "your_password",
+    "database": "your_db"
+}
+
 def connect_db():
-    """Establishes a connection to the MySQL database."""
+    """Checks a connection out of the shared MySQL pool; connection.close() returns it to the pool."""
     try:
-        connection = mysql.connector.connect(
-            host="your_host",
-            user="your_user",
-            password="your_password",
-            database="your_db"
-        )
+        connection = get_pool(DB_CONFIG).acquire()
         return connection
     except Error as e:
         print(f"Error connecting to MySQL: {e}")
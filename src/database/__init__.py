@@ -1,6 +1,14 @@
 # File: /src/database/__init__.py
 
-import mysql.connector
+from src.database.connection_pool import get_pool
+
+# Connection settings for the greenlist tables; connections come from the shared pool
+GREENLIST_DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "password",
+    "database": "crypto_db"
+}
 
 def insert_greenlist_log(wallet_address, action, timestamp):
     """
@@ -11,18 +19,12 @@ def insert_greenlist_log(wallet_address, action, timestamp):
     :param timestamp: The time of the action.
     """
     # Code to insert the log into MySQL database
-    connection = mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="password",
-        database="crypto_db"
-    )
-    cursor = connection.cursor()
-    query = "INSERT INTO greenlist_logs (wallet_address, action, timestamp) VALUES (%s, %s, %s)"
-    cursor.execute(query, (wallet_address, action, timestamp))
-    connection.commit()
-    cursor.close()
-    connection.close()
+    with get_pool(GREENLIST_DB_CONFIG).connection() as connection:
+        cursor = connection.cursor()
+        query = "INSERT INTO greenlist_logs (wallet_address, action, timestamp) VALUES (%s, %s, %s)"
+        cursor.execute(query, (wallet_address, action, timestamp))
+        connection.commit()
+        cursor.close()
 
 def get_greenlist():
     """
@@ -30,17 +32,11 @@ def get_greenlist():
     
     :return: A list of wallet addresses that are currently greenlisted.
     """
-    connection = mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="password",
-        database="crypto_db"
-    )
-    cursor = connection.cursor()
-    cursor.execute("SELECT wallet_address FROM greenlist")
-    result = cursor.fetchall()
-    cursor.close()
-    connection.close()
+    with get_pool(GREENLIST_DB_CONFIG).connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT wallet_address FROM greenlist")
+        result = cursor.fetchall()
+        cursor.close()
     
     return [row[0] for row in result]
 
@@ -50,18 +46,12 @@ def add_to_greenlist(wallet_address):
     
     :param wallet_address: The wallet address to be added.
     """
-    connection = mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="password",
-        database="crypto_db"
-    )
-    cursor = connection.cursor()
-    query = "INSERT INTO greenlist (wallet_address) VALUES (%s)"
-    cursor.execute(query, (wallet_address,))
-    connection.commit()
-    cursor.close()
-    connection.close()
+    with get_pool(GREENLIST_DB_CONFIG).connection() as connection:
+        cursor = connection.cursor()
+        query = "INSERT INTO greenlist (wallet_address) VALUES (%s)"
+        cursor.execute(query, (wallet_address,))
+        connection.commit()
+        cursor.close()
 
 def remove_from_greenlist(wallet_address):
     """
@@ -69,15 +59,9 @@ def remove_from_greenlist(wallet_address):
     
     :param wallet_address: The wallet address to be removed.
     """
-    connection = mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="password",
-        database="crypto_db"
-    )
-    cursor = connection.cursor()
-    query = "DELETE FROM greenlist WHERE wallet_address = %s"
-    cursor.execute(query, (wallet_address,))
-    connection.commit()
-    cursor.close()
-    connection.close()
+    with get_pool(GREENLIST_DB_CONFIG).connection() as connection:
+        cursor = connection.cursor()
+        query = "DELETE FROM greenlist WHERE wallet_address = %s"
+        cursor.execute(query, (wallet_address,))
+        connection.commit()
+        cursor.close()
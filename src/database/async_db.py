@@ -0,0 +1,127 @@
+# File: /src/database/async_db.py
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.database.connection_pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabase:
+    """
+    Asyncio facade over the shared MySQL connection pool for the async bots and managers.
+    mysql.connector is blocking, so every statement runs on a dedicated thread pool sized to the connection
+    pool; coroutines await the result and the event loop keeps running while MySQL does the work.
+    """
+
+    def __init__(self, pool=None, max_workers=None):
+        """
+        Initialize the facade.
+
+        :param pool: ConnectionPool to borrow connections from; defaults to the shared MYSQL_* pool.
+        :param max_workers: Executor threads; defaults to the pool size so workers never queue on the pool.
+        """
+        self.pool = pool or get_pool()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.pool.max_size, thread_name_prefix="async-db"
+        )
+
+    # --- Coroutine API ---
+    async def execute(self, query, params=None):
+        """Run a write statement and commit it. Returns the affected row count."""
+        return await self._run(self._execute, query, params)
+
+    async def executemany(self, query, rows):
+        """Run a write statement for many parameter rows in one round trip and commit. Returns the row count."""
+        return await self._run(self._executemany, query, rows)
+
+    async def fetchone(self, query, params=None):
+        """Run a query and return its first row (or None)."""
+        return await self._run(self._fetch, query, params, False)
+
+    async def fetchall(self, query, params=None):
+        """Run a query and return all rows."""
+        return await self._run(self._fetch, query, params, True)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        """Run any other blocking DB helper (e.g. a DatabaseManager method) on the DB executor."""
+        return await self._run(fn, *args, **kwargs)
+
+    # --- Fire-and-forget ---
+    def submit(self, query, params=None):
+        """
+        Schedule a write without waiting for it, for callers that must not block (e.g. logging from a
+        synchronous function running inside the event loop). Failures are logged.
+        """
+        future = self._executor.submit(self._execute, query, params)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def close(self, wait=True):
+        """Shut the executor down, by default waiting for in-flight statements."""
+        self._executor.shutdown(wait=wait)
+
+    # --- Blocking workers (executor threads) ---
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def _execute(self, query, params):
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                connection.commit()
+                return cursor.rowcount
+            finally:
+                cursor.close()
+
+    def _executemany(self, query, rows):
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany(query, rows)
+                connection.commit()
+                return cursor.rowcount
+            finally:
+                cursor.close()
+
+    def _fetch(self, query, params, fetch_all):
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchall() if fetch_all else cursor.fetchone()
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _log_failure(future):
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Background MySQL write failed: {exc}")
+
+
+_async_db = None
+_async_db_lock = threading.Lock()
+
+
+def get_async_db():
+    """Return the process-wide AsyncDatabase over the shared MYSQL_* pool."""
+    global _async_db
+    with _async_db_lock:
+        if _async_db is None:
+            _async_db = AsyncDatabase()
+        return _async_db
+
+
+def in_event_loop():
+    """True when called from code running inside an asyncio event loop thread."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
@@ -0,0 +1,279 @@
+# File: /src/database/connection_pool.py
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+import mysql.connector
+from mysql.connector import Error
+from dotenv import load_dotenv
+
+# Load environment variables for DB credentials and pool sizing
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Error):
+    """Raised when no pooled connection becomes available within the checkout timeout."""
+
+
+class PooledConnection:
+    """
+    Proxy around a pooled MySQL connection. Behaves like the underlying connection, except that close()
+    (or leaving a `with` block) hands the connection back to the pool instead of tearing it down.
+    """
+
+    def __init__(self, pool, raw, created_at):
+        self._pool = pool
+        self._raw = raw
+        self.created_at = created_at
+        self.last_used = time.monotonic()
+        self._checked_out = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def close(self):
+        """Return the connection to the pool."""
+        if self._checked_out:
+            self._pool.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe MySQL connection pool.
+    Connections are health-checked when they have been idle longer than health_check_interval, recycled once
+    they are older than max_lifetime, and checkouts wait at most checkout_timeout seconds before raising
+    PoolTimeoutError, so a saturated database surfaces as an error instead of an unbounded pile-up.
+    """
+
+    def __init__(self, db_config, max_size=5, checkout_timeout=5.0, max_lifetime=1800.0,
+                 health_check_interval=30.0, connect=None):
+        """
+        Initialize the pool. Connections are opened lazily, up to max_size.
+
+        :param db_config: Connection arguments (host, user, password, database, ...).
+        :param max_size: Maximum number of open connections held by this pool.
+        :param checkout_timeout: Seconds to wait for a free connection before raising PoolTimeoutError.
+        :param max_lifetime: Seconds after which a connection is closed and replaced.
+        :param health_check_interval: Idle seconds after which a connection is pinged before reuse.
+        :param connect: Connection factory, defaults to mysql.connector.connect.
+        """
+        self.db_config = dict(db_config)
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._connect = connect or mysql.connector.connect
+
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self.checkouts = 0
+        self.connects = 0
+        self.recycled = 0
+        self.failed_health_checks = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+
+    def acquire(self, timeout=None):
+        """
+        Check a connection out of the pool, opening a new one if the pool is below max_size.
+
+        :param timeout: Overrides checkout_timeout for this call.
+        :return: A PooledConnection; close it (or use it as a context manager) to return it.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise Error("Connection pool is closed.")
+                    if self._idle:
+                        conn = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        conn = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise PoolTimeoutError(
+                            f"No MySQL connection available within {timeout}s (pool size {self.max_size})."
+                        )
+                    self._condition.wait(remaining)
+
+            # Connecting and pinging happen outside the lock so other threads are not serialised behind them
+            if conn is None:
+                conn = self._open()
+            elif not self._is_usable(conn):
+                self._discard(conn)
+                continue
+
+            conn._checked_out = True
+            conn.last_used = time.monotonic()
+            self.checkouts += 1
+            self.total_wait += conn.last_used - started
+            return conn
+
+    # A pooled connection is its own context manager, so `with pool.connection() as conn:` reads naturally
+    connection = acquire
+
+    def release(self, conn):
+        """Return a checked-out connection to the pool, rolling back any uncommitted transaction."""
+        conn._checked_out = False
+        conn.last_used = time.monotonic()
+        try:
+            if getattr(conn._raw, "in_transaction", False):
+                conn._raw.rollback()
+        except Error as e:
+            logger.warning(f"Discarding pooled connection after failed rollback: {e}")
+            self._discard(conn)
+            return
+
+        if self._closed or self._expired(conn):
+            self._discard(conn)
+            return
+
+        with self._condition:
+            self._idle.append(conn)
+            self._condition.notify()
+
+    def close(self):
+        """Close all idle connections and refuse further checkouts; checked-out connections close on release."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._condition.notify_all()
+        for conn in idle:
+            self._discard(conn)
+        logger.info("MySQL connection pool closed.")
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def stats(self):
+        """Pool utilisation metrics."""
+        with self._condition:
+            idle = len(self._idle)
+            size = self._size
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "max_size": self.max_size,
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "recycled": self.recycled,
+            "failed_health_checks": self.failed_health_checks,
+            "timeouts": self.timeouts,
+            "avg_wait_seconds": self.total_wait / self.checkouts if self.checkouts else 0.0,
+        }
+
+    def _open(self):
+        try:
+            raw = self._connect(**self.db_config)
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        self.connects += 1
+        return PooledConnection(self, raw, time.monotonic())
+
+    def _expired(self, conn):
+        return self.max_lifetime is not None and time.monotonic() - conn.created_at >= self.max_lifetime
+
+    def _is_usable(self, conn):
+        if self._expired(conn):
+            self.recycled += 1
+            return False
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return True
+        try:
+            if conn._raw.is_connected():
+                return True
+        except Error:
+            pass
+        self.failed_health_checks += 1
+        return False
+
+    def _discard(self, conn):
+        try:
+            conn._raw.close()
+        except Error as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+
+def env_db_config():
+    """MySQL connection arguments from the MYSQL_* environment variables."""
+    return {
+        "host": os.getenv("MYSQL_HOST"),
+        "user": os.getenv("MYSQL_USER"),
+        "password": os.getenv("MYSQL_PASSWORD"),
+        "database": os.getenv("MYSQL_DATABASE"),
+    }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_config=None, **options):
+    """
+    Return the process-wide pool for a database configuration, creating it on first use.
+    Pool sizing defaults come from MYSQL_POOL_SIZE, MYSQL_POOL_TIMEOUT and MYSQL_POOL_MAX_LIFETIME; keep
+    MYSQL_POOL_SIZE x replicas below the server's max_connections.
+
+    :param db_config: Connection arguments; defaults to env_db_config().
+    :param options: ConnectionPool keyword arguments, used only when the pool is created.
+    """
+    db_config = env_db_config() if db_config is None else db_config
+    key = tuple(sorted((k, str(v)) for k, v in db_config.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            options.setdefault("max_size", int(os.getenv("MYSQL_POOL_SIZE", "5")))
+            options.setdefault("checkout_timeout", float(os.getenv("MYSQL_POOL_TIMEOUT", "5")))
+            options.setdefault("max_lifetime", float(os.getenv("MYSQL_POOL_MAX_LIFETIME", "1800")))
+            pool = ConnectionPool(db_config, **options)
+            if not _pools:
+                # Registered before any write-behind queue using the pool, so it runs after (LIFO) they flush
+                atexit.register(close_all_pools)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools():
+    """
+    Close every process-wide pool; registered with atexit when get_pool() creates the first pool. Pools
+    returned by get_pool() are shared by every component of the process, so individual components
+    release only their own resources and leave closing the pools to this function.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        atexit.unregister(close_all_pools)
+    for pool in pools:
+        if not pool.closed:
+            pool.close()
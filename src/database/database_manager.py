@@ -1,10 +1,11 @@
 # File: /src/database/database_manager.py
 
-import mysql.connector
 import logging
+import os
 from mysql.connector import Error
 from dotenv import load_dotenv
-import os
+from src.database.connection_pool import get_pool
+from src.database.trade_writer import TradeWriteBehindQueue
 
 # Load environment variables for DB credentials
 load_dotenv()
@@ -18,46 +19,70 @@ class DatabaseManager:
     and trade logging for the trading bots.
     """
 
-    def __init__(self):
-        """Initializes the DatabaseManager with the MySQL configuration."""
-        self.connection = self.connect_db()
+    def __init__(self, pool=None, write_behind=None, **write_behind_options):
+        """
+        Initializes the DatabaseManager with the shared MySQL connection pool.
 
-    def connect_db(self):
-        """Connect to the MySQL database using environment variables."""
-        try:
-            return mysql.connector.connect(
-                host=os.getenv("MYSQL_HOST"),
-                user=os.getenv("MYSQL_USER"),
-                password=os.getenv("MYSQL_PASSWORD"),
-                database=os.getenv("MYSQL_DATABASE")
-            )
-        except Error as e:
-            logger.error(f"Error connecting to MySQL: {e}")
-            raise
+        :param pool: Connection pool to use; defaults to the shared pool for the MYSQL_* settings.
+        :param write_behind: Queue trades and flush them in batches from a background worker instead of
+                             writing each one synchronously. Defaults to the TRADE_WRITE_BEHIND env flag.
+        :param write_behind_options: Extra TradeWriteBehindQueue arguments (batch_size, flush_interval, ...).
+        """
+        self.pool = pool or get_pool()
+        if write_behind is None:
+            write_behind = os.getenv("TRADE_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+        self.trade_writer = TradeWriteBehindQueue(self.pool.connection, **write_behind_options) if write_behind else None
+
+    def get_connection(self):
+        """
+        Check a connection out of the shared pool.
+        Callers must close() it (or use it in a `with` block) to hand it back.
+        """
+        return self.pool.acquire()
+
+    def connection(self):
+        """Context manager yielding a pooled connection."""
+        return self.pool.connection()
 
     def close_connection(self):
-        """Closes the MySQL connection."""
-        if self.connection.is_connected():
-            self.connection.close()
-            logger.info("MySQL connection closed.")
+        """
+        Flushes any queued trades and stops this manager's write-behind worker. The pool is shared with
+        the rest of the process and stays open; close_all_pools() shuts it down at process exit.
+        """
+        if self.trade_writer is not None:
+            self.trade_writer.close()
 
     def log_trade(self, trade_data):
         """
         Logs trade data to the MySQL database.
+        In write-behind mode the row is queued and this returns without touching MySQL.
         """
+        if self.trade_writer is not None:
+            self.trade_writer.submit(
+                (trade_data['symbol'], trade_data['action'], trade_data['size'], trade_data['price'], trade_data['timestamp'])
+            )
+            return
+
         query = """
         INSERT INTO trades (symbol, trade_action, trade_size, price, timestamp)
         VALUES (%s, %s, %s, %s, %s)
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, (trade_data['symbol'], trade_data['action'], trade_data['size'], trade_data['price'], trade_data['timestamp']))
-            self.connection.commit()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, (trade_data['symbol'], trade_data['action'], trade_data['size'], trade_data['price'], trade_data['timestamp']))
+                    connection.commit()
+                finally:
+                    cursor.close()
             logger.info(f"Trade logged: {trade_data}")
         except Error as e:
             logger.error(f"Error logging trade: {e}")
-        finally:
-            cursor.close()
+
+    def flush_trades(self, timeout=None):
+        """Blocks until every queued trade has been written (no-op without write-behind)."""
+        if self.trade_writer is not None:
+            self.trade_writer.flush(timeout)
 
     def fetch_list(self, list_type):
         """
@@ -65,10 +90,11 @@ class DatabaseManager:
         """
         query = f"SELECT * FROM {list_type}"
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query)
-            result = cursor.fetchall()
-            cursor.close()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(query)
+                result = cursor.fetchall()
+                cursor.close()
             return result
         except Error as e:
             logger.error(f"Error fetching {list_type}: {e}")
@@ -80,14 +106,16 @@ class DatabaseManager:
         """
         query = f"INSERT INTO {list_type} (token_address, additional_data) VALUES (%s, %s)"
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, (token_address, additional_data))
-            self.connection.commit()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, (token_address, additional_data))
+                    connection.commit()
+                finally:
+                    cursor.close()
             logger.info(f"Added {token_address} to {list_type}.")
         except Error as e:
             logger.error(f"Error adding to {list_type}: {e}")
-        finally:
-            cursor.close()
 
     def remove_from_list(self, list_type, token_address):
         """
@@ -95,11 +123,13 @@ class DatabaseManager:
         """
         query = f"DELETE FROM {list_type} WHERE token_address = %s"
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, (token_address,))
-            self.connection.commit()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, (token_address,))
+                    connection.commit()
+                finally:
+                    cursor.close()
             logger.info(f"Removed {token_address} from {list_type}.")
         except Error as e:
             logger.error(f"Error removing from {list_type}: {e}")
-        finally:
-            cursor.close()
@@ -0,0 +1,280 @@
+# File: /src/database/list_index.py
+
+import logging
+import threading
+import time
+from mysql.connector import Error
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LISTS = ("whitelist", "blacklist", "redlist", "pumplist")
+
+
+class ListIndex:
+    """
+    In-process, set-backed membership index for the token lists (whitelist, blacklist, redlist, pumplist).
+    Each list is loaded once into a Python set so lookups are O(1) and never touch MySQL. The index is
+    kept current by polling the `list_changes` table, which the list triggers in mysql_setup.py append to
+    on every INSERT/DELETE, so writes made by other processes (dashboard, other bots) are picked up too.
+
+    AUTO_INCREMENT ids are allocated at insert time but only become visible at commit, so a change can
+    appear below the watermark after a higher id was already read. Ids skipped by the feed are kept as
+    gaps and re-polled until they show up or `gap_timeout` passes (the id was rolled back).
+    """
+
+    def __init__(self, connection_provider, list_names=DEFAULT_LISTS, refresh_interval=5.0,
+                 change_batch_size=1000, gap_timeout=60.0, max_gaps=10000):
+        """
+        Initialize the index.
+
+        :param connection_provider: Zero-argument callable returning a MySQL connection usable as a context
+                                    manager that releases it on exit, e.g. ConnectionPool.connection.
+        :param list_names: The list tables to index.
+        :param refresh_interval: Seconds between change-feed polls.
+        :param change_batch_size: Maximum number of change rows applied per poll query.
+        :param gap_timeout: Seconds a skipped change id is re-polled before it is assumed rolled back.
+        :param max_gaps: Skipped ids tracked at most; beyond that the next refresh does a full reload.
+        """
+        self.connection_provider = connection_provider
+        self.list_names = tuple(list_names)
+        self.refresh_interval = refresh_interval
+        self.change_batch_size = change_batch_size
+        self.gap_timeout = gap_timeout
+        self.max_gaps = max_gaps
+
+        self._members = {name: set() for name in self.list_names}
+        self._last_change_id = 0
+        self._gaps = {}  # Change id skipped by the feed -> monotonic time it was first missed
+        self._loaded = False
+        self._has_change_feed = True
+        self._last_sync = None
+        self._next_sync = 0.0
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+        self._stop_event = threading.Event()
+
+        self.hits = 0
+        self.misses = 0
+        self.full_reloads = 0
+        self.change_polls = 0
+        self.changes_applied = 0
+        self.late_changes = 0
+        self.sync_errors = 0
+
+    # --- Lookups ---
+    def contains(self, list_name, token_address):
+        """
+        Check whether a token is on a list, refreshing from the change feed first if the index is due.
+        Runs in O(1) against the in-memory set.
+        """
+        if self._refresh_thread is None and self._is_due():
+            self.refresh()
+
+        found = token_address in self._members[list_name]
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+    def members(self, list_name):
+        """Return a frozen snapshot of a list's members."""
+        return frozenset(self._members[list_name])
+
+    # --- Synchronisation ---
+    def load(self):
+        """
+        Fully (re)load every list from the database.
+        The change-feed watermark is read before the lists so that changes landing mid-load are replayed.
+        """
+        with self.connection_provider() as connection:
+            cursor = connection.cursor()
+            try:
+                last_change_id = self._read_watermark(cursor)
+                gaps = self._read_recent_gaps(cursor, last_change_id) if last_change_id else {}
+                members = {}
+                for list_name in self.list_names:
+                    cursor.execute(f"SELECT token_address FROM {list_name}")
+                    members[list_name] = {row[0] for row in cursor.fetchall()}
+            finally:
+                cursor.close()
+
+        with self._lock:
+            self._members = members
+            self._has_change_feed = last_change_id is not None
+            self._last_change_id = last_change_id or 0
+            self._gaps = gaps
+            self._loaded = True
+            self.full_reloads += 1
+        self._mark_synced()
+        logger.info(f"List index loaded: {self.sizes()}")
+
+    def refresh(self):
+        """
+        Apply any new rows from the change feed. Falls back to a full reload if nothing has been loaded yet
+        or the change feed table does not exist.
+        Errors are logged and counted; the index keeps serving its last known state.
+        """
+        try:
+            if not self._loaded or not self._has_change_feed:
+                self.load()
+            else:
+                self._poll_changes()
+        except Error as e:
+            self.sync_errors += 1
+            # Back off for a full interval rather than retrying on every lookup
+            self._next_sync = time.monotonic() + self.refresh_interval
+            logger.error(f"Error refreshing list index: {e}")
+
+    def _poll_changes(self):
+        """Re-poll skipped change ids, then read and apply change-feed rows newer than the current watermark."""
+        with self.connection_provider() as connection:
+            cursor = connection.cursor()
+            try:
+                if self._gaps:
+                    self._poll_gaps(cursor)
+                while True:
+                    cursor.execute(
+                        "SELECT id, list_name, token_address, operation FROM list_changes "
+                        "WHERE id > %s ORDER BY id LIMIT %s",
+                        (self._last_change_id, self.change_batch_size)
+                    )
+                    rows = cursor.fetchall()
+                    with self._lock:
+                        for change_id, list_name, token_address, operation in rows:
+                            self._add_gaps(range(self._last_change_id + 1, change_id))
+                            self._apply(list_name, token_address, operation == "insert")
+                            self._last_change_id = change_id
+                        self.changes_applied += len(rows)
+                    if len(rows) < self.change_batch_size:
+                        break
+            finally:
+                cursor.close()
+
+        if len(self._gaps) > self.max_gaps:
+            logger.warning(f"{len(self._gaps)} change ids missing from the list feed; scheduling a full reload")
+            self._loaded = False
+        self.change_polls += 1
+        self._mark_synced()
+
+    def _add_gaps(self, change_ids):
+        now = time.monotonic()
+        for change_id in change_ids:
+            self._gaps.setdefault(change_id, now)
+
+    def _poll_gaps(self, cursor):
+        """Apply changes that became visible below the watermark and forget gaps older than gap_timeout."""
+        now = time.monotonic()
+        with self._lock:
+            for change_id in [i for i, missed_at in self._gaps.items() if now - missed_at > self.gap_timeout]:
+                del self._gaps[change_id]
+            gap_ids = sorted(self._gaps)
+        for start in range(0, len(gap_ids), self.change_batch_size):
+            chunk = gap_ids[start:start + self.change_batch_size]
+            cursor.execute(
+                "SELECT id, list_name, token_address, operation FROM list_changes "
+                f"WHERE id IN ({', '.join(['%s'] * len(chunk))}) ORDER BY id",
+                tuple(chunk)
+            )
+            rows = cursor.fetchall()
+            with self._lock:
+                for change_id, list_name, token_address, operation in rows:
+                    self._apply(list_name, token_address, operation == "insert")
+                    self._gaps.pop(change_id, None)
+                self.changes_applied += len(rows)
+                self.late_changes += len(rows)
+
+    def _read_recent_gaps(self, cursor, last_change_id):
+        """Ids missing from the last change_batch_size ids below the watermark (changes still uncommitted)."""
+        first = max(1, last_change_id - self.change_batch_size + 1)
+        cursor.execute("SELECT id FROM list_changes WHERE id >= %s AND id <= %s", (first, last_change_id))
+        present = {row[0] for row in cursor.fetchall()}
+        now = time.monotonic()
+        return {change_id: now for change_id in range(first, last_change_id + 1) if change_id not in present}
+
+    def record_change(self, list_name, token_address, present):
+        """
+        Write-through hook for local writers, so a process sees its own list updates immediately
+        instead of waiting for the next change-feed poll.
+        """
+        with self._lock:
+            self._apply(list_name, token_address, present)
+
+    def _apply(self, list_name, token_address, present):
+        members = self._members.get(list_name)
+        if members is None:
+            return
+        if present:
+            members.add(token_address)
+        else:
+            members.discard(token_address)
+
+    def _read_watermark(self, cursor):
+        try:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM list_changes")
+            row = cursor.fetchone()
+            return row[0] if row else 0
+        except Error as e:
+            logger.warning(f"list_changes feed unavailable, index will rely on full reloads: {e}")
+            return None
+
+    def _mark_synced(self):
+        self._last_sync = time.monotonic()
+        self._next_sync = self._last_sync + self.refresh_interval
+
+    def _is_due(self):
+        return time.monotonic() >= self._next_sync
+
+    # --- Background refresh ---
+    def start(self):
+        """
+        Start a daemon thread that polls the change feed every refresh_interval seconds, taking the poll
+        off the lookup path entirely.
+        """
+        if self._refresh_thread is not None:
+            return
+        if not self._loaded:
+            self.refresh()
+        self._stop_event.clear()
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, name="list-index-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        if self._refresh_thread is None:
+            return
+        self._stop_event.set()
+        self._refresh_thread.join()
+        self._refresh_thread = None
+
+    def _refresh_loop(self):
+        while not self._stop_event.wait(self.refresh_interval):
+            self.refresh()
+
+    # --- Metrics ---
+    def staleness(self):
+        """Seconds since the index last synchronised with the database (None if never loaded)."""
+        if self._last_sync is None:
+            return None
+        return time.monotonic() - self._last_sync
+
+    def sizes(self):
+        """Number of members per list."""
+        return {name: len(members) for name, members in self._members.items()}
+
+    def stats(self):
+        """Lookup and synchronisation metrics for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "staleness_seconds": self.staleness(),
+            "full_reloads": self.full_reloads,
+            "change_polls": self.change_polls,
+            "changes_applied": self.changes_applied,
+            "late_changes": self.late_changes,
+            "pending_gaps": len(self._gaps),
+            "sync_errors": self.sync_errors,
+            "sizes": self.sizes(),
+        }
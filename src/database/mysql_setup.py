@@ -142,6 +142,29 @@ def create_tables(cursor):
         """)
         logging.info("Table 'pumplist' created successfully.")
 
+        # Create 'list_changes' change feed, polled by ListIndex to keep in-memory list lookups current
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS list_changes (
+                id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                list_name VARCHAR(50),
+                token_address VARCHAR(255),
+                operation VARCHAR(10), -- 'insert' or 'delete'
+                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        logging.info("Table 'list_changes' created successfully.")
+
+        # Triggers so every writer (bots, dashboard, manual SQL) feeds list_changes
+        for list_name in ("whitelist", "blacklist", "redlist", "pumplist"):
+            for operation, row in (("insert", "NEW"), ("delete", "OLD")):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {list_name}_after_{operation}
+                    AFTER {operation.upper()} ON {list_name} FOR EACH ROW
+                    INSERT INTO list_changes (list_name, token_address, operation)
+                    VALUES ('{list_name}', {row}.token_address, '{operation}');
+                """)
+        logging.info("List change feed triggers created successfully.")
+
         # Create 'logs' table
         cursor.execute("""CREATE TABLE logs (
                 id INT AUTO_INCREMENT PRIMARY KEY,
@@ -0,0 +1,254 @@
+# File: /src/database/trade_writer.py
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+TRADE_COLUMNS = ("symbol", "trade_action", "trade_size", "price", "timestamp")
+
+_STOP = object()
+
+# One lock per spill file, shared by every writer in the process that spills to it
+_spill_locks = {}
+_spill_locks_lock = threading.Lock()
+
+
+def _spill_lock_for(path):
+    key = os.path.abspath(path)
+    with _spill_locks_lock:
+        return _spill_locks.setdefault(key, threading.Lock())
+
+
+class TradeWriteBehindQueue:
+    """
+    Write-behind buffer for trade rows. Producers enqueue rows and return immediately; a background worker
+    flushes them with a single executemany + COMMIT whenever batch_size rows are waiting or flush_interval
+    seconds have passed since the oldest unflushed row.
+
+    Memory is bounded by max_queue: when the queue is full, submit() blocks (backpressure) for up to
+    put_timeout seconds and then spills the row to disk instead of dropping it. Batches that fail to write
+    are appended to the spill file and replayed on the next successful flush, giving at-least-once delivery
+    while MySQL is unavailable. close() (also registered with atexit) drains everything before returning.
+    """
+
+    def __init__(self, connection_provider, batch_size=500, flush_interval=1.0, max_queue=10000,
+                 put_timeout=5.0, spill_path="logs/trade_spill.jsonl", placeholder="%s", table="trades"):
+        """
+        Initialize the queue and start the background writer.
+
+        :param connection_provider: Zero-argument callable returning a connection usable as a context manager
+                                    (e.g. ConnectionPool.connection, or a sqlite3 connection in tests).
+        :param batch_size: Rows per executemany.
+        :param flush_interval: Maximum seconds a row waits before being flushed.
+        :param max_queue: Maximum number of rows buffered in memory.
+        :param put_timeout: Seconds submit() blocks on a full queue before spilling to disk (None blocks forever).
+        :param spill_path: JSON-lines file holding rows that could not be written to the database.
+        :param placeholder: DB-API parameter marker ('%s' for MySQL, '?' for SQLite).
+        :param table: Target table.
+        """
+        self.connection_provider = connection_provider
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.spill_path = spill_path
+        self.query = (
+            f"INSERT INTO {table} ({', '.join(TRADE_COLUMNS)}) "
+            f"VALUES ({', '.join([placeholder] * len(TRADE_COLUMNS))})"
+        )
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._spill_lock = _spill_lock_for(spill_path)  # Writers sharing a spill file must not replay it concurrently
+        self._close_lock = threading.Lock()  # Orders rows and flush requests against the stop request
+        self._closed = False
+
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.write_errors = 0
+
+        self._worker = threading.Thread(target=self._run, name="trade-write-behind", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def submit(self, row):
+        """
+        Queue a trade row (a tuple in TRADE_COLUMNS order) for writing.
+
+        :return: True if queued, False if the queue stayed full for put_timeout and the row was spilled to disk.
+        """
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("TradeWriteBehindQueue is closed.")
+            self.submitted += 1
+            try:
+                self._queue.put(row, timeout=self.put_timeout)
+                return True
+            except queue.Full:
+                pass
+        logger.warning("Trade write-behind queue full; spilling row to disk.")
+        self._spill([row])
+        return False
+
+    def flush(self, timeout=None):
+        """
+        Block until every row submitted so far has been written (or spilled).
+
+        :return: True if done within `timeout`. After close() this only waits for the worker to finish draining.
+        """
+        with self._close_lock:
+            done = None if self._closed else threading.Event()
+            if done is not None:
+                self._queue.put(done)
+        if done is None:
+            self._worker.join(timeout)
+            return not self._worker.is_alive()
+        return done.wait(timeout)
+
+    def close(self, timeout=30.0):
+        """Flush outstanding rows and stop the worker. Safe to call more than once."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join(timeout)
+        atexit.unregister(self.close)
+
+    def pending(self):
+        """Approximate number of rows waiting in memory."""
+        return self._queue.qsize()
+
+    def stats(self):
+        """Throughput and durability counters."""
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "batches": self.batches,
+            "pending": self.pending(),
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "write_errors": self.write_errors,
+        }
+
+    # --- Worker ---
+    def _run(self):
+        batch = []
+        deadline = None
+        control = None
+        while True:
+            if control is None:
+                timeout = self.flush_interval if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if item is not None and not self._is_control(item):
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    batch.append(item)
+                    control = self._drain_into(batch, limit=self.batch_size)
+                elif item is not None:
+                    control = item
+
+            if control is not None:
+                # Every row queued ahead of a flush/stop request is already in the batch
+                self._write(batch)
+                batch, deadline = [], None
+                if control is _STOP:
+                    return
+                control.set()
+                control = None
+            elif batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch, deadline = [], None
+            elif not batch and os.path.exists(self.spill_path):
+                self._replay_spill()
+
+    @staticmethod
+    def _is_control(item):
+        return item is _STOP or isinstance(item, threading.Event)
+
+    def _drain_into(self, batch, limit):
+        """
+        Move already-queued rows into the batch without blocking.
+        Stops at, and returns, the first flush/stop request it meets.
+        """
+        while len(batch) < limit:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return None
+            if self._is_control(item):
+                return item
+            batch.append(item)
+        return None
+
+    def _write(self, batch):
+        if not batch:
+            if os.path.exists(self.spill_path):
+                self._replay_spill()
+            return
+        if os.path.exists(self.spill_path) and not self._replay_spill():
+            # Still unavailable: keep ordering by spilling behind the older rows
+            self._spill(batch)
+            return
+        try:
+            self._executemany(batch)
+        except Exception as e:
+            # Any failure (not just mysql Errors) must spill rather than kill the worker
+            self.write_errors += 1
+            logger.error(f"Error writing {len(batch)} trades, spilling to {self.spill_path}: {e}")
+            self._spill(batch)
+
+    def _executemany(self, rows):
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start:start + self.batch_size]
+            with self.connection_provider() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.executemany(self.query, chunk)
+                    connection.commit()
+                finally:
+                    cursor.close()
+            self.written += len(chunk)
+            self.batches += 1
+
+    # --- Spill file ---
+    def _spill(self, rows):
+        with self._spill_lock:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.spill_path, "a") as spill_file:
+                for row in rows:
+                    spill_file.write(json.dumps(list(row), default=str) + "\n")
+                spill_file.flush()
+                os.fsync(spill_file.fileno())
+            self.spilled += len(rows)
+
+    def _replay_spill(self):
+        """Write spilled rows back to the database. Returns True once the spill file is gone."""
+        with self._spill_lock:
+            try:
+                with open(self.spill_path) as spill_file:
+                    rows = [tuple(json.loads(line)) for line in spill_file if line.strip()]
+            except FileNotFoundError:
+                return True
+            try:
+                self._executemany(rows)
+            except Exception as e:
+                self.write_errors += 1
+                logger.warning(f"Spilled trades not replayed yet, MySQL still unavailable: {e}")
+                return False
+            os.remove(self.spill_path)
+            self.replayed += len(rows)
+            logger.info(f"Replayed {len(rows)} spilled trades.")
+            return True
@@ -1,12 +1,13 @@
-from ai.rl_agent import RLTradingAgent
-from ai.models.sentiment_analysis import SentimentAnalysisModel
+from src.ai.model_registry import get_model_registry, lazy_model, model_factory
+from src.ai.inference_server import get_inference_client
 from centralized_logger import CentralizedLogger
 from market_data import MarketDataAPI
 from src.safety.safety_manager import SafetyManager
 
 logger = CentralizedLogger()
-rl_agent = RLTradingAgent(environment="liquidity_arbitrage")
-sentiment_model = SentimentAnalysisModel()
+# RL model per trading environment, shared by the bots trading it, built on first use and served in micro-batches
+rl_agent = get_inference_client("rl_trading_agent:liquidity_arbitrage", model_factory("src.ai.rl_agent:RLTradeDecider", environment="liquidity_arbitrage"))
+sentiment_model = lazy_model("sentiment_model", "src.ai.models.sentiment_analysis:SentimentAnalysis")
 safety_manager = SafetyManager()
 
 class LiquidityMonitorBot:
@@ -28,8 +29,8 @@ class LiquidityMonitorBot:
             rl_action = rl_agent.decide_action(liquidity_data)
             logger.log("info", f"RL action: {rl_action}")
 
-            # Sentiment analysis to aid decision
-            sentiment = sentiment_model.analyze_sentiment(liquidity_data)
+            # Sentiment analysis to aid decision (an unchanged payload is served from the score cache)
+            sentiment = sentiment_model.get_sentiment_score(str(liquidity_data))
             logger.log("info", f"Sentiment analysis: {sentiment}")
 
             if safety_manager.check_safety(liquidity_data):
@@ -48,5 +49,9 @@ class LiquidityMonitorBot:
         # Logic for triggering other bots or executing trades...
 
 if __name__ == "__main__":
+    registry = get_model_registry()
+    registry.warm_up(background=False)  # Load models up front and report any that fail
+    for name, error in registry.errors().items():
+        logger.log("error", f"Failed to load model {name}: {error}")
     bot = LiquidityMonitorBot()
     bot.monitor_liquidity()
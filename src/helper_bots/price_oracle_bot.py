@@ -1,12 +1,13 @@
-from ai.lstm_model import LSTMModel
-from ai.arima_model import ARIMAModel
+from src.ai.feature_engine import get_feature_engine
+from src.ai.model_registry import get_model_registry, lazy_model
 from centralized_logger import CentralizedLogger
 from market_data import MarketDataAPI
 from src.safety.safety_manager import SafetyManager
 
 logger = CentralizedLogger()
-lstm_model = LSTMModel()
-arima_model = ARIMAModel()
+lstm_model = lazy_model("lstm_model", "src.ai.models.lstm_model:LSTMModel")
+# Fitted ARIMA model per asset, updated with each fetch instead of refitted
+arima_models = lazy_model("arima_models", "src.ai.models.arima_model:ARIMAModelCache")
 safety_manager = SafetyManager()
 
 class PriceOracleBot:
@@ -23,10 +24,12 @@ class PriceOracleBot:
             # Fetch market prices
             prices = self.market_data.get_prices()
             logger.log("info", f"Fetched prices: {prices}")
+            # Streaming indicators shared with the strategies and the risk manager
+            get_feature_engine().update(list(prices), list(prices.values()))
 
             # Use LSTM and ARIMA models to predict prices
             lstm_prediction = lstm_model.predict(prices)
-            arima_prediction = arima_model.predict(prices)
+            arima_prediction = arima_models.update_and_forecast(prices)
             logger.log("info", f"LSTM Prediction: {lstm_prediction}, ARIMA Prediction: {arima_prediction}")
 
             if safety_manager.check_safety(prices):
@@ -45,5 +48,9 @@ class PriceOracleBot:
         # Logic for executing trades...
 
 if __name__ == "__main__":
+    registry = get_model_registry()
+    registry.warm_up(background=False)  # Load models up front and report any that fail
+    for name, error in registry.errors().items():
+        logger.log("error", f"Failed to load model {name}: {error}")
     bot = PriceOracleBot()
     bot.fetch_and_predict_prices()
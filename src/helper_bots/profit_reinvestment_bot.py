@@ -1,11 +1,11 @@
-from ai.dnn_model import DNNModel
+from src.ai.model_registry import get_model_registry, lazy_model
 from ai_helpers import ReinvestmentHelper
 from centralized_logger import CentralizedLogger
 from profit_manager import ProfitManager
 from src.safety.safety_manager import SafetyManager
 
 logger = CentralizedLogger()
-dnn_model = DNNModel()
+dnn_model = lazy_model("dnn_model", "src.ai.models.dnn_model:DNNModel")
 reinvestment_helper = ReinvestmentHelper()
 safety_manager = SafetyManager()
 
@@ -37,5 +37,9 @@ class ProfitReinvestmentBot:
             logger.log("error", f"Error in reinvestment: {str(e)}")
 
 if __name__ == "__main__":
+    registry = get_model_registry()
+    registry.warm_up(background=False)  # Load models up front and report any that fail
+    for name, error in registry.errors().items():
+        logger.log("error", f"Failed to load model {name}: {error}")
     bot = ProfitReinvestmentBot()
     bot.collect_and_reinvest_profits()
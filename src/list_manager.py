@@ -1,32 +1,31 @@
 # File: /src/managers/list_manager.py
 
-import mysql.connector
 import logging
 from mysql.connector import Error
+from src.database.connection_pool import get_pool
+from src.database.list_index import ListIndex
 
 class ListManager:
     """
     Manages the various lists: whitelist, blacklist, redlist, and pumplist.
     Interacts with the MySQL database to retrieve and update the lists.
+    Membership checks are served from an in-memory ListIndex kept current by the list_changes feed.
     """
-    def __init__(self, db_config):
+    def __init__(self, db_config, use_index=True, refresh_interval=5.0):
         self.db_config = db_config
-        self.connection = self.connect_db()
+        self.pool = self.connect_db()
+        self.index = ListIndex(self.pool.connection, refresh_interval=refresh_interval) if use_index else None
 
     def connect_db(self):
         """
-        Connect to the MySQL database using the provided configuration.
+        Return the shared connection pool for the provided configuration.
         """
-        try:
-            return mysql.connector.connect(
-                host=self.db_config['host'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database']
-            )
-        except Error as e:
-            logging.error(f"Error connecting to MySQL: {e}")
-            raise
+        return get_pool({
+            'host': self.db_config['host'],
+            'user': self.db_config['user'],
+            'password': self.db_config['password'],
+            'database': self.db_config['database']
+        })
 
     # --- Whitelist Methods ---
     def is_whitelisted(self, token_address):
@@ -75,11 +74,13 @@ class ListManager:
     def add_to_pumplist(self, token_address, focus_duration, added_by):
         """Add a token to the pumplist."""
         try:
-            cursor = self.connection.cursor()
-            query = "INSERT INTO pumplist (token_address, focus_duration, added_by) VALUES (%s, %s, %s)"
-            cursor.execute(query, (token_address, focus_duration, added_by))
-            self.connection.commit()
-            cursor.close()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = "INSERT INTO pumplist (token_address, focus_duration, added_by) VALUES (%s, %s, %s)"
+                cursor.execute(query, (token_address, focus_duration, added_by))
+                connection.commit()
+                cursor.close()
+            self._record_change('pumplist', token_address, True)
             logging.info(f"Token {token_address} added to pumplist.")
         except Error as e:
             logging.error(f"Error adding token to pumplist: {e}")
@@ -91,12 +92,19 @@ class ListManager:
     # --- Utility Methods ---
     def _check_list(self, list_name, token_address):
         """Generic method to check if a token exists in a list."""
+        if self.index is not None:
+            return self.index.contains(list_name, token_address)
+        return self._query_list(list_name, token_address)
+
+    def _query_list(self, list_name, token_address):
+        """Check list membership directly against MySQL, bypassing the index."""
         try:
-            cursor = self.connection.cursor()
-            query = f"SELECT token_address FROM {list_name} WHERE token_address = %s"
-            cursor.execute(query, (token_address,))
-            result = cursor.fetchone()
-            cursor.close()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = f"SELECT token_address FROM {list_name} WHERE token_address = %s"
+                cursor.execute(query, (token_address,))
+                result = cursor.fetchone()
+                cursor.close()
             return result is not None
         except Error as e:
             logging.error(f"Error checking {list_name}: {e}")
@@ -105,11 +113,13 @@ class ListManager:
     def _add_to_list(self, list_name, token_address, added_by, reason=None):
         """Generic method to add a token to a list."""
         try:
-            cursor = self.connection.cursor()
-            query = f"INSERT INTO {list_name} (token_address, added_by, reason) VALUES (%s, %s, %s)"
-            cursor.execute(query, (token_address, added_by, reason))
-            self.connection.commit()
-            cursor.close()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = f"INSERT INTO {list_name} (token_address, added_by, reason) VALUES (%s, %s, %s)"
+                cursor.execute(query, (token_address, added_by, reason))
+                connection.commit()
+                cursor.close()
+            self._record_change(list_name, token_address, True)
             logging.info(f"Token {token_address} added to {list_name}.")
         except Error as e:
             logging.error(f"Error adding token to {list_name}: {e}")
@@ -117,14 +127,16 @@ class ListManager:
     def _add_to_blacklist(self, token_address, flagged_by, reason, ai_risk_score):
         """Specific method to add a token to the blacklist with AI risk scoring."""
         try:
-            cursor = self.connection.cursor()
-            query = """
-                INSERT INTO blacklist (token_address, flagged_by, reason, ai_risk_score)
-                VALUES (%s, %s, %s, %s)
-            """
-            cursor.execute(query, (token_address, flagged_by, reason, ai_risk_score))
-            self.connection.commit()
-            cursor.close()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = """
+                    INSERT INTO blacklist (token_address, flagged_by, reason, ai_risk_score)
+                    VALUES (%s, %s, %s, %s)
+                """
+                cursor.execute(query, (token_address, flagged_by, reason, ai_risk_score))
+                connection.commit()
+                cursor.close()
+            self._record_change('blacklist', token_address, True)
             logging.info(f"Token {token_address} added to blacklist with risk score {ai_risk_score}.")
         except Error as e:
             logging.error(f"Error adding token to blacklist: {e}")
@@ -132,11 +144,22 @@ class ListManager:
     def _remove_from_list(self, list_name, token_address):
         """Generic method to remove a token from a list."""
         try:
-            cursor = self.connection.cursor()
-            query = f"DELETE FROM {list_name} WHERE token_address = %s"
-            cursor.execute(query, (token_address,))
-            self.connection.commit()
-            cursor.close()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = f"DELETE FROM {list_name} WHERE token_address = %s"
+                cursor.execute(query, (token_address,))
+                connection.commit()
+                cursor.close()
+            self._record_change(list_name, token_address, False)
             logging.info(f"Token {token_address} removed from {list_name}.")
         except Error as e:
             logging.error(f"Error removing token from {list_name}: {e}")
+
+    def _record_change(self, list_name, token_address, present):
+        """Write a local list update through to the index so it is visible before the next feed poll."""
+        if self.index is not None:
+            self.index.record_change(list_name, token_address, present)
+
+    def index_stats(self):
+        """Hit/miss/staleness metrics of the membership index (None when the index is disabled)."""
+        return self.index.stats() if self.index is not None else None
@@ -3,9 +3,12 @@
 import logging
 from logging.handlers import RotatingFileHandler
 import os
+from datetime import datetime
 import mysql.connector
-from mysql.connector import Error
 from dotenv import load_dotenv
+from src.database.connection_pool import get_pool
+from src.logging.log_pipeline import DatabaseLogSink, LoggerSink, get_pipeline
+from src.logging.log_throttle import LazyMessage, LogThrottle
 
 # Load environment variables
 load_dotenv()
@@ -13,6 +16,8 @@ load_dotenv()
 class CentralizedLogger:
     """
     Centralized logging system that logs either to rotating log files or MySQL database based on configuration.
+    Records go through a shared LogPipeline: callers only enqueue, and a background consumer writes batches
+    (multi-row INSERTs into bot_logs, or the rotating file handler).
     """
     def __init__(self):
         self.logging_method = os.getenv("LOGGING_METHOD", "database")  # 'database' or 'file'
@@ -21,19 +26,19 @@ class CentralizedLogger:
         self.logger.setLevel(self.log_level)
         self.setup_logger()
 
-        # MySQL configuration for logging
-        if self.logging_method == "database":
-            try:
-                self.connection = mysql.connector.connect(
-                    host=os.getenv('MYSQL_HOST'),
-                    user=os.getenv('MYSQL_USER'),
-                    password=os.getenv('MYSQL_PASSWORD'),
-                    database=os.getenv('MYSQL_DATABASE')
-                )
-                self.cursor = self.connection.cursor()
-                logging.info("Connected to MySQL for logging.")
-            except Error as e:
-                self.logger.error(f"Error connecting to MySQL: {e}")
+        # MySQL connections for logging come from the shared pool
+        self.pool = get_pool() if self.logging_method == "database" else None
+        if self.pool is not None:
+            self.pipeline_key, self.sink_factory = "bot_logs", lambda: DatabaseLogSink(
+                self.pool.connection, "bot_logs", ("identifier", "log_type", "message", "timestamp")
+            )
+        else:
+            self.pipeline_key, self.sink_factory = "trade_log_file", lambda: LoggerSink(self.logger)
+
+    @property
+    def pipeline(self):
+        """The shared pipeline for this logger's destination (recreated if it was closed)."""
+        return get_pipeline(self.pipeline_key, self.sink_factory)
 
     def setup_logger(self):
         """Sets up logging to file or database."""
@@ -47,7 +52,8 @@ class CentralizedLogger:
             file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(file_formatter)
 
-            self.logger.addHandler(file_handler)
+            if not self.logger.handlers:
+                self.logger.addHandler(file_handler)
             logging.info("File logging initialized.")
         else:
             logging.info("MySQL logging initialized.")
@@ -56,7 +62,7 @@ class CentralizedLogger:
         """Logs trade details based on the configured logging method."""
         message = f"Trade executed: {symbol}, Buy Order: {buy_order}, Sell Order: {sell_order}, Metadata: {metadata}"
         if self.logging_method == "file":
-            self.logger.info(message)
+            self.pipeline.emit("info", ("info", message))
         else:
             self._log_to_db(symbol, "TRADE", message)
 
@@ -64,61 +70,102 @@ class CentralizedLogger:
         """Logs failure based on the configured logging method."""
         error_message = f"Bot {bot_id} failed: {message} - Details: {details}"
         if self.logging_method == "file":
-            self.logger.error(error_message)
+            self.pipeline.emit("error", ("error", error_message))
         else:
             self._log_to_db(bot_id, "FAILURE", error_message)
 
     def _log_to_db(self, identifier, log_type, message):
-        """Logs messages to the MySQL database."""
-        sql = "INSERT INTO bot_logs (identifier, log_type, message) VALUES (%s, %s, %s)"
-        values = (identifier, log_type, message)
-        try:
-            self.cursor.execute(sql, values)
-            self.connection.commit()
-        except Error as e:
-            self.logger.error(f"Error logging to MySQL: {e}")
+        """Queues a bot_logs row; the timestamp is taken now, not when the batch is written."""
+        self.pipeline.emit(log_type, (identifier, log_type, message, datetime.now()))
 
-    def close(self):
-        """Closes MySQL connection safely."""
-        if self.connection.is_connected():
-            self.cursor.close()
-            self.connection.close()
+    def close(self, timeout=10.0):
+        """
+        Waits until this process's queued records are written. The pipeline and the MySQL pool are shared
+        with every other logger and stay open; the pipeline drains itself at exit (see close_all_pools
+        for the pool).
+        """
+        self.pipeline.flush(timeout)
 
-import mysql.connector
+from src.database.async_db import get_async_db
 from src.database.database_manager import DatabaseManager
 from src.utils.error_handler import handle_errors
 
+LOG_INSERT_QUERY = """
+    INSERT INTO logs (log_type, message, timestamp)
+    VALUES (%s, %s, NOW())
+"""
+
 class CentralizedLogger:
+    # Shared by every instance so a bot's keys are throttled process-wide
+    throttle = LogThrottle()
+
     def __init__(self):
         self.db_manager = DatabaseManager()  # MySQL connection manager
+        self.async_db = get_async_db()  # Executor-backed writes for alog()
+        # One queue and consumer thread shared by every logger instance writing to the logs table
+        self.sink_factory = lambda: DatabaseLogSink(
+            self.db_manager.pool.connection, "logs", ("log_type", "message", "timestamp")
+        )
+
+    @property
+    def pipeline(self):
+        """The shared pipeline for the logs table (recreated if it was closed)."""
+        return get_pipeline("logs", self.sink_factory)
 
     def log(self, log_type, message):
         """
         Logs the message to the MySQL database.
         log_type: 'info', 'warning', 'error', 'critical'
+        The row is queued and written in a batch by the pipeline thread, so this never waits on MySQL
+        and is safe to call from inside the event loop.
         """
         print(f"[{log_type.upper()}] {message}")  # Console output (optional)
+        self.pipeline.emit(log_type, (log_type, message, datetime.now()))
 
-        # Insert the log into the MySQL database
+    async def alog(self, log_type, message):
+        """
+        Awaitable variant of log() for coroutines that want to know the row was written.
+        """
+        print(f"[{log_type.upper()}] {message}")  # Console output (optional)
         try:
-            connection = self.db_manager.get_connection()
-            cursor = connection.cursor()
-
-            # Log message to MySQL (table: logs)
-            query = """
-                INSERT INTO logs (log_type, message, timestamp)
-                VALUES (%s, %s, NOW())
-            """
-            data = (log_type, message)
-
-            cursor.execute(query, data)
-            connection.commit()
-            cursor.close()
-
+            await self.async_db.execute(LOG_INSERT_QUERY, (log_type, message))
         except mysql.connector.Error as err:
             print(f"[ERROR] Failed to log to MySQL: {err}")
             handle_errors(err)
 
+    def log_throttled(self, log_type, key, message, *args, interval=None):
+        """
+        Logs a high-frequency message at most once per throttle interval per key (LOG_THROTTLE_INTERVAL,
+        10s by default) and drops exact repeats. `message` is a %-style template (or a zero-argument
+        callable) that is only formatted when the record is actually emitted; the emitted record
+        reports how many were suppressed since the previous one.
+
+        :param log_type: 'info', 'warning', 'error', 'critical'
+        :param key: Throttling key, e.g. "arbitrage_bot.market_data".
+        :param message: Template such as "Fetched market data: %s", or a callable returning the text.
+        :param args: Template arguments.
+        :param interval: Optional per-call interval override in seconds.
+        :return: True if the record was logged.
+        """
+        text = self.throttle.process(key, LazyMessage(message, args), interval)
+        if text is None:
+            return False
+        self.log(log_type, text)
+        return True
+
+    def log_suppressed_summary(self, prefix=""):
+        """
+        Logs the outstanding suppressed counts for throttled keys starting with `prefix`, e.g. on bot stop.
+        """
+        for key, count in self.throttle.pending_summaries(prefix).items():
+            self.log("info", f"{key}: {count} throttled messages suppressed")
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every queued log row has been written.
+        """
+        return self.pipeline.flush(timeout)
+
     def log_error(self, message):
         """
         Convenience method for logging errors.
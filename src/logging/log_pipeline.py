@@ -0,0 +1,289 @@
+# File: /src/logging/log_pipeline.py
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+_STOP = object()
+
+
+class DatabaseLogSink:
+    """
+    Writes batches of log rows into a MySQL table with one executemany (which mysql.connector sends as a
+    single multi-row INSERT) and one COMMIT per batch.
+    """
+
+    def __init__(self, connection_provider, table, columns):
+        """
+        :param connection_provider: Zero-argument callable returning a pooled connection context manager.
+        :param table: Target table, e.g. 'bot_logs' or 'logs'.
+        :param columns: Column names matching the order of each row's values.
+        """
+        self.connection_provider = connection_provider
+        self.query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+    def write(self, rows):
+        with self.connection_provider() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany(self.query, rows)
+                connection.commit()
+            finally:
+                cursor.close()
+
+
+class LoggerSink:
+    """
+    Forwards batches to a standard library logger, e.g. one with a RotatingFileHandler attached, so file
+    rotation keeps working but happens on the pipeline thread instead of the caller's.
+    Rows are (level, message, ...) tuples.
+    """
+
+    def __init__(self, target_logger):
+        self.target_logger = target_logger
+
+    def write(self, rows):
+        for row in rows:
+            self.target_logger.log(logging.getLevelName(row[0].upper()), row[1])
+
+
+class LogPipeline:
+    """
+    Queue-based logging pipeline. Producers call emit(), which is an O(1) enqueue, and a single background
+    consumer batches queued rows into the sink (batch_size rows or flush_interval seconds, whichever first).
+
+    When the queue is full the overflow policy applies: 'block' waits up to block_timeout then drops,
+    'drop_newest' drops the incoming row, 'drop_oldest' evicts the oldest queued row. Per-level sampling
+    keeps 1 in round(1/rate) rows of a level (rate 0 drops the level entirely). close() drains the queue
+    and is registered with atexit.
+    """
+
+    def __init__(self, sink, max_queue=10000, batch_size=200, flush_interval=0.5, overflow_policy="drop_oldest",
+                 block_timeout=0.1, sampling=None, name="log-pipeline"):
+        """
+        :param sink: Object with a write(rows) method.
+        :param max_queue: Maximum rows buffered in memory.
+        :param batch_size: Maximum rows per sink write.
+        :param flush_interval: Maximum seconds a row waits before being written.
+        :param overflow_policy: One of OVERFLOW_POLICIES.
+        :param block_timeout: Seconds the 'block' policy waits for space.
+        :param sampling: Mapping of level name to keep-rate in [0, 1]; unlisted levels are always kept.
+        :param name: Thread name.
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}")
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.sampling = {}
+        for level, rate in (sampling or {}).items():
+            self.set_sampling(level, rate)
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._sample_counters = {}
+        self._close_lock = threading.Lock()  # Orders rows and flush requests against the stop request
+        self._closed = False
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.written = 0
+        self.batches = 0
+        self.sink_errors = 0
+
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def set_sampling(self, level, rate):
+        """Keep roughly `rate` of the rows at `level` (0 drops the level, 1 keeps everything)."""
+        rate = min(max(float(rate), 0.0), 1.0)
+        self.sampling[level.lower()] = 0 if rate == 0 else max(1, round(1 / rate))
+
+    def emit(self, level, row):
+        """
+        Enqueue one row for the sink. Never does I/O on the caller's thread.
+
+        :param level: Level name used for sampling ('info', 'warning', ...).
+        :param row: Tuple of values passed to the sink.
+        :return: True if queued, False if sampled out or dropped.
+        """
+        if self._closed:
+            return False
+        level = level.lower()
+        keep_every = self.sampling.get(level)
+        if keep_every is not None:
+            count = self._sample_counters.get(level, 0)
+            self._sample_counters[level] = count + 1
+            if keep_every == 0 or count % keep_every:
+                self.sampled_out += 1
+                return False
+
+        with self._close_lock:
+            if self._closed:
+                return False
+            try:
+                if self.overflow_policy == "block":
+                    self._queue.put(row, timeout=self.block_timeout)
+                else:
+                    self._queue.put_nowait(row)
+            except queue.Full:
+                if self.overflow_policy != "drop_oldest" or not self._evict_and_put(row):
+                    self.dropped += 1
+                    return False
+            self.enqueued += 1
+            return True
+
+    def _evict_and_put(self, row):
+        try:
+            evicted = self._queue.get_nowait()
+            if evicted is _STOP or isinstance(evicted, threading.Event):
+                # Never lose a flush/stop request; requeue it and drop the new row instead
+                self._queue.put_nowait(evicted)
+                return False
+            self.dropped += 1
+            self._queue.put_nowait(row)
+            return True
+        except (queue.Empty, queue.Full):
+            return False
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def flush(self, timeout=None):
+        """Block until every row emitted so far has been handed to the sink."""
+        with self._close_lock:
+            if self._closed:
+                return True
+            done = threading.Event()
+            self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=10.0):
+        """Drain the queue into the sink and stop the consumer. Safe to call more than once."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join(timeout)
+        self._release_waiters()
+        atexit.unregister(self.close)
+
+    def _release_waiters(self):
+        """Wake flush() callers whose requests the consumer did not serve before stopping (join timed out)."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not _STOP:
+                self.dropped += 1
+
+    def stats(self):
+        """Pipeline counters for monitoring."""
+        return {
+            "enqueued": self.enqueued,
+            "pending": self._queue.qsize(),
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "written": self.written,
+            "batches": self.batches,
+            "sink_errors": self.sink_errors,
+        }
+
+    # --- Consumer ---
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP or isinstance(item, threading.Event):
+                # Every row queued ahead of a flush/stop request is already in the batch or written
+                self._write(batch)
+                batch, deadline = [], None
+                if item is _STOP:
+                    return
+                item.set()
+                continue
+
+            if item is not None:
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size and time.monotonic() < deadline:
+                    continue
+
+            self._write(batch)
+            batch, deadline = [], None
+
+    def _write(self, batch):
+        if not batch:
+            return
+        try:
+            self.sink.write(batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            # A failing sink must never take the consumer down; the batch is dropped and counted
+            self.sink_errors += 1
+            self.dropped += len(batch)
+            logger.error(f"Log sink failed, dropped {len(batch)} records: {e}")
+
+
+def sampling_from_env(value=None):
+    """
+    Parse per-level sampling rates from LOG_SAMPLING, e.g. "debug=0,info=0.1".
+    """
+    value = os.getenv("LOG_SAMPLING", "") if value is None else value
+    sampling = {}
+    for item in value.split(","):
+        if "=" in item:
+            level, rate = item.split("=", 1)
+            sampling[level.strip().lower()] = float(rate)
+    return sampling
+
+
+_pipelines = {}
+_pipelines_lock = threading.Lock()
+
+
+def get_pipeline(key, sink_factory, **options):
+    """
+    Return the process-wide pipeline for `key`, creating it with sink_factory() on first use, so the many
+    module-level CentralizedLogger instances share one queue and one consumer thread per destination.
+    A pipeline that has been closed is replaced by a new one, so one holder closing it cannot silence
+    the others. Defaults come from LOG_QUEUE_SIZE, LOG_BATCH_SIZE, LOG_FLUSH_INTERVAL, LOG_OVERFLOW_POLICY
+    and LOG_SAMPLING.
+    """
+    pipeline = _pipelines.get(key)
+    if pipeline is not None and not pipeline.closed:
+        return pipeline
+    with _pipelines_lock:
+        pipeline = _pipelines.get(key)
+        if pipeline is None or pipeline.closed:
+            options.setdefault("max_queue", int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+            options.setdefault("batch_size", int(os.getenv("LOG_BATCH_SIZE", "200")))
+            options.setdefault("flush_interval", float(os.getenv("LOG_FLUSH_INTERVAL", "0.5")))
+            options.setdefault("overflow_policy", os.getenv("LOG_OVERFLOW_POLICY", "drop_oldest"))
+            options.setdefault("sampling", sampling_from_env())
+            pipeline = LogPipeline(sink_factory(), name=f"log-pipeline-{key}", **options)
+            _pipelines[key] = pipeline
+        return pipeline
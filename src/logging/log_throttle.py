@@ -0,0 +1,126 @@
+# File: /src/logging/log_throttle.py
+
+import os
+import threading
+import time
+
+
+class LazyMessage:
+    """
+    A %-style message template whose arguments are only formatted when the text is actually needed,
+    so large payloads (market data, trade dicts) cost nothing when the record is throttled away.
+    """
+
+    __slots__ = ("template", "args")
+
+    def __init__(self, template, args=()):
+        self.template = template
+        self.args = args
+
+    def render(self):
+        if callable(self.template):
+            return str(self.template())
+        return self.template % self.args if self.args else str(self.template)
+
+
+class _KeyState:
+    __slots__ = ("tokens", "updated", "last_text", "last_emit", "suppressed", "repeats", "window_start")
+
+    def __init__(self, now, burst):
+        self.tokens = float(burst)
+        self.updated = now
+        self.last_text = None
+        self.last_emit = 0.0
+        self.suppressed = 0
+        self.repeats = 0
+        self.window_start = now
+
+
+class LogThrottle:
+    """
+    Per-key rate limiting and de-duplication for log records.
+
+    Each key (usually "<bot>.<event>") gets a token bucket allowing `burst` records and refilling at one
+    record per `interval` seconds. Records beyond that are counted but never formatted. A record whose
+    rendered text matches the last one emitted for its key within `dedupe_interval` is also suppressed.
+    The next record that is emitted for the key carries a summary of how many were suppressed.
+    """
+
+    def __init__(self, interval=None, burst=1, dedupe_interval=None, clock=time.monotonic):
+        """
+        :param interval: Seconds per emitted record per key; defaults to LOG_THROTTLE_INTERVAL or 10.
+        :param burst: Records a quiet key may emit back to back before throttling starts.
+        :param dedupe_interval: Seconds an identical message stays suppressed; defaults to 6 * interval.
+        :param clock: Monotonic time source (injectable for tests).
+        """
+        self.interval = float(os.getenv("LOG_THROTTLE_INTERVAL", "10")) if interval is None else float(interval)
+        self.burst = max(1, int(burst))
+        self.dedupe_interval = self.interval * 6 if dedupe_interval is None else float(dedupe_interval)
+        self.clock = clock
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def process(self, key, message, interval=None):
+        """
+        Decide whether a record for `key` is emitted.
+
+        :param key: Throttling key.
+        :param message: LazyMessage (or plain string) for the record.
+        :param interval: Optional per-call override of the refill interval.
+        :return: The text to log (with a suppression summary appended when applicable), or None.
+        """
+        interval = self.interval if interval is None else interval
+        now = self.clock()
+        with self._lock:
+            state = self._keys.get(key)
+            if state is None:
+                state = self._keys[key] = _KeyState(now, self.burst)
+            elif interval > 0:
+                state.tokens = min(self.burst, state.tokens + (now - state.updated) / interval)
+            else:
+                state.tokens = self.burst
+            state.updated = now
+            if state.tokens < 1:
+                state.suppressed += 1
+                return None
+            state.tokens -= 1
+
+        # Only records that passed the rate limit are formatted, outside the lock
+        text = message.render() if isinstance(message, LazyMessage) else str(message)
+
+        with self._lock:
+            if text == state.last_text and now - state.last_emit < self.dedupe_interval:
+                state.suppressed += 1
+                state.repeats += 1
+                return None
+            suppressed, repeats, since = state.suppressed, state.repeats, now - state.window_start
+            state.last_text, state.last_emit = text, now
+            state.suppressed = state.repeats = 0
+            state.window_start = now
+
+        if suppressed:
+            detail = f", {repeats} identical" if repeats else ""
+            text = f"{text} [{suppressed} similar messages suppressed in the last {since:.0f}s{detail}]"
+        return text
+
+    def pending_summaries(self, prefix=""):
+        """
+        Collect and reset suppressed counts, e.g. to log them when a bot stops.
+
+        :param prefix: Only keys starting with this prefix (e.g. the bot name).
+        :return: Mapping of key to suppressed record count (keys with nothing suppressed are omitted).
+        """
+        with self._lock:
+            summaries = {
+                key: state.suppressed for key, state in self._keys.items()
+                if state.suppressed and key.startswith(prefix)
+            }
+            for key in summaries:
+                self._keys[key].suppressed = self._keys[key].repeats = 0
+                self._keys[key].window_start = self.clock()
+        return summaries
+
+    def stats(self):
+        """Number of tracked keys and records currently suppressed."""
+        with self._lock:
+            return {"keys": len(self._keys), "suppressed": sum(s.suppressed for s in self._keys.values())}
@@ -1,13 +1,15 @@
 import asyncio
 from centralized_logger import CentralizedLogger
-from ai.agents.rl_agent import RLTradingAgent
+from src.ai.model_registry import model_factory
+from src.ai.inference_server import get_inference_client
 from src.safety.safety_manager import SafetyManager
 from src.list_manager import ListManager
 from src.utils.error_handler import handle_errors
 from src.trading.trade_executor import TradeExecutor
 
 logger = CentralizedLogger()
-rl_agent = RLTradingAgent(environment="arbitrage_trading")
+# RL model per trading environment, shared by the bots trading it, built on first use and served in micro-batches
+rl_agent = get_inference_client("rl_trading_agent:arbitrage_trading", model_factory("src.ai.rl_agent:RLTradeDecider", environment="arbitrage_trading"))
 safety_manager = SafetyManager()
 trade_executor = TradeExecutor()
 list_manager = ListManager()
@@ -39,10 +41,10 @@ class ArbitrageManager:
             while True:
                 # Fetch market data and perform AI-driven decision making
                 market_data = await strategy.fetch_market_data()
-                logger.log("info", f"Fetched market data: {market_data}")
+                logger.log_throttled("info", f"{strategy.name}.market_data", "Fetched market data: %s", market_data)
 
-                action = rl_agent.decide_action(market_data)
-                logger.log("info", f"RL Decision for arbitrage: {action}")
+                action = await rl_agent.adecide_action(market_data)
+                logger.log_throttled("info", f"{strategy.name}.decision", "RL Decision for arbitrage: %s", action)
 
                 # Safety checks before executing trade
                 if safety_manager.check_safety(market_data):
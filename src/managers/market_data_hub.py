@@ -0,0 +1,320 @@
+# File: /src/managers/market_data_hub.py
+
+import asyncio
+import inspect
+import logging
+import time
+from types import MappingProxyType
+
+from src.ai.model_registry import model_factory
+
+logger = logging.getLogger(__name__)
+
+_CLOSED = object()  # Queued by Subscription.close() to wake a waiting consumer
+
+
+def freeze(value):
+    """
+    Read-only copy of a feed payload: dicts become mapping proxies, lists become tuples and NumPy arrays or
+    pandas objects become nested tuples, so payloads compare with == and cannot be mutated in place.
+    """
+    if hasattr(value, "tolist"):
+        value = value.tolist()  # NumPy arrays/scalars, pandas Series/Index
+    elif hasattr(value, "to_dict"):
+        value = value.to_dict()  # pandas DataFrame
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+class MarketSnapshot:
+    """
+    Immutable view of the latest data of every feed.
+
+    Publishing a feed builds a new snapshot that shares the (frozen) payloads of every other feed with
+    the previous one (copy-on-write), so handing the same snapshot to many bots costs nothing and a bot
+    holding an old snapshot never sees it change underneath it.
+    """
+
+    __slots__ = ("sequence", "feeds", "versions", "fetched_at", "updated")
+
+    def __init__(self, sequence=0, feeds=None, versions=None, fetched_at=None, updated=()):
+        self.sequence = sequence
+        self.feeds = MappingProxyType(feeds or {})
+        self.versions = MappingProxyType(versions or {})
+        self.fetched_at = MappingProxyType(fetched_at or {})
+        self.updated = frozenset(updated)
+
+    def __getitem__(self, feed):
+        return self.feeds[feed]
+
+    def __contains__(self, feed):
+        return feed in self.feeds
+
+    def get(self, feed, default=None):
+        return self.feeds.get(feed, default)
+
+    def age(self, feed):
+        """Seconds since `feed` was last fetched."""
+        return time.time() - self.fetched_at[feed]
+
+    def __repr__(self):
+        return f"<MarketSnapshot #{self.sequence} feeds={sorted(self.feeds)} updated={sorted(self.updated)}>"
+
+
+class Subscription:
+    """
+    Queue of snapshots for one consumer, fed whenever one of its feeds changes.
+
+    The queue conflates: when the consumer falls behind, the oldest pending snapshot is replaced (every
+    snapshot holds the complete latest state, so nothing is lost by skipping intermediate ones).
+    """
+
+    def __init__(self, hub, feeds, maxsize=1):
+        self.hub = hub
+        self.feeds = frozenset(feeds)
+        self.queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+        self.closed = False
+
+    def offer(self, snapshot):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(snapshot)
+
+    async def get(self):
+        """Wait for the next snapshot with fresh data for this subscription's feeds (None once closed)."""
+        if self.closed:
+            return None
+        snapshot = await self.queue.get()
+        if snapshot is _CLOSED:
+            self.queue.put_nowait(_CLOSED)  # Keep waking later get() calls
+            return None
+        return snapshot
+
+    def close(self):
+        """Unsubscribe and wake a consumer waiting in get(), ending its iteration."""
+        if not self.closed:
+            self.closed = True
+            self.hub.unsubscribe(self)
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_CLOSED)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        snapshot = await self.get()
+        if snapshot is None:
+            raise StopAsyncIteration
+        return snapshot
+
+
+class _Feed:
+    __slots__ = ("name", "fetch", "interval", "task", "stats")
+
+    def __init__(self, name, fetch, interval):
+        self.name = name
+        self.fetch = fetch
+        self.interval = interval
+        self.task = None
+        self.stats = {"fetches": 0, "errors": 0, "published": 0, "unchanged": 0}
+
+
+class MarketDataHub:
+    """
+    In-process market-data bus: each feed is fetched once per interval, however many bots consume it,
+    normalized into a shared copy-on-write MarketSnapshot and fanned out to subscribers through asyncio
+    queues, so bots wake up when fresh data arrives instead of polling on their own timers.
+
+    A feed's polling task starts with its first subscriber and stops when the last one leaves. A fetch
+    that returns the same data as before is not published, so subscribers only wake for changes. Push-
+    based sources (e.g. websockets) can call publish() directly. All methods must be called from the
+    event loop thread.
+    """
+
+    def __init__(self, api_factory=None):
+        """
+        :param api_factory: Zero-argument callable building the upstream API client used by add_api_feed
+                            (default: market_data.MarketDataAPI, imported on first use).
+        """
+        self.api_factory = api_factory or model_factory("market_data:MarketDataAPI")
+        self._api = None
+        self._feeds = {}
+        self._subscriptions = {}
+        self._snapshot = MarketSnapshot()
+
+    @property
+    def snapshot(self):
+        """The latest snapshot (never mutated; safe to keep)."""
+        return self._snapshot
+
+    @property
+    def api(self):
+        if self._api is None:
+            self._api = self.api_factory()
+        return self._api
+
+    def add_feed(self, name, fetch, interval=30.0):
+        """
+        Register a polled feed. Registering an existing name keeps its fetch function and polls at the
+        shorter of the two intervals.
+
+        :param fetch: Zero-argument callable returning the feed data (or an awaitable of it).
+        :param interval: Seconds between fetches.
+        :return: The feed name.
+        """
+        feed = self._feeds.get(name)
+        if feed is None:
+            self._feeds[name] = _Feed(name, fetch, interval)
+        else:
+            feed.interval = min(feed.interval, interval)
+        return name
+
+    def add_api_feed(self, name, method, interval=30.0):
+        """Register a feed polling `method` (e.g. "get_arbitrage_data") of the shared upstream API client."""
+        return self.add_feed(name, lambda: getattr(self.api, method)(), interval)
+
+    def subscribe(self, *feeds, maxsize=1):
+        """
+        Subscribe to snapshots that update any of `feeds`, starting their polling if needed. Must be
+        called with the event loop running. If data is already available the first snapshot is queued
+        immediately.
+        """
+        unknown = [name for name in feeds if name not in self._feeds]
+        if unknown:
+            raise KeyError(f"Unknown market data feeds: {unknown}")
+        subscription = Subscription(self, feeds, maxsize)
+        for name in feeds:
+            self._subscriptions.setdefault(name, []).append(subscription)
+            self._start(self._feeds[name])
+        if any(name in self._snapshot for name in feeds):
+            subscription.offer(self._snapshot)
+        return subscription
+
+    async def stream(self, *feeds, maxsize=1):
+        """Async iterator over fresh snapshots of `feeds`; unsubscribes when the consumer stops iterating."""
+        subscription = self.subscribe(*feeds, maxsize=maxsize)
+        try:
+            async for snapshot in subscription:
+                yield snapshot
+        finally:
+            subscription.close()
+
+    def unsubscribe(self, subscription):
+        for name in subscription.feeds:
+            subscribers = self._subscriptions.get(name, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            feed = self._feeds[name]
+            if not subscribers and feed.task is not None:
+                feed.task.cancel()
+                feed.task = None
+
+    def _start(self, feed):
+        loop = asyncio.get_running_loop()
+        if feed.task is None or feed.task.done() or feed.task.get_loop() is not loop:
+            feed.task = loop.create_task(self._poll(feed), name=f"market-data-{feed.name}")
+
+    async def _poll(self, feed):
+        while True:
+            await self.refresh(feed.name)
+            await asyncio.sleep(feed.interval)
+
+    async def refresh(self, name):
+        """Fetch one feed now and publish the result if it changed."""
+        feed = self._feeds[name]
+        feed.stats["fetches"] += 1
+        try:
+            data = feed.fetch()
+            if inspect.isawaitable(data):
+                data = await data
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            feed.stats["errors"] += 1
+            logger.warning(f"Market data feed {name} failed: {e}")
+            return self._snapshot
+        return self.publish(name, data)
+
+    def publish(self, name, data):
+        """
+        Publish new data for a feed and notify its subscribers.
+
+        :return: The snapshot now current.
+        """
+        data = freeze(data)
+        current = self._snapshot
+        feed = self._feeds.get(name)
+        if name in current.feeds and current.feeds[name] == data:
+            if feed is not None:
+                feed.stats["unchanged"] += 1
+            return current
+        # Copy-on-write: only the small top-level mappings are copied, payloads are shared
+        feeds, versions, fetched_at = dict(current.feeds), dict(current.versions), dict(current.fetched_at)
+        feeds[name] = data
+        versions[name] = versions.get(name, 0) + 1
+        fetched_at[name] = time.time()
+        snapshot = MarketSnapshot(current.sequence + 1, feeds, versions, fetched_at, (name,))
+        self._snapshot = snapshot
+        if feed is not None:
+            feed.stats["published"] += 1
+        for subscription in self._subscriptions.get(name, ()):
+            subscription.offer(snapshot)
+        return snapshot
+
+    def stats(self):
+        """Per-feed fetch/publish counts and subscriber numbers."""
+        return {name: {**feed.stats, "interval": feed.interval,
+                       "subscribers": len(self._subscriptions.get(name, ()))}
+                for name, feed in self._feeds.items()}
+
+    async def close(self):
+        """Stop every polling task."""
+        tasks = [feed.task for feed in self._feeds.values() if feed.task is not None]
+        for feed in self._feeds.values():
+            feed.task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class FakeFeed:
+    """
+    Local stand-in for an upstream endpoint, for tests and offline runs: returns the scripted values in
+    order (repeating the last one), or raises a scripted exception, and counts its calls.
+
+        hub.add_feed("arbitrage", FakeFeed({"spread": 0.01}, {"spread": 0.02}), interval=0.01)
+    """
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    def push(self, *values):
+        """Append values to be returned by the next fetches."""
+        self.values.extend(values)
+
+    async def __call__(self):
+        self.calls += 1
+        value = self.values.pop(0) if len(self.values) > 1 else self.values[0]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+_hub = None
+
+
+def get_market_data_hub():
+    """Return the process-wide MarketDataHub shared by the strategy bots."""
+    global _hub
+    if _hub is None:
+        _hub = MarketDataHub()
+    return _hub
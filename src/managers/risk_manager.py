@@ -1,9 +1,12 @@
 import asyncio
+import inspect
+import numpy as np
 from centralized_logger import CentralizedLogger
 from src.safety.circuit_breaker import CircuitBreaker
 from src.safety.reorg_detection import ReorgDetection
 from src.utils.error_handler import handle_errors
 from src.list_manager import ListManager
+from src.ai.feature_engine import get_feature_engine
 
 logger = CentralizedLogger()
 circuit_breaker = CircuitBreaker()
@@ -11,8 +14,18 @@ reorg_detection = ReorgDetection()
 list_manager = ListManager()
 
 class RiskManager:
-    def __init__(self):
+    def __init__(self, fetch_prices=None, feature_engine=None):
+        """
+        :param fetch_prices: Optional zero-argument callable returning {asset: price} (or an awaitable of
+                             it), sampled every monitoring interval to feed the feature engine. Without
+                             it the engine must be fed by a price bot in this process (price_oracle_bot).
+        :param feature_engine: FeatureEngine to read volatility from (default: the shared one).
+        """
+        self.fetch_prices = fetch_prices
+        self.feature_engine = feature_engine or get_feature_engine()
+        self._warned_no_volatility = False
         self.risk_thresholds = {
+            # Per-tick realized volatility (RMS log return between consecutive price updates, not annualized)
             "volatility": 0.05,
             "drawdown_limit": 0.1,
             "position_size": 0.02
@@ -33,12 +46,14 @@ class RiskManager:
                 if circuit_breaker.is_triggered():
                     logger.log("warning", "Circuit breaker triggered. Stopping bots.")
                     self.stop_bots()
+                    await asyncio.sleep(30)
                     continue
 
                 # Detect reorganization risks
                 if reorg_detection.is_reorg_detected():
                     logger.log("warning", "Reorg detected. Pausing bots.")
                     self.pause_bots()
+                    await asyncio.sleep(30)
                     continue
 
                 # Check risk thresholds
@@ -69,10 +84,30 @@ class RiskManager:
     async def fetch_market_conditions(self):
         """
         Fetch real-time market conditions (e.g., volatility, drawdowns, etc.).
+
+        Volatility is the highest realized volatility across the assets tracked by the feature engine:
+        the root mean squared log return between consecutive price updates over the engine's volatility
+        window, i.e. per tick of whoever feeds the engine, not annualized. Reading it is constant-time.
         """
-        # Mock function for real-time data
-        await asyncio.sleep(1)  # Simulate API call
-        return {"volatility": 0.03, "position_size": 0.01}
+        engine = self.feature_engine
+        if self.fetch_prices is not None:
+            prices = self.fetch_prices()
+            if inspect.isawaitable(prices):
+                prices = await prices
+            engine.update(list(prices), list(prices.values()))
+        realized = engine.snapshot()["realized_volatility"]
+        if not np.isfinite(realized).any():
+            # No asset has a full volatility window yet, or nothing feeds the engine in this process
+            if not self._warned_no_volatility:
+                logger.log("warning", "No realized volatility available yet; using the default estimate.")
+                self._warned_no_volatility = True
+            return {"volatility": 0.03, "position_size": 0.01}
+        return {
+            "volatility": float(np.nanmax(realized)),
+            "asset_volatility": {asset: float(value) for asset, value in zip(engine.assets, realized)
+                                 if np.isfinite(value)},
+            "position_size": 0.01,
+        }
 
     def adjust_bot_activity(self, market_conditions):
         """
@@ -2,10 +2,10 @@ import asyncio
 import mysql.connector
 from centralized_logger import CentralizedLogger
 from src.utils.error_handler import handle_errors
-from src.database.database_manager import DatabaseManager
+from src.database.async_db import get_async_db
 
 logger = CentralizedLogger()
-db_manager = DatabaseManager()
+async_db = get_async_db()
 
 class MultiAgentManager:
     def __init__(self):
@@ -53,19 +53,14 @@ class MultiAgentManager:
         This helps keep track of active and paused agents.
         """
         try:
-            connection = db_manager.get_connection()
-            cursor = connection.cursor()
-
-            # Insert agent state into the agents table
+            # Insert agent state into the agents table, off the event loop thread
             query = """
                 INSERT INTO agents (strategy_name, status, timestamp)
                 VALUES (%s, %s, NOW())
             """
             data = (strategy["name"], status)
 
-            cursor.execute(query, data)
-            connection.commit()
-            cursor.close()
+            await async_db.execute(query, data)
 
             logger.log("info", f"Agent {strategy['name']} state stored in database: {status}")
 
@@ -1,6 +1,9 @@
 import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Optional, Tuple, Union
+from src.ai.agents.tabular_q import q_learning_batch_update
+
+TRANSITION_COLUMNS = ("state", "action", "reward", "next_state")
 
 class QLearningAgent:
     def __init__(self, alpha: float, gamma: float, epsilon: float, num_states: int, num_actions: int):
@@ -50,6 +53,76 @@ class QLearningAgent:
         next_q_value = self.q_table[next_state, np.argmax(self.q_table[next_state])]
         self.q_table[state, action] = (1 - self.alpha) * q_value + self.alpha * (reward + self.gamma * next_q_value)
 
+    def update_q_table_batch(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                             next_states: np.ndarray, dones: Optional[np.ndarray] = None,
+                             duplicates: str = "mean") -> np.ndarray:
+        """
+        Update Q-table for a batch of transitions with one vectorized Q-learning step.
+
+        TD targets are computed from the Q-table as it was before the batch, and repeated
+        (state, action) pairs are accumulated with np.add.at, so the result is deterministic
+        regardless of the order of transitions within the batch.
+
+        Args:
+        - states (np.ndarray): Current states.
+        - actions (np.ndarray): Chosen actions.
+        - rewards (np.ndarray): Received rewards.
+        - next_states (np.ndarray): Next states.
+        - dones (np.ndarray, optional): Terminal flags; terminal transitions do not bootstrap.
+        - duplicates (str): 'mean' applies the average update of repeated pairs once, 'sum' applies all of them.
+
+        Returns:
+        - td_errors (np.ndarray): TD error of each transition.
+        """
+        return q_learning_batch_update(self.q_table, states, actions, rewards, next_states, self.alpha, self.gamma,
+                                       dones=dones, duplicates=duplicates)
+
+    def replay_from_log(self, log: Union[str, pd.DataFrame], batch_size: int = 4096, epochs: int = 1,
+                        duplicates: str = "mean") -> int:
+        """
+        Retrain the Q-table from a log of transitions, e.g. a day of trades, in vectorized batches.
+
+        The log needs integer 'state', 'action', 'next_state' columns and a 'reward' column (an optional
+        'done' column marks terminal transitions). Batches are applied in log order.
+
+        Args:
+        - log (str or pd.DataFrame): DataFrame, or path to a .csv, .parquet or .npz file with those columns.
+        - batch_size (int): Transitions per vectorized update.
+        - epochs (int): Number of passes over the log.
+        - duplicates (str): Passed to update_q_table_batch.
+
+        Returns:
+        - updates (int): Number of transitions applied.
+        """
+        columns = self._load_transition_log(log)
+        total = len(columns["state"])
+        for _ in range(epochs):
+            for start in range(0, total, batch_size):
+                end = start + batch_size
+                self.update_q_table_batch(
+                    columns["state"][start:end], columns["action"][start:end], columns["reward"][start:end],
+                    columns["next_state"][start:end],
+                    dones=columns["done"][start:end] if "done" in columns else None,
+                    duplicates=duplicates,
+                )
+        return total * epochs
+
+    @staticmethod
+    def _load_transition_log(log: Union[str, pd.DataFrame]) -> dict:
+        if isinstance(log, str) and log.endswith(".npz"):
+            with np.load(log) as data:
+                columns = {name: data[name] for name in data.files}
+        else:
+            if isinstance(log, str):
+                log = pd.read_parquet(log) if log.endswith(".parquet") else pd.read_csv(log)
+            columns = {column: log[column].to_numpy() for column in log.columns}
+        missing = [column for column in TRANSITION_COLUMNS if column not in columns]
+        if missing:
+            raise ValueError(f"Transition log is missing columns: {missing}")
+        if "done" in columns:
+            columns["done"] = columns["done"].astype(bool)
+        return columns
+
     def save_q_table(self, file_path: str) -> None:
         """
         Save Q-table to a file.
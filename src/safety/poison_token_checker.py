@@ -3,6 +3,7 @@
 import logging
 import requests
 from mysql.connector import Error
+from src.database.connection_pool import get_pool
 from src.ai.ai_helpers import TokenSafetyHelper  # AI Helper for dynamic token safety checks
 
 # Initialize logger
@@ -22,23 +23,19 @@ class PoisonTokenChecker:
         self.mysql_config = mysql_config
         self.token_helper = TokenSafetyHelper()  # AI Helper for real-time token safety checks
 
-        # Connect to the MySQL database
-        self.connection = self.connect_db()
+        # Shared MySQL connection pool
+        self.pool = self.connect_db()
 
     def connect_db(self):
         """
-        Connects to the MySQL database using the provided configuration for blacklist/whitelist management.
+        Returns the shared connection pool for the provided blacklist/whitelist database configuration.
         """
-        try:
-            return mysql.connector.connect(
-                host=self.mysql_config['host'],
-                user=self.mysql_config['user'],
-                password=self.mysql_config['password'],
-                database=self.mysql_config['database']
-            )
-        except Error as e:
-            logger.error(f"Error connecting to MySQL: {e}")
-            raise
+        return get_pool({
+            'host': self.mysql_config['host'],
+            'user': self.mysql_config['user'],
+            'password': self.mysql_config['password'],
+            'database': self.mysql_config['database']
+        })
 
     def is_token_safe(self, token_address):
         """
@@ -59,10 +56,12 @@ class PoisonTokenChecker:
         Checks if the token is in the local blacklist stored in the database.
         """
         try:
-            cursor = self.connection.cursor()
-            query = "SELECT token_address FROM blacklist WHERE token_address = %s"
-            cursor.execute(query, (token_address,))
-            result = cursor.fetchone()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = "SELECT token_address FROM blacklist WHERE token_address = %s"
+                cursor.execute(query, (token_address,))
+                result = cursor.fetchone()
+                cursor.close()
             return result is not None
         except Error as e:
             logger.error(f"Error checking blacklist: {e}")
@@ -73,10 +72,12 @@ class PoisonTokenChecker:
         Checks if the token is in the whitelist stored in the database.
         """
         try:
-            cursor = self.connection.cursor()
-            query = "SELECT token_address FROM whitelist WHERE token_address = %s"
-            cursor.execute(query, (token_address,))
-            result = cursor.fetchone()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = "SELECT token_address FROM whitelist WHERE token_address = %s"
+                cursor.execute(query, (token_address,))
+                result = cursor.fetchone()
+                cursor.close()
             return result is not None
         except Error as e:
             logger.error(f"Error checking whitelist: {e}")
@@ -87,10 +88,12 @@ class PoisonTokenChecker:
         Adds a malicious token to the blacklist.
         """
         try:
-            cursor = self.connection.cursor()
-            query = "INSERT INTO blacklist (token_address) VALUES (%s)"
-            cursor.execute(query, (token_address,))
-            self.connection.commit()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                query = "INSERT INTO blacklist (token_address) VALUES (%s)"
+                cursor.execute(query, (token_address,))
+                connection.commit()
+                cursor.close()
             logger.info(f"Token {token_address} added to blacklist.")
         except Error as e:
             logger.error(f"Error adding token {token_address} to blacklist: {e}")
@@ -116,8 +119,7 @@ class PoisonTokenChecker:
 
     def close_connection(self):
         """
-        Closes the MySQL connection when done.
+        Kept for callers that close the checker when done. Connections are only borrowed per query from
+        the shared pool, which other components keep using, so there is nothing to release here;
+        close_all_pools() closes the pool at process exit.
         """
-        if self.connection.is_connected():
-            self.connection.close()
-            logger.info("MySQL connection closed.")
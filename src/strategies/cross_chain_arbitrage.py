@@ -1,33 +1,43 @@
 import asyncio
-from ai.agents.rl_agent import RLTradingAgent
+from src.ai.model_registry import model_factory
+from src.ai.inference_server import get_inference_client
 from centralized_logger import CentralizedLogger
 from src.managers.transaction_manager import TransactionManager
 from src.managers.risk_manager import RiskManager
-from market_data import MarketDataAPI
+from src.managers.market_data_hub import get_market_data_hub
 from src.utils.error_handler import handle_errors
 
 # Initialize components
 logger = CentralizedLogger()
-rl_agent = RLTradingAgent(environment="cross_chain_arbitrage")
+# RL model per trading environment, shared by the bots trading it, built on first use and served in micro-batches
+rl_agent = get_inference_client("rl_trading_agent:cross_chain_arbitrage", model_factory("src.ai.rl_agent:RLTradeDecider", environment="cross_chain_arbitrage"))
 transaction_manager = TransactionManager()
 risk_manager = RiskManager()
-market_data_api = MarketDataAPI()
+# Shared market-data hub: the feed is fetched once per process and pushed to every subscribed bot
+market_data_hub = get_market_data_hub()
+MARKET_DATA_FEED = market_data_hub.add_api_feed("cross_chain_arbitrage", "get_cross_chain_arbitrage_data", interval=60)
 
 class CrossChainArbitrageBot:
     def __init__(self):
         self.running = True
+        self.subscription = None
 
     async def run(self):
         logger.log_info("Starting Cross Chain Arbitrage Bot...")
 
         try:
-            while self.running:
+            # Wake up on fresh market data instead of polling on a timer
+            self.subscription = market_data_hub.subscribe(MARKET_DATA_FEED)
+            async for snapshot in self.subscription:
+                if not self.running:
+                    break
+
                 # Step 1: Fetch market data
-                market_data = await market_data_api.get_cross_chain_arbitrage_data()
-                logger.log_info(f"Fetched cross chain market data: {market_data}")
+                market_data = snapshot[MARKET_DATA_FEED]
+                logger.log_throttled("info", "cross_chain_arbitrage.market_data", "Fetched cross chain market data: %s", market_data)
 
                 # Step 2: AI decision making
-                action = rl_agent.decide_action(market_data)
+                action = await rl_agent.adecide_action(market_data)
                 logger.log_info(f"RL action decision: {action}")
 
                 # Step 3: Risk checks
@@ -45,17 +55,21 @@ class CrossChainArbitrageBot:
                     else:
                         logger.log_warning(f"Trade failed: {trade_data}")
                 else:
-                    logger.log_warning("Risk thresholds exceeded. Skipping trade execution.")
-
-                await asyncio.sleep(60)
+                    logger.log_throttled("warning", "cross_chain_arbitrage.risk", "Risk thresholds exceeded. Skipping trade execution.")
 
         except Exception as e:
             logger.log_error(f"Error in Cross Chain Arbitrage Bot: {str(e)}")
             handle_errors(e)
+        finally:
+            if self.subscription is not None:
+                self.subscription.close()
 
     def stop(self):
         logger.log_info("Stopping Cross Chain Arbitrage Bot...")
+        logger.log_suppressed_summary("cross_chain_arbitrage.")
         self.running = False
+        if self.subscription is not None:
+            self.subscription.close()  # Wake run() if it is waiting for market data
 
 if __name__ == "__main__":
     bot = CrossChainArbitrageBot()
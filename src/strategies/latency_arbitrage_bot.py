@@ -1,23 +1,28 @@
 import asyncio
-from ai.agents.rl_agent import RLTradingAgent
+from src.ai.model_registry import model_factory
+from src.ai.inference_server import get_inference_client
 from centralized_logger import CentralizedLogger
 from src.managers.transaction_manager import TransactionManager
 from src.managers.risk_manager import RiskManager
-from market_data import MarketDataAPI
+from src.managers.market_data_hub import get_market_data_hub
 from src.safety.safety_manager import SafetyManager
 from src.utils.error_handler import handle_errors
 
 # Initialize components
 logger = CentralizedLogger()
-rl_agent = RLTradingAgent(environment="latency_arbitrage")
+# RL model per trading environment, shared by the bots trading it, built on first use and served in micro-batches
+rl_agent = get_inference_client("rl_trading_agent:latency_arbitrage", model_factory("src.ai.rl_agent:RLTradeDecider", environment="latency_arbitrage"))
 transaction_manager = TransactionManager()
 risk_manager = RiskManager()
 safety_manager = SafetyManager()
-market_data_api = MarketDataAPI()
+# Shared market-data hub: the feed is fetched once per process and pushed to every subscribed bot
+market_data_hub = get_market_data_hub()
+MARKET_DATA_FEED = market_data_hub.add_api_feed("latency_arbitrage", "get_latency_arbitrage_data", interval=15)
 
 class LatencyArbitrageBot:
     def __init__(self):
         self.running = True
+        self.subscription = None
 
     async def run(self):
         """
@@ -26,13 +31,18 @@ class LatencyArbitrageBot:
         logger.log_info("Starting Latency Arbitrage Bot...")
 
         try:
-            while self.running:
+            # Wake up on fresh market data instead of polling on a timer
+            self.subscription = market_data_hub.subscribe(MARKET_DATA_FEED)
+            async for snapshot in self.subscription:
+                if not self.running:
+                    break
+
                 # Step 1: Fetch market data from multiple exchanges
-                market_data = await market_data_api.get_latency_arbitrage_data()
-                logger.log_info(f"Fetched latency arbitrage market data: {market_data}")
+                market_data = snapshot[MARKET_DATA_FEED]
+                logger.log_throttled("info", "latency_arbitrage_bot.market_data", "Fetched latency arbitrage market data: %s", market_data)
 
                 # Step 2: AI-driven decision making for latency arbitrage
-                action = rl_agent.decide_action(market_data)
+                action = await rl_agent.adecide_action(market_data)
                 logger.log_info(f"RL action decision: {action}")
 
                 # Step 3: Risk checks before executing trades
@@ -50,20 +60,24 @@ class LatencyArbitrageBot:
                     else:
                         logger.log_warning(f"Trade failed: {trade_data}")
                 else:
-                    logger.log_warning("Risk thresholds exceeded. Skipping trade execution.")
-
-                await asyncio.sleep(15)  # Fast cycle for latency opportunities
+                    logger.log_throttled("warning", "latency_arbitrage_bot.risk", "Risk thresholds exceeded. Skipping trade execution.")
 
         except Exception as e:
             logger.log_error(f"Error in Latency Arbitrage Bot: {str(e)}")
             handle_errors(e)
+        finally:
+            if self.subscription is not None:
+                self.subscription.close()
 
     def stop(self):
         """
         Gracefully stop the bot.
         """
         logger.log_info("Stopping Latency Arbitrage Bot...")
+        logger.log_suppressed_summary("latency_arbitrage_bot.")
         self.running = False
+        if self.subscription is not None:
+            self.subscription.close()  # Wake run() if it is waiting for market data
 
 if __name__ == "__main__":
     bot = LatencyArbitrageBot()
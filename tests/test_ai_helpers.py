@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from src.ai.ai_helpers import PredictionHelper, ReinforcementLearningHelper
+
+
+class TestPredictionHelper(unittest.TestCase):
+
+    def test_scalar_api_is_unchanged(self):
+        self.assertEqual(PredictionHelper.normalize_data([2, 4, 6]), [0.0, 0.5, 1.0])
+        self.assertAlmostEqual(PredictionHelper.evaluate_accuracy([1, 2, 3], [1, 2, 4]), 200 / 3)
+        with self.assertRaises(ValueError):
+            PredictionHelper.evaluate_accuracy([1, 2], [1])
+        with self.assertRaises(ValueError):
+            PredictionHelper.evaluate_accuracy([], [])
+        self.assertEqual(PredictionHelper.evaluate_accuracy(['buy', 'sell'], ['buy', 'hold']), 50.0)
+        with self.assertRaises(ValueError):
+            PredictionHelper.accuracy_metrics(np.empty((0, 3)), np.empty((0, 3)))
+
+    def test_normalize_array_per_column(self):
+        data = np.array([[0.0, 5.0, 1.0], [10.0, 5.0, 3.0], [5.0, 5.0, 2.0]])
+        np.testing.assert_allclose(PredictionHelper.normalize_array(data),
+                                   [[0.0, 0.0, 0.0], [1.0, 0.0, 1.0], [0.5, 0.0, 0.5]])
+
+    def test_accuracy_metrics_per_column(self):
+        actual = np.array([[1.0, 10.0], [2.0, 9.0], [3.0, 8.0], [2.0, 9.0]])
+        predictions = np.array([[1.0, 10.0], [2.5, 11.0], [3.0, 7.0], [2.5, 8.0]])
+        metrics = PredictionHelper.accuracy_metrics(predictions, actual)
+        np.testing.assert_allclose(metrics["accuracy"], [50.0, 25.0])
+        np.testing.assert_allclose(metrics["mae"], [0.25, 1.0])
+        # Predicted moves from the previous actual value: up, up, down vs. actual up, up, down / down, down, up
+        np.testing.assert_allclose(metrics["directional_accuracy"], [100.0, 100 / 3])
+
+
+class TestReinforcementLearningHelper(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.rewards = rng.normal(size=(40, 3))
+        self.values = rng.normal(size=(40, 3))
+
+    def test_compute_discounted_reward_matches_the_definition(self):
+        rewards = list(self.rewards[:, 0])
+        expected = sum(0.9 ** t * reward for t, reward in enumerate(rewards))
+        self.assertAlmostEqual(ReinforcementLearningHelper.compute_discounted_reward(rewards, 0.9), expected)
+        self.assertEqual(ReinforcementLearningHelper.compute_discounted_reward([]), 0)
+
+    def test_discounted_returns_with_bootstrap(self):
+        last_value = np.array([1.0, -1.0, 0.0])
+        returns = ReinforcementLearningHelper.discounted_returns(self.rewards, 0.95, last_value=last_value)
+        expected = np.empty_like(self.rewards)
+        running = last_value
+        for t in reversed(range(len(self.rewards))):
+            running = self.rewards[t] + 0.95 * running
+            expected[t] = running
+        np.testing.assert_allclose(returns, expected)
+        # Time along the last axis gives the same result transposed
+        np.testing.assert_allclose(
+            ReinforcementLearningHelper.discounted_returns(self.rewards.T, 0.95, last_value=last_value, axis=1),
+            expected.T)
+
+    def test_generalized_advantages_match_the_recursion(self):
+        advantages, returns = ReinforcementLearningHelper.generalized_advantages(
+            self.rewards, self.values, gamma=0.99, lam=0.9, last_value=0.5)
+        expected = np.empty_like(self.rewards)
+        running = np.zeros(3)
+        for t in reversed(range(len(self.rewards))):
+            next_value = self.values[t + 1] if t + 1 < len(self.rewards) else 0.5
+            running = self.rewards[t] + 0.99 * next_value - self.values[t] + 0.99 * 0.9 * running
+            expected[t] = running
+        np.testing.assert_allclose(advantages, expected)
+        np.testing.assert_allclose(returns, expected + self.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import importlib.util
+import threading
+import unittest
+from unittest import mock
+import warnings
+import numpy as np
+
+HAS_STATSMODELS = importlib.util.find_spec("statsmodels") is not None
+
+
+@unittest.skipUnless(HAS_STATSMODELS, "statsmodels is not installed")
+class TestARIMAModelCache(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter("ignore")
+        self.addCleanup(warnings.resetwarnings)
+        self.prices = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 400))
+
+    def test_incremental_update_matches_refiltering_with_fixed_params(self):
+        from src.ai.models.arima_model import ARIMAModel
+
+        model = ARIMAModel()
+        fitted = model.train(self.prices[:300])
+        for price in self.prices[300:320]:
+            model.update([price])
+        refiltered = fitted.apply(self.prices[:320])
+        np.testing.assert_allclose(model.predict(3), refiltered.forecast(3), rtol=1e-8)
+
+    def test_cache_fits_once_then_updates(self):
+        from src.ai.models.arima_model import ARIMAModelCache
+
+        cache = ARIMAModelCache(min_observations=100, refit_interval=50, drift_threshold=None)
+        self.assertFalse(cache.update("BTC", self.prices[:60]))
+        self.assertIsNone(cache.forecast("BTC"))
+        self.assertTrue(cache.update("BTC", self.prices[60:100]))
+        for price in self.prices[100:140]:
+            cache.update("BTC", price)
+        self.assertEqual(len(cache.forecast("BTC", steps=4)), 4)
+        self.assertEqual((cache.stats["fits"], cache.stats["updates"]), (1, 40))
+
+        for price in self.prices[140:150]:
+            cache.update("BTC", price)
+        self.assertEqual(cache.stats["scheduled_refits"], 1)
+
+    def test_drift_triggers_refit(self):
+        from src.ai.models.arima_model import ARIMAModelCache
+
+        cache = ARIMAModelCache(refit_interval=None, drift_threshold=3.0, drift_cooldown=5)
+        cache.update("ETH", self.prices[:200])
+        volatile = self.prices[199] + np.cumsum(np.random.default_rng(1).normal(0, 15, 60))
+        for price in volatile:
+            cache.update("ETH", price)
+        self.assertGreaterEqual(cache.stats["drift_refits"], 1)
+
+    def test_least_recently_used_assets_are_evicted(self):
+        from src.ai.models.arima_model import ARIMAModelCache
+
+        cache = ARIMAModelCache(max_assets=2)
+        cache.update("A", self.prices[:60])
+        cache.update("B", self.prices[:60])
+        cache.forecast("A")
+        cache.update("C", self.prices[:60])
+        self.assertIn("A", cache)
+        self.assertNotIn("B", cache)
+        self.assertEqual(cache.stats["evictions"], 1)
+
+    def test_slow_fit_does_not_block_other_assets(self):
+        from src.ai.models.arima_model import ARIMAModel, ARIMAModelCache
+
+        cache = ARIMAModelCache(refit_interval=None, drift_threshold=None)
+        cache.update("B", self.prices[:60])
+        started, release = threading.Event(), threading.Event()
+        train = ARIMAModel.train
+
+        def slow_train(model, data):
+            started.set()
+            release.wait(10)
+            return train(model, data)
+
+        with mock.patch.object(ARIMAModel, "train", slow_train):
+            worker = threading.Thread(target=cache.update, args=("A", self.prices[:60]))
+            worker.start()
+            self.assertTrue(started.wait(10))
+            self.assertFalse(cache.update("A", self.prices[60]))
+            self.assertTrue(cache.update("B", self.prices[60]))
+            self.assertIsNotNone(cache.forecast("B"))
+            release.set()
+            worker.join(10)
+        self.assertEqual(len(cache.forecast("A", steps=2)), 2)
+        self.assertEqual((cache.stats["fits"], cache._assets["A"].since_fit), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import unittest
+from src.database.async_db import AsyncDatabase
+from src.database.connection_pool import ConnectionPool
+
+
+class RecordingCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        self.conn.statements.append((query, params, threading.current_thread().name))
+        self.rowcount = 1
+
+    def executemany(self, query, rows):
+        self.conn.statements.extend((query, row, threading.current_thread().name) for row in rows)
+        self.rowcount = len(rows)
+
+    def fetchone(self):
+        return ("row",)
+
+    def fetchall(self):
+        return [("row",), ("row",)]
+
+    def close(self):
+        pass
+
+
+class RecordingConnection:
+    statements = []
+
+    def cursor(self):
+        return RecordingCursor(self)
+
+    def commit(self):
+        pass
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class TestAsyncDatabase(unittest.TestCase):
+
+    def setUp(self):
+        RecordingConnection.statements = []
+        self.db = AsyncDatabase(ConnectionPool({}, max_size=2, connect=RecordingConnection))
+        self.addCleanup(self.db.close)
+
+    def test_statements_run_off_the_event_loop_thread(self):
+        async def scenario():
+            loop_thread = threading.current_thread().name
+            await self.db.execute("INSERT INTO agents VALUES (%s)", ("bot",))
+            return loop_thread
+
+        loop_thread = asyncio.run(scenario())
+        self.assertEqual(len(RecordingConnection.statements), 1)
+        self.assertNotEqual(RecordingConnection.statements[0][2], loop_thread)
+
+    def test_fetch_and_executemany(self):
+        async def scenario():
+            count = await self.db.executemany("INSERT INTO logs VALUES (%s)", [("a",), ("b",)])
+            one = await self.db.fetchone("SELECT 1")
+            rows = await self.db.fetchall("SELECT 1")
+            return count, one, rows
+
+        count, one, rows = asyncio.run(scenario())
+        self.assertEqual(count, 2)
+        self.assertEqual(one, ("row",))
+        self.assertEqual(len(rows), 2)
+
+    def test_submit_does_not_wait(self):
+        future = self.db.submit("INSERT INTO logs VALUES (%s)", ("x",))
+        self.assertEqual(future.result(timeout=1), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import importlib.util
+import time
+import unittest
+import numpy as np
+from src.ai.models.batch_forecast import BatchForecaster
+
+HAS_STATSMODELS = importlib.util.find_spec("statsmodels") is not None
+
+
+def drift_forecast(series, steps):
+    """Cheap stand-in model: extrapolate the mean step."""
+    if len(series) < 2:
+        raise ValueError("series too short")
+    slope = (series[-1] - series[0]) / (len(series) - 1)
+    return series[-1] + slope * np.arange(1, steps + 1)
+
+
+def slow_forecast(series, steps):
+    if series[0] < 0:
+        time.sleep(30)
+    return np.full(steps, series[-1])
+
+
+class TestBatchForecaster(unittest.TestCase):
+
+    def test_results_are_aligned_with_assets(self):
+        series = {f"pool{i}": np.arange(10 + i, dtype=float) * (i + 1) for i in range(7)}
+        series["short"] = [1.0]
+        with BatchForecaster(drift_forecast, max_workers=2, chunk_size=3) as forecaster:
+            assets, forecasts, errors = forecaster.forecast(series, steps=2)
+        self.assertEqual(assets, list(series))
+        self.assertEqual(forecasts.shape, (8, 2))
+        for i in range(7):
+            np.testing.assert_allclose(forecasts[i], drift_forecast(np.asarray(series[f"pool{i}"]), 2))
+        self.assertTrue(np.isnan(forecasts[7]).all())
+        self.assertIn("series too short", errors["short"])
+
+    def test_timed_out_chunks_are_reported_and_pool_recovers(self):
+        forecaster = BatchForecaster(slow_forecast, max_workers=2, chunk_size=1, task_timeout=0.5)
+        try:
+            assets, forecasts, errors = forecaster.forecast({"ok": [1.0, 2.0], "hung": [-1.0, 0.0]}, steps=1)
+            self.assertEqual(forecasts[0, 0], 2.0)
+            self.assertTrue(np.isnan(forecasts[1, 0]))
+            self.assertIn("Timed out", errors["hung"])
+
+            _, forecasts, errors = forecaster.forecast({"again": [3.0, 4.0]}, steps=1)
+            self.assertEqual((forecasts[0, 0], errors), (4.0, {}))
+        finally:
+            forecaster.close()
+
+    def test_timeout_is_one_deadline_for_all_chunks(self):
+        forecaster = BatchForecaster(slow_forecast, max_workers=4, chunk_size=1, task_timeout=0.5)
+        try:
+            started = time.perf_counter()
+            _, forecasts, errors = forecaster.forecast({f"hung{i}": [-1.0, 0.0] for i in range(4)}, steps=1)
+            self.assertLess(time.perf_counter() - started, 1.5)
+            self.assertEqual(len(errors), 4)
+            self.assertTrue(np.isnan(forecasts).all())
+        finally:
+            forecaster.close()
+
+    @unittest.skipUnless(HAS_STATSMODELS, "statsmodels is not installed")
+    def test_arima_batch(self):
+        from src.ai.models.batch_forecast import forecast_batch
+
+        rng = np.random.default_rng(0)
+        series = {f"pool{i}": 100 + np.cumsum(rng.normal(0, 1, 120)) for i in range(3)}
+        assets, forecasts, errors = forecast_batch(series, steps=3, max_workers=2)
+        self.assertEqual((forecasts.shape, errors), ((3, 3), {}))
+        self.assertTrue(np.isfinite(forecasts).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+from unittest import mock
+from src.database.connection_pool import ConnectionPool, PoolTimeoutError, close_all_pools, get_pool
+from src.database.database_manager import DatabaseManager
+
+
+class FakeMySQLConnection:
+    """Stand-in for a mysql.connector connection."""
+
+    def __init__(self):
+        self.open = True
+        self.in_transaction = False
+        self.rollbacks = 0
+
+    def is_connected(self):
+        return self.open
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self):
+        self.open = False
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.created = []
+        self.pool = ConnectionPool({}, max_size=2, checkout_timeout=0.05, connect=self._connect)
+
+    def _connect(self):
+        conn = FakeMySQLConnection()
+        self.created.append(conn)
+        return conn
+
+    def test_connections_are_reused(self):
+        with self.pool.connection() as conn:
+            first = conn._raw
+        with self.pool.connection() as conn:
+            self.assertIs(conn._raw, first)
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(self.pool.stats()["checkouts"], 2)
+
+    def test_checkout_times_out_when_exhausted(self):
+        held = [self.pool.acquire(), self.pool.acquire()]
+        with self.assertRaises(PoolTimeoutError):
+            self.pool.acquire()
+        self.assertEqual(self.pool.stats()["timeouts"], 1)
+        for conn in held:
+            conn.close()
+
+    def test_waiting_checkout_gets_released_connection(self):
+        held = [self.pool.acquire(), self.pool.acquire()]
+        threading.Timer(0.01, held[0].close).start()
+        conn = self.pool.acquire(timeout=1.0)
+        self.assertIs(conn._raw, held[0]._raw)
+
+    def test_expired_connections_are_recycled(self):
+        self.pool.max_lifetime = 0.01
+        with self.pool.connection():
+            pass
+        time.sleep(0.02)
+        with self.pool.connection():
+            pass
+        self.assertEqual(len(self.created), 2)
+        self.assertFalse(self.created[0].open)
+
+    def test_dead_idle_connection_is_replaced(self):
+        self.pool.health_check_interval = 0
+        with self.pool.connection():
+            pass
+        self.created[0].open = False
+        with self.pool.connection() as conn:
+            self.assertIs(conn._raw, self.created[1])
+        self.assertEqual(self.pool.stats()["failed_health_checks"], 1)
+
+    def test_release_rolls_back_open_transaction(self):
+        with self.pool.connection() as conn:
+            conn._raw.in_transaction = True
+        self.assertEqual(self.created[0].rollbacks, 1)
+
+    def test_pool_never_exceeds_max_size(self):
+        def worker():
+            for _ in range(50):
+                with self.pool.connection(timeout=1.0):
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(len(self.created), 2)
+        self.assertEqual(self.pool.stats()["in_use"], 0)
+
+    def test_closing_one_manager_leaves_the_shared_pool_open(self):
+        first, second = DatabaseManager(pool=self.pool, write_behind=False), DatabaseManager(pool=self.pool, write_behind=False)
+        first.close_connection()
+        self.assertFalse(self.pool.closed)
+        with second.connection() as conn:
+            self.assertTrue(conn.is_connected())
+
+    def test_close_all_pools_runs_at_exit(self):
+        with mock.patch("src.database.connection_pool.atexit") as atexit_mock:
+            close_all_pools()
+            get_pool({"database": "atexit_test"}, connect=self._connect)
+            get_pool({"database": "atexit_test_2"}, connect=self._connect)
+            atexit_mock.register.assert_called_once_with(close_all_pools)
+            close_all_pools()
+            atexit_mock.unregister.assert_called_with(close_all_pools)
+
+    def test_close_all_pools_closes_shared_pools(self):
+        pool = get_pool({"database": "close_all_pools_test"}, connect=self._connect)
+        close_all_pools()
+        self.assertTrue(pool.closed)
+        self.assertIsNot(get_pool({"database": "close_all_pools_test"}, connect=self._connect), pool)
+        close_all_pools()
+
+
+if __name__ == "__main__":
+    unittest.main()
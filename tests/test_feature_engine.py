@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.ai.feature_engine import FeatureEngine
+
+
+def wilder_rsi(prices, period):
+    changes = np.diff(prices)
+    gains, losses = np.maximum(changes, 0), np.maximum(-changes, 0)
+    avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+    for gain, loss in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class TestFeatureEngine(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.assets = [f"asset{i}" for i in range(5)]
+        self.prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (300, 5)), axis=0))
+        self.volumes = rng.uniform(1, 10, (300, 5))
+
+    def test_matches_full_recomputation(self):
+        # Small capacity and resync interval exercise row growth and the exact resync
+        engine = FeatureEngine(window=20, momentum_period=10, rsi_period=14, capacity=2, resync_interval=37)
+        for prices, volumes in zip(self.prices, self.volumes):
+            engine.update(self.assets, prices, volumes)
+        snapshot = engine.snapshot(self.assets)
+
+        frame = pd.DataFrame(self.prices)
+        np.testing.assert_allclose(snapshot["sma"], frame.rolling(20).mean().iloc[-1])
+        np.testing.assert_allclose(snapshot["std"], frame.rolling(20).std().iloc[-1])
+        np.testing.assert_allclose(snapshot["ema"], frame.ewm(span=20, adjust=False).mean().iloc[-1])
+        np.testing.assert_allclose(snapshot["momentum"], self.prices[-1] - self.prices[-11])
+        vwap = (self.prices[-20:] * self.volumes[-20:]).sum(axis=0) / self.volumes[-20:].sum(axis=0)
+        np.testing.assert_allclose(snapshot["vwap"], vwap)
+        log_returns = np.diff(np.log(self.prices[-21:]), axis=0)
+        np.testing.assert_allclose(snapshot["realized_volatility"], np.sqrt((log_returns ** 2).mean(axis=0)))
+        np.testing.assert_allclose(snapshot["rsi"], [wilder_rsi(self.prices[:, i], 14) for i in range(5)])
+        np.testing.assert_allclose(snapshot["zscore"], (snapshot["price"] - snapshot["sma"]) / snapshot["std"])
+
+    def test_features_are_nan_until_the_window_fills(self):
+        engine = FeatureEngine(window=5, momentum_period=3, rsi_period=4)
+        for price in self.prices[:3, 0]:
+            engine.update(["a"], [price])
+        features = engine.features("a")
+        self.assertEqual(features["price"], self.prices[2, 0])
+        self.assertTrue(np.isnan(features["sma"]))
+        self.assertTrue(np.isnan(features["momentum"]))
+        engine.update(["a"], [self.prices[3, 0]])
+        self.assertAlmostEqual(engine.value("a", "momentum"), self.prices[3, 0] - self.prices[0, 0])
+
+    def test_update_all_and_partial_updates(self):
+        engine = FeatureEngine(window=3)
+        engine.update(["a", "b"], [1.0, 10.0])
+        engine.update_all([2.0, 20.0])
+        engine.update(["b"], [30.0])
+        engine.update(["a", "b"], [3.0, 40.0])
+        np.testing.assert_allclose(engine.snapshot()["sma"], [2.0, 30.0])
+
+    def test_reset_clears_history(self):
+        engine = FeatureEngine(window=2)
+        engine.update(["a"], [1.0])
+        engine.update(["a"], [2.0])
+        engine.reset(["a"])
+        engine.update(["a"], [5.0])
+        self.assertTrue(np.isnan(engine.value("a", "sma")))
+        engine.update(["a"], [7.0])
+        self.assertEqual(engine.value("a", "sma"), 6.0)
+        with self.assertRaises(KeyError):
+            engine.value("a", "macd")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import unittest
+from src.ai.inference_server import InferenceServer, batch_predictor
+
+
+class BatchRecordingModel:
+    def __init__(self):
+        self.batch_sizes = []
+        self.lock = threading.Lock()
+
+    def decide_actions(self, observations):
+        with self.lock:
+            self.batch_sizes.append(len(observations))
+        return [observation * 2 for observation in observations]
+
+
+class TestInferenceServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = InferenceServer(max_batch_size=32, max_latency_ms=50)
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_concurrent_async_callers_share_batches(self):
+        model = BatchRecordingModel()
+        self.server.register("model", model=model)
+
+        async def run():
+            return await asyncio.gather(*(self.server.apredict("model", i) for i in range(20)))
+
+        self.assertEqual(asyncio.run(run()), [i * 2 for i in range(20)])
+        self.assertLess(len(model.batch_sizes), 20)
+        metrics = self.server.metrics("model")
+        self.assertEqual(metrics["requests"], 20)
+        self.assertEqual(metrics["batches"], len(model.batch_sizes))
+        self.assertGreater(metrics["batch_size_mean"], 1)
+
+    def test_batch_size_is_capped(self):
+        model = BatchRecordingModel()
+        self.server.register("model", model=model, max_batch_size=4)
+        futures = [self.server.submit("model", i) for i in range(10)]
+        self.assertEqual([future.result(5) for future in futures], [i * 2 for i in range(10)])
+        self.assertLessEqual(max(model.batch_sizes), 4)
+
+    def test_model_is_loaded_once_per_name(self):
+        calls = []
+        factory = lambda: calls.append(1) or BatchRecordingModel()
+        self.server.register("model", factory=factory)
+        self.server.register("model", factory=factory)
+        self.assertEqual(len(calls), 0)
+        self.assertEqual(self.server.predict("model", 3, timeout=5), 6)
+        self.assertEqual(self.server.predict("model", 4, timeout=5), 8)
+        self.assertEqual(len(calls), 1)
+
+    def test_errors_reach_every_caller_in_the_batch(self):
+        def failing(observations):
+            raise RuntimeError("boom")
+
+        self.server.register("model", predict_batch=failing)
+        futures = [self.server.submit("model", i) for i in range(3)]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result(5)
+        self.assertEqual(self.server.metrics("model")["errors"], 3)
+
+    def test_single_item_models_fall_back_to_a_loop(self):
+        class SingleModel:
+            def decide_action(self, observation):
+                return observation + 1
+
+        self.assertEqual(batch_predictor(SingleModel())([1, 2]), [2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+from mysql.connector import Error
+from src.database.list_index import ListIndex
+
+
+class FakeCursor:
+    """Minimal cursor that understands the queries issued by ListIndex."""
+
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def execute(self, query, params=None):
+        self.db.queries += 1
+        if "list_changes" in query and not self.db.has_change_feed:
+            raise Error("Table 'list_changes' doesn't exist")
+        visible = [change for change in self.db.changes if change[0] not in self.db.uncommitted]
+        if query.startswith("SELECT COALESCE(MAX(id), 0)"):
+            self.rows = [(max([change[0] for change in visible], default=0),)]
+        elif query.startswith("SELECT id FROM list_changes"):
+            first, last = params
+            self.rows = [(change[0],) for change in visible if first <= change[0] <= last]
+        elif "WHERE id IN" in query:
+            self.rows = [change for change in visible if change[0] in params]
+        elif query.startswith("SELECT id, list_name"):
+            last_id, limit = params
+            self.rows = [change for change in visible if change[0] > last_id][:limit]
+        else:
+            list_name = query.split("FROM ")[1]
+            self.rows = [(token,) for token in self.db.tables[list_name]]
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """In-memory stand-in for the MySQL list tables and the list_changes feed."""
+
+    def __init__(self, has_change_feed=True):
+        self.tables = {"whitelist": set(), "blacklist": set(), "redlist": set(), "pumplist": set()}
+        self.changes = []
+        self.uncommitted = set()  # Change ids allocated by transactions that have not committed yet
+        self.queries = 0
+        self.has_change_feed = has_change_feed
+
+    def write(self, list_name, token_address, present, commit=True):
+        """Change a list; with commit=False the change (and its feed row) stays invisible until commit()."""
+        change_id = len(self.changes) + 1
+        self.changes.append((change_id, list_name, token_address, "insert" if present else "delete"))
+        if commit:
+            self._apply(list_name, token_address, present)
+        else:
+            self.uncommitted.add(change_id)
+        return change_id
+
+    def commit(self, change_id):
+        self.uncommitted.discard(change_id)
+        _, list_name, token_address, operation = self.changes[change_id - 1]
+        self._apply(list_name, token_address, operation == "insert")
+
+    def _apply(self, list_name, token_address, present):
+        if present:
+            self.tables[list_name].add(token_address)
+        else:
+            self.tables[list_name].discard(token_address)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class TestListIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.db = FakeConnection()
+        self.db.write("blacklist", "0xScam", True)
+        self.index = ListIndex(lambda: self.db, refresh_interval=3600)
+
+    def test_lookups_served_from_memory(self):
+        self.assertTrue(self.index.contains("blacklist", "0xScam"))
+        queries_after_load = self.db.queries
+        for _ in range(100):
+            self.assertFalse(self.index.contains("blacklist", "0xGood"))
+        self.assertEqual(self.db.queries, queries_after_load)
+        stats = self.index.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 100)
+        self.assertEqual(stats["full_reloads"], 1)
+
+    def test_change_feed_applies_inserts_and_deletes(self):
+        self.index.load()
+        self.db.write("whitelist", "0xPartner", True)
+        self.db.write("blacklist", "0xScam", False)
+        self.index.refresh()
+        self.assertTrue(self.index.contains("whitelist", "0xPartner"))
+        self.assertFalse(self.index.contains("blacklist", "0xScam"))
+        self.assertEqual(self.index.stats()["changes_applied"], 2)
+
+    def test_change_feed_paginates(self):
+        self.index.change_batch_size = 2
+        self.index.load()
+        for i in range(5):
+            self.db.write("redlist", f"0x{i}", True)
+        self.index.refresh()
+        self.assertEqual(self.index.sizes()["redlist"], 5)
+
+    def test_changes_committed_behind_the_watermark_are_not_skipped(self):
+        self.index.load()
+        slow = self.db.write("blacklist", "0xSlow", True, commit=False)
+        self.db.write("whitelist", "0xFast", True)
+        self.index.refresh()
+        self.assertTrue(self.index.contains("whitelist", "0xFast"))
+        self.assertFalse(self.index.contains("blacklist", "0xSlow"))
+        self.assertEqual(self.index.stats()["pending_gaps"], 1)
+
+        self.db.commit(slow)
+        self.index.refresh()
+        self.assertTrue(self.index.contains("blacklist", "0xSlow"))
+        self.assertEqual(self.index.stats()["late_changes"], 1)
+        self.assertEqual(self.index.stats()["pending_gaps"], 0)
+
+    def test_uncommitted_changes_below_the_load_watermark_are_tracked(self):
+        slow = self.db.write("redlist", "0xSlow", True, commit=False)
+        self.db.write("redlist", "0xFast", True)
+        self.index.load()
+        self.assertFalse(self.index.contains("redlist", "0xSlow"))
+        self.db.commit(slow)
+        self.index.refresh()
+        self.assertTrue(self.index.contains("redlist", "0xSlow"))
+
+    def test_rolled_back_ids_are_forgotten(self):
+        self.index.gap_timeout = -1  # Every gap has expired by the next poll
+        self.index.load()
+        self.db.write("blacklist", "0xRolledBack", True, commit=False)
+        self.db.write("whitelist", "0xFast", True)
+        self.index.refresh()
+        self.index.refresh()
+        self.assertEqual(self.index.stats()["pending_gaps"], 0)
+
+    def test_record_change_is_visible_immediately(self):
+        self.index.load()
+        self.index.record_change("pumplist", "0xPump", True)
+        self.assertTrue(self.index.contains("pumplist", "0xPump"))
+
+    def test_falls_back_to_full_reload_without_change_feed(self):
+        db = FakeConnection(has_change_feed=False)
+        index = ListIndex(lambda: db, refresh_interval=3600)
+        index.load()
+        db.tables["blacklist"].add("0xLate")
+        index.refresh()
+        self.assertTrue(index.contains("blacklist", "0xLate"))
+        self.assertEqual(index.stats()["full_reloads"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import threading
+import unittest
+from src.logging.log_pipeline import LogPipeline, get_pipeline, sampling_from_env
+
+
+class RecordingSink:
+    def __init__(self, gate=None, fail=False):
+        self.batches = []
+        self.gate = gate
+        self.fail = fail
+        self.writing = threading.Event()
+
+    def write(self, rows):
+        self.writing.set()
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail:
+            raise RuntimeError("sink down")
+        self.batches.append(list(rows))
+
+    @property
+    def rows(self):
+        return [row for batch in self.batches for row in batch]
+
+
+class TestLogPipeline(unittest.TestCase):
+
+    def make_pipeline(self, sink, **options):
+        pipeline = LogPipeline(sink, **options)
+        self.addCleanup(pipeline.close)
+        return pipeline
+
+    def test_rows_are_written_in_batches(self):
+        sink = RecordingSink()
+        pipeline = self.make_pipeline(sink, batch_size=50, flush_interval=5.0)
+        for i in range(120):
+            pipeline.emit("info", ("info", i))
+        self.assertTrue(pipeline.flush(timeout=2))
+        self.assertEqual([row[1] for row in sink.rows], list(range(120)))
+        self.assertLessEqual(max(len(batch) for batch in sink.batches), 50)
+        self.assertLess(len(sink.batches), 120)
+
+    def test_drop_oldest_keeps_newest_rows(self):
+        gate = threading.Event()
+        sink = RecordingSink(gate=gate)
+        pipeline = self.make_pipeline(sink, max_queue=5, batch_size=1, flush_interval=0.01)
+        pipeline.emit("info", ("info", "in-flight"))
+        # Wait until the consumer holds the first row and is blocked in the sink
+        self.assertTrue(sink.writing.wait(2))
+        for i in range(20):
+            self.assertTrue(pipeline.emit("info", ("info", i)))
+        gate.set()
+        pipeline.flush(timeout=2)
+        self.assertEqual([row[1] for row in sink.rows[1:]], list(range(15, 20)))
+        self.assertEqual(pipeline.stats()["dropped"], 15)
+
+    def test_drop_newest_rejects_when_full(self):
+        gate = threading.Event()
+        sink = RecordingSink(gate=gate)
+        pipeline = self.make_pipeline(sink, max_queue=3, batch_size=1, overflow_policy="drop_newest")
+        results = [pipeline.emit("info", ("info", i)) for i in range(10)]
+        self.assertIn(False, results)
+        gate.set()
+        pipeline.flush(timeout=2)
+        self.assertEqual([row[1] for row in sink.rows], list(range(len(sink.rows))))
+
+    def test_sampling_per_level(self):
+        sink = RecordingSink()
+        pipeline = self.make_pipeline(sink, sampling={"debug": 0, "info": 0.25})
+        for i in range(100):
+            pipeline.emit("DEBUG", ("debug", i))
+            pipeline.emit("info", ("info", i))
+            pipeline.emit("error", ("error", i))
+        pipeline.flush(timeout=2)
+        levels = [row[0] for row in sink.rows]
+        self.assertEqual(levels.count("debug"), 0)
+        self.assertEqual(levels.count("info"), 25)
+        self.assertEqual(levels.count("error"), 100)
+        self.assertEqual(sampling_from_env("debug=0, info=0.1"), {"debug": 0.0, "info": 0.1})
+
+    def test_close_drains_and_sink_errors_are_counted(self):
+        sink = RecordingSink()
+        pipeline = LogPipeline(sink, flush_interval=60.0)
+        for i in range(10):
+            pipeline.emit("info", ("info", i))
+        pipeline.close()
+        self.assertEqual(len(sink.rows), 10)
+        self.assertFalse(pipeline.emit("info", ("info", "late")))
+
+        failing = self.make_pipeline(RecordingSink(fail=True))
+        failing.emit("error", ("error", "lost"))
+        failing.flush(timeout=2)
+        self.assertEqual(failing.stats()["sink_errors"], 1)
+        self.assertEqual(failing.stats()["dropped"], 1)
+
+    def test_close_releases_pending_flushes(self):
+        gate = threading.Event()
+        sink = RecordingSink(gate=gate)
+        pipeline = LogPipeline(sink, batch_size=1)
+        self.addCleanup(gate.set)
+        pipeline.emit("info", ("info", 0))
+        self.assertTrue(sink.writing.wait(2))  # Consumer is stuck in the sink
+        flushed = []
+        flusher = threading.Thread(target=lambda: flushed.append(pipeline.flush()))
+        flusher.start()
+        pipeline.close(timeout=0.1)
+        flusher.join(2)
+        self.assertEqual(flushed, [True])
+        self.assertTrue(pipeline.flush())
+
+    def test_shared_pipeline_survives_one_holder_closing_it(self):
+        sinks = []
+
+        def sink_factory():
+            sinks.append(RecordingSink())
+            return sinks[-1]
+
+        first = get_pipeline("test_shared_close", sink_factory)
+        self.assertIs(get_pipeline("test_shared_close", sink_factory), first)
+        first.emit("info", ("info", "before"))
+        first.close()
+        # Another logger resolving the shared pipeline keeps logging
+        second = get_pipeline("test_shared_close", sink_factory)
+        self.addCleanup(second.close)
+        self.assertIsNot(second, first)
+        self.assertTrue(second.emit("info", ("info", "after")))
+        self.assertTrue(second.flush(timeout=2))
+        self.assertEqual([row[1] for sink in sinks for row in sink.rows], ["before", "after"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from src.logging.log_throttle import LazyMessage, LogThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingPayload:
+    renders = 0
+
+    def __repr__(self):
+        CountingPayload.renders += 1
+        return "payload"
+
+
+class TestLogThrottle(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.throttle = LogThrottle(interval=10, clock=self.clock)
+
+    def test_one_record_per_interval_per_key_with_summary(self):
+        self.assertEqual(self.throttle.process("bot.data", LazyMessage("tick %d", (0,))), "tick 0")
+        for i in range(1, 5):
+            self.clock.now += 1
+            self.assertIsNone(self.throttle.process("bot.data", LazyMessage("tick %d", (i,))))
+        self.assertEqual(self.throttle.process("other.data", "independent key"), "independent key")
+        self.clock.now += 10
+        text = self.throttle.process("bot.data", LazyMessage("tick %d", (5,)))
+        self.assertTrue(text.startswith("tick 5 [4 similar messages suppressed"))
+
+    def test_throttled_records_are_never_formatted(self):
+        CountingPayload.renders = 0
+        for _ in range(100):
+            self.throttle.process("bot.data", LazyMessage("data %r", (CountingPayload(),)))
+        self.assertEqual(CountingPayload.renders, 1)
+
+    def test_identical_messages_are_deduplicated(self):
+        throttle = LogThrottle(interval=0, dedupe_interval=60, clock=self.clock)
+        self.assertEqual(throttle.process("bot.trade", "same"), "same")
+        self.assertIsNone(throttle.process("bot.trade", "same"))
+        self.assertIsNone(throttle.process("bot.trade", "same"))
+        self.assertIn("2 identical", throttle.process("bot.trade", "different"))
+        self.clock.now += 61
+        self.assertEqual(throttle.process("bot.trade", "different"), "different")
+
+    def test_pending_summaries_by_prefix(self):
+        for key in ("a.data", "a.data", "a.data", "b.data", "b.data"):
+            self.throttle.process(key, "x")
+        self.assertEqual(self.throttle.pending_summaries("a."), {"a.data": 2})
+        self.assertEqual(self.throttle.pending_summaries(), {"b.data": 1})
+        self.assertEqual(self.throttle.pending_summaries(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
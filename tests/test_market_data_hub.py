@@ -0,0 +1,145 @@
+import asyncio
+import unittest
+import numpy as np
+import pandas as pd
+from src.managers.market_data_hub import FakeFeed, MarketDataHub
+
+
+class TestMarketDataHub(unittest.TestCase):
+
+    def test_one_fetch_per_update_fans_out_to_every_subscriber(self):
+        async def run():
+            hub = MarketDataHub()
+            feed = FakeFeed({"spread": 0.01})
+            hub.add_feed("arbitrage", feed, interval=10)
+            subscriptions = [hub.subscribe("arbitrage") for _ in range(16)]
+            snapshots = await asyncio.gather(*(subscription.get() for subscription in subscriptions))
+            await hub.close()
+            return feed, snapshots
+
+        feed, snapshots = asyncio.run(run())
+        self.assertEqual(feed.calls, 1)
+        self.assertEqual({snapshot["arbitrage"]["spread"] for snapshot in snapshots}, {0.01})
+        # Every bot gets the very same immutable snapshot
+        self.assertTrue(all(snapshot is snapshots[0] for snapshot in snapshots))
+
+    def test_snapshots_are_copy_on_write(self):
+        hub = MarketDataHub()
+        hub.add_feed("prices", FakeFeed(None))
+        hub.add_feed("liquidity", FakeFeed(None))
+        first = hub.publish("prices", {"ETH": [3000.0, 3001.0]})
+        second = hub.publish("liquidity", {"pool": 1e6})
+        third = hub.publish("prices", {"ETH": [3002.0]})
+        self.assertEqual(first["prices"]["ETH"], (3000.0, 3001.0))
+        self.assertNotIn("liquidity", first)
+        self.assertIs(second["prices"], first["prices"])
+        self.assertIs(third["liquidity"], second["liquidity"])
+        self.assertEqual(third.versions["prices"], 2)
+        self.assertEqual(third.updated, {"prices"})
+        with self.assertRaises(TypeError):
+            third["prices"]["ETH"] = 1
+
+    def test_unchanged_data_is_not_republished(self):
+        async def run():
+            hub = MarketDataHub()
+            feed = FakeFeed({"gas": 30}, {"gas": 30}, {"gas": 31})
+            hub.add_feed("gas", feed, interval=0.01)
+            subscription = hub.subscribe("gas")
+            first = await subscription.get()
+            second = await subscription.get()
+            await hub.close()
+            return hub, first, second
+
+        hub, first, second = asyncio.run(run())
+        self.assertEqual((first["gas"]["gas"], second["gas"]["gas"]), (30, 31))
+        self.assertEqual(second.sequence, first.sequence + 1)
+        self.assertGreaterEqual(hub.stats()["gas"]["unchanged"], 1)
+
+    def test_slow_subscribers_get_the_latest_snapshot(self):
+        async def run():
+            hub = MarketDataHub()
+            hub.add_feed("prices", FakeFeed(None), interval=10)
+            subscription = hub.subscribe("prices")
+            for price in range(5):
+                hub.publish("prices", {"ETH": price})
+            snapshot = await subscription.get()
+            await hub.close()
+            return snapshot, subscription
+
+        snapshot, subscription = asyncio.run(run())
+        self.assertEqual(snapshot["prices"]["ETH"], 4)
+        self.assertEqual(subscription.dropped, 4)
+
+    def test_fetch_errors_are_retried_and_polling_stops_without_subscribers(self):
+        async def run():
+            hub = MarketDataHub()
+            feed = FakeFeed(ConnectionError("down"), {"price": 1})
+            hub.add_feed("prices", feed, interval=0.01)
+            async for snapshot in hub.stream("prices"):
+                break
+            await asyncio.sleep(0.05)
+            calls = feed.calls
+            await asyncio.sleep(0.05)
+            self.assertEqual(feed.calls, calls)
+            return hub, feed, snapshot
+
+        hub, feed, snapshot = asyncio.run(run())
+        self.assertEqual(snapshot["prices"], {"price": 1})
+        self.assertEqual(hub.stats()["prices"]["errors"], 1)
+        self.assertEqual(hub.stats()["prices"]["subscribers"], 0)
+
+    def test_feeds_poll_a_shared_api_client(self):
+        class Api:
+            calls = 0
+
+            def get_arbitrage_data(self):
+                Api.calls += 1
+                return {"spread": 0.02}
+
+        hub = MarketDataHub(api_factory=Api)
+        self.assertEqual(hub.add_api_feed("arbitrage", "get_arbitrage_data", interval=30), "arbitrage")
+        hub.add_api_feed("arbitrage", "get_arbitrage_data", interval=15)
+        snapshot = asyncio.run(hub.refresh("arbitrage"))
+        self.assertEqual(snapshot["arbitrage"]["spread"], 0.02)
+        self.assertEqual(hub.stats()["arbitrage"]["interval"], 15)
+        with self.assertRaises(KeyError):
+            hub.subscribe("unknown")
+
+    def test_closing_a_subscription_wakes_its_consumer(self):
+        async def run():
+            hub = MarketDataHub()
+            hub.add_feed("gas", FakeFeed(None), interval=10)
+            subscription = hub.subscribe("gas")
+            received = []
+
+            async def consume():
+                async for snapshot in subscription:
+                    received.append(snapshot)
+
+            consumer = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.01)  # Consumer is now waiting for data that never changes
+            subscription.close()
+            await asyncio.wait_for(consumer, 1)
+            await hub.close()
+            return hub, received, await subscription.get()
+
+        hub, received, after_close = asyncio.run(run())
+        self.assertEqual(len(received), 1)
+        self.assertIsNone(after_close)
+        self.assertEqual(hub.stats()["gas"]["subscribers"], 0)
+
+    def test_array_payloads_are_frozen_and_compared(self):
+        hub = MarketDataHub()
+        hub.add_feed("prices", FakeFeed(None))
+        first = hub.publish("prices", np.array([1.0, 2.0]))
+        self.assertIs(hub.publish("prices", np.array([1.0, 2.0])), first)
+        self.assertEqual(first["prices"], (1.0, 2.0))
+        frame = pd.DataFrame({"ETH": [3000.0], "BTC": [60000.0]})
+        second = hub.publish("prices", frame)
+        self.assertIs(hub.publish("prices", frame.copy()), second)
+        self.assertEqual(second["prices"]["ETH"][0], 3000.0)
+        self.assertIsNot(hub.publish("prices", pd.Series([1.0, 2.0])), second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.ai.mmap_replay_store import MemmapReplayStore
+
+
+def _append_worker(path, writer_id, count):
+    store = MemmapReplayStore(path)
+    for i in range(count):
+        store.push(np.full(4, writer_id), writer_id, float(i), np.full(4, writer_id), False)
+    store.close()
+
+
+class TestMemmapReplayStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "replay", "transitions.bin")
+
+    def test_push_sample_and_reopen(self):
+        store = MemmapReplayStore(self.path, capacity=100, state_dim=3, seed=0)
+        for i in range(40):
+            store.push([i, i, i], i % 3, float(i), [i + 1] * 3, i == 39)
+        store.close()
+
+        reopened = MemmapReplayStore(self.path, seed=1)
+        self.assertEqual(len(reopened), 40)
+        states, actions, rewards, next_states, dones = reopened.sample(32)
+        self.assertEqual(states.shape, (32, 3))
+        np.testing.assert_array_equal(states[:, 0], rewards)
+        np.testing.assert_array_equal(next_states[:, 0], rewards + 1)
+        np.testing.assert_array_equal(actions, rewards.astype(np.int64) % 3)
+        self.assertEqual(dones.dtype, bool)
+        with self.assertRaises(ValueError):
+            MemmapReplayStore(self.path, capacity=50)
+
+    def test_ring_wraps_and_uncommitted_slots_are_skipped(self):
+        store = MemmapReplayStore(self.path, capacity=10, state_dim=1, seed=0)
+        for start in (0, 10):
+            values = np.arange(start, start + 10)
+            store.push_batch(values[:, None], np.zeros(10), values, np.zeros((10, 1)), np.zeros(10))
+        self.assertEqual(set(store.sample(200)[2].tolist()), set(range(10, 20)))
+
+        start = store.reserve(1)  # a writer that reserved a slot but has not committed it yet
+        store.records["seq"][start % store.capacity] = 0
+        rewards = store.sample(200)[2]
+        self.assertNotIn(float(start - 10), rewards.tolist())
+        store.close()
+
+    def test_concurrent_writer_processes(self):
+        MemmapReplayStore(self.path, capacity=1000, state_dim=4).close()
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=_append_worker, args=(self.path, w, 100)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+
+        store = MemmapReplayStore(self.path)
+        self.assertEqual(store.cursor, 400)
+        records = store.window(0, 400)
+        self.assertTrue(np.all(records["seq"] > 0))
+        self.assertEqual(sorted(np.bincount(records["action"]).tolist()), [100] * 4)
+        np.testing.assert_array_equal(records["state"][:, 0], records["action"])
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import unittest
+from src.ai.model_registry import LazyModel, ModelRegistry, model_factory
+
+
+class DummyModel:
+    instances = 0
+
+    def __init__(self, scale=1):
+        DummyModel.instances += 1
+        self.scale = scale
+        self.payload = bytearray(8 * 2 ** 20)
+
+    def predict(self, x):
+        return x * self.scale
+
+
+class TestModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        DummyModel.instances = 0
+        self.registry = ModelRegistry()
+
+    def test_models_are_built_lazily_and_shared(self):
+        first = self.registry.lazy("dummy", model_factory(DummyModel, scale=3))
+        with self.assertLogs("src.ai.model_registry", level="WARNING") as logs:
+            second = self.registry.lazy("dummy", model_factory(DummyModel, scale=5))
+        self.assertIn("already registered", logs.output[0])
+        self.assertIsInstance(first, LazyModel)
+        self.assertEqual(DummyModel.instances, 0)
+        self.assertEqual(first.predict(2), 6)
+        self.assertEqual(second.predict(2), 6)  # The first registration wins
+        self.assertIs(first.instance, second.instance)
+        self.assertEqual(DummyModel.instances, 1)
+
+    def test_same_registration_does_not_warn(self):
+        self.registry.register("dummy", model_factory(DummyModel, scale=3))
+        with self.assertNoLogs("src.ai.model_registry", level="WARNING"):
+            self.registry.register("dummy", model_factory(DummyModel, scale=3))
+
+    def test_import_path_factory_defers_import(self):
+        self.registry.register("counter", "collections:Counter")
+        self.assertFalse(self.registry.is_loaded("counter"))
+        self.assertEqual(self.registry.get("counter")["missing"], 0)
+
+    def test_background_warm_up_and_stats(self):
+        self.registry.register("dummy", model_factory(DummyModel))
+        self.registry.register("broken", model_factory("no_such_module_xyz:Model"))
+        thread = self.registry.warm_up()
+        self.assertIsInstance(thread, threading.Thread)
+        thread.join(10)
+
+        stats = self.registry.stats()
+        self.assertTrue(stats["models"]["dummy"]["loaded"])
+        self.assertGreaterEqual(stats["models"]["dummy"]["load_seconds"], 0)
+        self.assertIsNotNone(stats["models"]["dummy"]["rss_delta_bytes"])
+        self.assertFalse(stats["models"]["broken"]["loaded"])
+        self.assertIn("ModuleNotFoundError", stats["models"]["broken"]["error"])
+        self.assertGreater(stats["process_rss_bytes"], 0)
+        self.assertEqual(list(self.registry.errors()), ["broken"])
+
+    def test_concurrent_first_use_builds_once(self):
+        self.registry.register("dummy", model_factory(DummyModel))
+        threads = [threading.Thread(target=self.registry.get, args=("dummy",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(DummyModel.instances, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
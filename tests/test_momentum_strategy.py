@@ -24,5 +24,14 @@ class TestMomentumStrategy(unittest.TestCase):
         self.assertEqual(signal, "sell")
         print(f"Sell signal: {signal}")
 
+    def test_reads_momentum_from_the_feature_engine(self):
+        """Test that a feature engine, when given, replaces the environment as the momentum source."""
+        engine = Mock()
+        engine.value.return_value = -0.5
+        strategy = MomentumStrategy(self.mock_trading_env, feature_engine=engine, asset="ETH")
+        self.assertEqual(strategy.get_signal(), "sell")
+        engine.value.assert_called_once_with("ETH", "momentum")
+        self.mock_trading_env.get_momentum.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
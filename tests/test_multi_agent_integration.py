@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from unittest.mock import Mock
 from src.ai.multi_agent_manager import MultiAgentManager
 
@@ -8,7 +9,8 @@ class TestMultiAgentIntegration(unittest.TestCase):
     def setUp(self):
         """Set up mocks for strategies and agent configurations."""
         # Mock the agent configuration
-        self.mock_agent_config = [{'market_data': 'mock_market_data'}]
+        prices = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, 200)))
+        self.mock_agent_config = [{'market_data': prices}]
 
         # Mock the strategies for the multi-agent manager
         self.mock_strategies = Mock()
@@ -0,0 +1,197 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.ai.numpy_runtime import NumpyModel, StreamingLSTM, save_exported_model
+
+HAS_TORCH = importlib.util.find_spec("torch") is not None
+HAS_TENSORFLOW = importlib.util.find_spec("tensorflow") is not None
+
+
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def reference_lstm(x, kernel, recurrent, bias, return_sequences):
+    """Textbook LSTM in float64, gates in i, f, g, o order."""
+    units = recurrent.shape[0]
+    h = np.zeros((x.shape[0], units))
+    c = np.zeros((x.shape[0], units))
+    outputs = []
+    for t in range(x.shape[1]):
+        z = x[:, t] @ kernel + h @ recurrent + bias
+        i, f, g, o = (z[:, k * units:(k + 1) * units] for k in range(4))
+        c = sigmoid(f) * c + sigmoid(i) * np.tanh(g)
+        h = sigmoid(o) * np.tanh(c)
+        outputs.append(h)
+    return np.stack(outputs, axis=1) if return_sequences else h
+
+
+def lstm_layer(rng, features, units, return_sequences):
+    spec = {"type": "lstm", "units": units, "return_sequences": return_sequences,
+            "activation": "tanh", "recurrent_activation": "sigmoid"}
+    weights = {"kernel": rng.normal(0, 0.3, (features, 4 * units)),
+               "recurrent_kernel": rng.normal(0, 0.3, (units, 4 * units)),
+               "bias": rng.normal(0, 0.1, 4 * units)}
+    return spec, weights
+
+
+class TestNumpyModel(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_dense_stack_matches_reference(self):
+        w1, b1 = self.rng.normal(size=(8, 16)), self.rng.normal(size=16)
+        w2, b2 = self.rng.normal(size=(16, 3)), self.rng.normal(size=3)
+        model = NumpyModel([({"type": "dense", "activation": "relu"}, {"kernel": w1, "bias": b1}),
+                            ({"type": "dense", "activation": "linear"}, {"kernel": w2, "bias": b2})])
+        x = self.rng.normal(size=(5, 8))
+        expected = np.maximum(x @ w1 + b1, 0) @ w2 + b2
+        np.testing.assert_allclose(model.predict(x), expected, rtol=1e-4, atol=1e-4)
+        np.testing.assert_allclose(model.predict(x[0]), expected[0], rtol=1e-4, atol=1e-4)
+
+    def test_hard_sigmoid_matches_keras(self):
+        kernel, bias = np.eye(4), np.zeros(4)
+        model = NumpyModel([({"type": "dense", "activation": "hard_sigmoid"}, {"kernel": kernel, "bias": bias})])
+        x = np.array([[-4.0, -1.5, 0.0, 2.0], [1.5, 3.0, 6.0, -3.0]])
+        expected = np.minimum(np.maximum(x + 3, 0), 6) / 6  # relu6(x + 3) / 6
+        np.testing.assert_allclose(model.predict(x), expected, rtol=1e-6, atol=1e-6)
+
+    def test_stacked_lstm_matches_reference_and_reuses_buffers(self):
+        first, second = lstm_layer(self.rng, 4, 6, True), lstm_layer(self.rng, 6, 5, False)
+        dense = ({"type": "dense", "activation": "linear"},
+                 {"kernel": self.rng.normal(size=(5, 1)), "bias": np.zeros(1)})
+        model = NumpyModel([first, second, dense])
+        x = self.rng.normal(size=(3, 7, 4))
+
+        hidden = reference_lstm(x, *first[1].values(), True)
+        hidden = reference_lstm(hidden, *second[1].values(), False)
+        expected = hidden @ dense[1]["kernel"]
+        np.testing.assert_allclose(model.predict(x), expected, rtol=1e-4, atol=1e-5)
+
+        buffers = len(model._buffers)
+        model.predict(x)
+        self.assertEqual(len(model._buffers), buffers)
+
+    def test_export_round_trip(self):
+        layers = [lstm_layer(self.rng, 2, 3, False),
+                  ({"type": "dense", "activation": "sigmoid"}, {"kernel": self.rng.normal(size=(3, 2)),
+                                                                "bias": np.zeros(2)})]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "model.npz")
+            save_exported_model(path, layers, {"framework": "test"})
+            loaded = NumpyModel.load(path)
+        x = self.rng.normal(size=(4, 5, 2))
+        np.testing.assert_allclose(loaded.predict(x), NumpyModel(layers).predict(x), rtol=1e-6)
+        self.assertEqual(loaded.metadata["framework"], "test")
+        self.assertEqual(len(loaded.predict_batch(list(x))), 4)
+
+
+class TestStreamingLSTM(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        dense = ({"type": "dense", "activation": "linear"},
+                 {"kernel": rng.normal(size=(5, 2)), "bias": rng.normal(size=2)})
+        self.model = NumpyModel([lstm_layer(rng, 3, 6, True), lstm_layer(rng, 6, 5, False), dense])
+        self.bars = rng.normal(size=(3, 40, 3)).astype(np.float32)  # 3 assets, 40 bars
+
+    def test_streaming_matches_full_history_without_resync(self):
+        stream = StreamingLSTM(self.model, window=8, resync_interval=0)
+        for t in range(12):
+            out = stream.update(["a", "b", "c"], self.bars[:, t])
+        np.testing.assert_allclose(out, self.model.predict(self.bars[:, :12]), rtol=1e-4, atol=1e-5)
+
+    def test_resync_every_bar_matches_window_predictions(self):
+        stream = StreamingLSTM(self.model, window=8, resync_interval=1)
+        for t in range(20):
+            out = stream.update(["a", "b", "c"], self.bars[:, t])
+            expected = self.model.predict(self.bars[:, max(0, t - 7):t + 1])
+            np.testing.assert_allclose(out, expected, rtol=1e-4, atol=1e-5)
+
+    def test_assets_update_independently_and_capacity_grows(self):
+        stream = StreamingLSTM(self.model, window=8, capacity=1)
+        for t in range(10):
+            joint = stream.update(["a", "b"], self.bars[:2, t])
+            if t % 2 == 0:
+                stream.update(["c"], self.bars[2, t // 2][None])
+        solo = StreamingLSTM(self.model, window=8)
+        for t in range(10):
+            alone = solo.update(["b"], self.bars[1, t][None])
+        np.testing.assert_allclose(joint[1], alone[0], rtol=1e-4, atol=1e-5)
+        self.assertEqual(stream.assets, ["a", "b", "c"])
+
+        stream.resync(["a"])
+        np.testing.assert_allclose(stream.update(["a"], self.bars[0, 10][None])[0],
+                                   self.model.predict(self.bars[0, 2:11]), rtol=1e-4, atol=1e-5)
+
+
+@unittest.skipUnless(HAS_TORCH, "torch is not installed")
+class TestTorchParity(unittest.TestCase):
+
+    def test_dnn_trading_model(self):
+        import torch
+        from src.ai.dnn_model import DNNTradingModel
+
+        model = DNNTradingModel(10, 32, 3).eval()
+        x = np.random.default_rng(0).normal(size=(6, 10)).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dnn.npz")
+            model.export_numpy(path)
+            runtime = NumpyModel.load(path)
+        with torch.no_grad():
+            expected = model(torch.from_numpy(x)).numpy()
+        np.testing.assert_allclose(runtime.predict(x), expected, rtol=1e-4, atol=1e-5)
+
+    def test_lstm(self):
+        import torch
+        from src.ai.numpy_runtime import export_torch_layers
+
+        lstm = torch.nn.LSTM(4, 8, num_layers=2, batch_first=True).eval()
+        head = torch.nn.Linear(8, 1).eval()
+        x = np.random.default_rng(0).normal(size=(3, 9, 4)).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lstm.npz")
+            export_torch_layers([lstm, head], path)
+            runtime = NumpyModel.load(path)
+        with torch.no_grad():
+            expected = head(lstm(torch.from_numpy(x))[0][:, -1]).numpy()
+        np.testing.assert_allclose(runtime.predict(x), expected, rtol=1e-4, atol=1e-5)
+
+
+@unittest.skipUnless(HAS_TENSORFLOW, "tensorflow is not installed")
+class TestKerasParity(unittest.TestCase):
+
+    def test_lstm_model(self):
+        # Same architecture as LSTMModel.build_model, built here because lstm_model imports the
+        # centralized logger, which is not importable in tests
+        from tensorflow.keras.layers import LSTM, Dense, Input
+        from tensorflow.keras.models import Sequential
+        from src.ai.numpy_runtime import export_keras_model
+
+        model = Sequential([Input((12, 3)), LSTM(50, return_sequences=True), LSTM(50), Dense(25), Dense(1)])
+        x = np.random.default_rng(0).normal(size=(4, 12, 3)).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lstm.npz")
+            export_keras_model(model, path)
+            runtime = NumpyModel.load(path)
+        expected = model.predict(x, verbose=0)
+        np.testing.assert_allclose(runtime.predict(x), expected, rtol=1e-4, atol=1e-5)
+
+    def test_dnn_model(self):
+        from src.ai.models.dnn_model import DNNModel
+
+        model = DNNModel(input_shape=(20,))
+        x = np.random.default_rng(0).normal(size=(8, 20)).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dnn.npz")
+            model.export_numpy(path)
+            runtime = NumpyModel.load(path)
+        expected = model.model.predict(x, verbose=0)
+        np.testing.assert_allclose(runtime.predict(x), expected, rtol=1e-4, atol=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()
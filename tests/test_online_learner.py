@@ -0,0 +1,116 @@
+import threading
+import time
+import unittest
+import numpy as np
+from src.ai.online_learner import OnlineLearner
+
+
+class LinearModel:
+    """y = X @ w trained by gradient descent, standing in for a Keras model."""
+
+    def __init__(self, features):
+        self.w = np.zeros(features)
+        self.fit_sizes = []
+
+    def fit(self, X, y, epochs=1, batch_size=32, verbose=0):
+        self.fit_sizes.append(len(X))
+        for _ in range(epochs * 200):
+            self.w -= 0.1 * X.T @ (X @ self.w - y) / len(X)
+
+    def predict(self, X):
+        return X @ self.w
+
+
+class TestOnlineLearner(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(256, 3))
+        self.y = self.X @ np.array([1.0, -2.0, 0.5])
+
+    def test_trains_in_mini_batches_and_publishes(self):
+        learner = OnlineLearner(LinearModel(3), batch_size=64, max_delay=60)
+        try:
+            np.testing.assert_array_equal(learner.predict(self.X[:2]), [0.0, 0.0])
+            for i in range(0, 256, 8):
+                learner.add_samples(self.X[i:i + 8], self.y[i:i + 8])
+            self.assertTrue(learner.flush(timeout=5))
+            self.assertGreaterEqual(learner.version, 1)
+            self.assertTrue(all(size >= 64 for size in learner.trainer.fit_sizes))
+            np.testing.assert_allclose(learner.predict(self.X[:5]), self.y[:5], atol=1e-2)
+            # The live predictor is a copy, never the model being trained
+            self.assertIsNot(learner.live_model, learner.trainer)
+        finally:
+            learner.close(timeout=5)
+
+    def test_partial_batch_is_trained_after_max_delay(self):
+        learner = OnlineLearner(LinearModel(3), batch_size=1000, max_delay=0.05)
+        try:
+            learner.add_samples(self.X[:10], self.y[:10])
+            deadline = time.monotonic() + 5
+            while learner.version == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(learner.trainer.fit_sizes, [10])
+        finally:
+            learner.close(timeout=5)
+
+    def test_prediction_does_not_wait_for_training(self):
+        release = threading.Event()
+
+        def slow_fit(model, X, y):
+            release.wait(5)
+            model.fit(X, y)
+
+        learner = OnlineLearner(LinearModel(3), fit=slow_fit, batch_size=8, max_delay=60)
+        try:
+            learner.add_samples(self.X[:8], self.y[:8])
+            started = time.perf_counter()
+            learner.predict(self.X[:4])
+            self.assertLess(time.perf_counter() - started, 1.0)
+            self.assertEqual(learner.version, 0)
+            release.set()
+            self.assertTrue(learner.flush(timeout=5))
+            self.assertEqual(learner.version, 1)
+        finally:
+            release.set()
+            learner.close(timeout=5)
+
+    def test_oldest_samples_are_dropped_when_training_falls_behind(self):
+        release = threading.Event()
+        learner = OnlineLearner(LinearModel(3), fit=lambda model, X, y: release.wait(5), batch_size=10,
+                                max_delay=60, max_pending=20)
+        try:
+            learner.add_samples(self.X[:10], self.y[:10])  # Taken by the blocked worker
+            time.sleep(0.1)
+            for i in range(10, 60, 10):
+                learner.add_samples(self.X[i:i + 10], self.y[i:i + 10])
+            self.assertEqual(learner.stats["dropped"], 30)
+            release.set()
+            self.assertTrue(learner.flush(timeout=5))
+        finally:
+            release.set()
+            learner.close(timeout=5)
+
+    def test_training_errors_do_not_stop_the_worker(self):
+        calls = []
+
+        def flaky_fit(model, X, y):
+            calls.append(len(X))
+            if len(calls) == 1:
+                raise ValueError("bad batch")
+            model.fit(X, y)
+
+        learner = OnlineLearner(LinearModel(3), fit=flaky_fit, batch_size=4, max_delay=60)
+        try:
+            learner.add_samples(self.X[:4], self.y[:4])
+            self.assertTrue(learner.flush(timeout=5))
+            learner.add_samples(self.X[4:8], self.y[4:8])
+            self.assertTrue(learner.flush(timeout=5))
+            self.assertEqual(learner.stats["errors"], 1)
+            self.assertEqual(learner.version, 1)
+        finally:
+            learner.close(timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
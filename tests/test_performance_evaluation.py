@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from unittest.mock import Mock
 from src.ai.multi_agent_manager import MultiAgentManager
 
@@ -8,7 +9,8 @@ class TestPerformanceEvaluation(unittest.TestCase):
     def setUp(self):
         """Set up MultiAgentManager and mock agents."""
         # Mock agent configuration as a list of dictionaries for iteration
-        self.mock_agent_config = [{'market_data': 'mock_market_data'}]
+        prices = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, 200)))
+        self.mock_agent_config = [{'market_data': prices}]
         self.mock_strategies = Mock()
 
         # Initialize the MultiAgentManager with mock config and strategies
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from src.rl_agent.rl_agent import QLearningAgent
+
+
+class TestQLearningBatchUpdate(unittest.TestCase):
+
+    def make_agent(self):
+        return QLearningAgent(alpha=0.1, gamma=0.9, epsilon=0.0, num_states=50, num_actions=3)
+
+    def test_batch_without_duplicates_matches_sequential_updates(self):
+        sequential, batched = self.make_agent(), self.make_agent()
+        rng = np.random.default_rng(0)
+        sequential.q_table[:] = batched.q_table[:] = rng.standard_normal((50, 3))
+        # Distinct state-action pairs whose next states are not updated by the batch itself
+        states = rng.permutation(25)[:20]
+        actions = rng.integers(0, 3, 20)
+        rewards = rng.standard_normal(20)
+        next_states = rng.integers(25, 50, 20)
+
+        for s, a, r, n in zip(states, actions, rewards, next_states):
+            sequential.update_q_table(s, a, r, n)
+        batched.update_q_table_batch(states, actions, rewards, next_states)
+        np.testing.assert_allclose(batched.q_table, sequential.q_table)
+
+    def test_duplicates_are_order_independent(self):
+        states = np.array([0, 0, 0, 1])
+        actions = np.array([2, 2, 2, 0])
+        rewards = np.array([1.0, 2.0, 6.0, 1.0])
+        next_states = np.array([3, 3, 3, 3])
+
+        mean_agent, shuffled_agent, sum_agent = self.make_agent(), self.make_agent(), self.make_agent()
+        mean_agent.update_q_table_batch(states, actions, rewards, next_states)
+        order = [3, 1, 2, 0]
+        shuffled_agent.update_q_table_batch(states[order], actions[order], rewards[order], next_states[order])
+        sum_agent.update_q_table_batch(states, actions, rewards, next_states, duplicates="sum")
+
+        self.assertAlmostEqual(mean_agent.q_table[0, 2], 0.1 * 3.0)
+        np.testing.assert_array_equal(mean_agent.q_table, shuffled_agent.q_table)
+        self.assertAlmostEqual(sum_agent.q_table[0, 2], 0.1 * 9.0)
+
+    def test_replay_from_log(self):
+        rng = np.random.default_rng(1)
+        size = 100_000
+        log = pd.DataFrame({
+            "state": rng.integers(0, 50, size),
+            "action": rng.integers(0, 3, size),
+            "reward": rng.standard_normal(size),
+            "next_state": rng.integers(0, 50, size),
+            "done": rng.random(size) < 0.05,
+        })
+        agent = self.make_agent()
+        start = time.perf_counter()
+        self.assertEqual(agent.replay_from_log(log, batch_size=4096, epochs=2), 2 * size)
+        self.assertLess(time.perf_counter() - start, 5.0)
+        self.assertTrue(np.any(agent.q_table != 0))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "transitions.npz")
+            np.savez(path, **{column: log[column].to_numpy() for column in log.columns})
+            from_file = self.make_agent()
+            from_file.replay_from_log(path, batch_size=4096, epochs=2)
+        np.testing.assert_allclose(from_file.q_table, agent.q_table)
+
+        with self.assertRaises(ValueError):
+            agent.replay_from_log(log.drop(columns=["reward"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
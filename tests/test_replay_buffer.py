@@ -0,0 +1,111 @@
+import importlib.util
+import unittest
+import numpy as np
+from src.ai.replay_buffer import ExperienceReplayBuffer, PrioritizedReplayBuffer, SumTree
+
+
+class TestExperienceReplayBuffer(unittest.TestCase):
+
+    def test_push_and_sample_return_batch_arrays(self):
+        buffer = ExperienceReplayBuffer(capacity=100, seed=0)
+        for i in range(50):
+            buffer.push(np.full(3, i), i % 3, float(i), np.full(3, i + 1), i % 10 == 9)
+        self.assertEqual(len(buffer), 50)
+
+        states, actions, rewards, next_states, dones = buffer.sample(16)
+        self.assertEqual(states.shape, (16, 3))
+        self.assertEqual(states.dtype, np.float32)
+        self.assertEqual(actions.dtype, np.int64)
+        np.testing.assert_array_equal(states[:, 0], rewards)
+        np.testing.assert_array_equal(next_states[:, 0], rewards + 1)
+        np.testing.assert_array_equal(actions, rewards.astype(np.int64) % 3)
+        self.assertEqual(len(set(rewards.tolist())), 16)  # sampled without replacement
+
+    def test_ring_overwrites_oldest(self):
+        buffer = ExperienceReplayBuffer(capacity=10, seed=0)
+        for i in range(25):
+            buffer.push([i], 0, i, [i], False)
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual(sorted(buffer.sample(10)[2].tolist()), list(range(15, 25)))
+
+    def test_push_batch_wraps_around(self):
+        buffer = ExperienceReplayBuffer(capacity=8, seed=0)
+        buffer.push([0.0, 0.0], [0.5], 0.0, [0.0, 0.0], False)
+        values = np.arange(1, 11, dtype=np.float32)
+        buffer.push_batch(np.stack([values, values], axis=1), values[:, None], values,
+                          np.stack([values, values], axis=1), values > 9)
+        self.assertEqual(len(buffer), 8)
+        self.assertEqual(buffer.position, 3)
+        self.assertEqual(sorted(buffer.sample(8)[2].tolist()), list(range(3, 11)))
+        self.assertEqual(buffer.actions.dtype, np.float32)
+
+    def test_sample_larger_than_buffer_raises(self):
+        buffer = ExperienceReplayBuffer(capacity=10)
+        buffer.push([0], 0, 0, [0], False)
+        with self.assertRaises(ValueError):
+            buffer.sample(2)
+
+
+class TestPrioritizedReplayBuffer(unittest.TestCase):
+
+    def test_sum_tree_batch_update_and_find(self):
+        tree = SumTree(5)
+        tree.update([0, 1, 2, 3, 4], [1.0, 2.0, 3.0, 4.0, 0.0])
+        self.assertAlmostEqual(tree.total, 10.0)
+        np.testing.assert_array_equal(tree.find([0.0, 0.99, 1.0, 2.9, 3.0, 5.99, 6.0, 9.99]),
+                                      [0, 0, 1, 1, 2, 2, 3, 3])
+        tree.update([3, 3], [0.5, 1.5])  # last write wins
+        self.assertAlmostEqual(tree.total, 7.5)
+
+    def test_sampling_follows_priorities(self):
+        buffer = PrioritizedReplayBuffer(capacity=100, alpha=1.0, seed=0)
+        for i in range(100):
+            buffer.push([i], 0, i, [i], False)
+        # Only transitions 10..19 are informative
+        buffer.update_priorities(np.arange(100), np.where((np.arange(100) >= 10) & (np.arange(100) < 20), 1.0, 0.0))
+        *_, indices, weights = buffer.sample(64)
+        self.assertTrue(np.all((indices >= 10) & (indices < 20)))
+        self.assertAlmostEqual(float(weights.max()), 1.0)
+
+    def test_importance_weights_compensate_for_priority(self):
+        buffer = PrioritizedReplayBuffer(capacity=4, alpha=1.0, epsilon=0.0, seed=0)
+        for i in range(4):
+            buffer.push([i], 0, i, [i], False)
+        buffer.update_priorities([0, 1, 2, 3], [1.0, 1.0, 1.0, 5.0])
+        *_, indices, weights = buffer.sample(16, beta=1.0)
+        self.assertTrue(np.all(weights[indices == 3] < weights[indices != 3].min()))
+        np.testing.assert_allclose(weights[indices == 3], 0.2, rtol=1e-6)
+
+    def test_new_transitions_get_max_priority(self):
+        buffer = PrioritizedReplayBuffer(capacity=8, alpha=1.0, epsilon=0.0, seed=0)
+        buffer.push_batch(np.zeros((3, 1)), np.zeros(3, dtype=np.int64), np.zeros(3), np.zeros((3, 1)), np.zeros(3))
+        buffer.update_priorities([0, 1, 2], [4.0, 0.5, 0.5])
+        buffer.push([1.0], 0, 1.0, [1.0], False)
+        self.assertAlmostEqual(float(buffer.tree.get([3])[0]), 4.0)
+        self.assertAlmostEqual(buffer.tree.total, 9.0)
+
+
+@unittest.skipUnless(importlib.util.find_spec("stable_baselines3"), "stable-baselines3 is not installed")
+class TestTrainFromExperience(unittest.TestCase):
+
+    def test_single_vectorized_update_changes_the_policy(self):
+        import gymnasium as gym
+        import torch
+        from src.ai.replay_buffer import RLTradingAgent
+
+        env = gym.make("CartPole-v1")
+        agent = RLTradingAgent(env, buffer_size=500, prioritized=True)
+        rng = np.random.default_rng(0)
+        states = rng.standard_normal((500, 4)).astype(np.float32)
+        agent.buffer.push_batch(states, rng.integers(0, 2, 500), rng.standard_normal(500), states, np.zeros(500))
+        before = [p.detach().clone() for p in agent.model.policy.parameters()]
+
+        stats = agent.train_from_experience(batch_size=128)
+
+        self.assertEqual(stats["batch_size"], 128)
+        self.assertTrue(any(not torch.equal(a, b) for a, b in zip(before, agent.model.policy.parameters())))
+        self.assertIsNone(RLTradingAgent(env, buffer_size=10).train_from_experience(batch_size=64))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
+import importlib.util
 import unittest
 from unittest.mock import Mock
-from src.ai.rl_agent import RLTradingAgent
+import numpy as np
+from src.ai.environment import TradingEnv
+from src.ai.rl_agent import RLTradeDecider, RLTradingAgent, market_features
+
+HAS_SB3 = importlib.util.find_spec("stable_baselines3") is not None
 
 class MockEnvironment:
     def reset(self):
@@ -25,5 +30,49 @@ class TestRLAgent(unittest.TestCase):
         except Exception as e:
             self.fail(f"Train method raised an exception: {e}")
 
+class ScorePolicy:
+    """Stand-in policy returning its input as action scores (the largest feature wins), recording batch shapes."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_batch(self, batch):
+        self.calls.append(batch.shape)
+        return batch[:, -3:]
+
+
+class TestRLTradeDecider(unittest.TestCase):
+
+    def test_one_batched_forward_pass_returns_trade_decisions(self):
+        policy = ScorePolicy()
+        decider = RLTradeDecider("arbitrage_trading", policy=policy, source_wallet="hot", trade_amount=2.0)
+        decisions = decider.decide_actions([
+            {"amount": 4.0, "x": 0.9, "y": 0.1, "z": 0.0, "source_wallet": "cold"},
+            {"amount": 5.0, "x": 0.1, "y": 0.8, "z": 0.2},
+            {"amount": 6.0, "x": 0.1, "y": 0.2, "z": 0.7},
+        ])
+        self.assertEqual(policy.calls, [(3, 4)])
+        self.assertEqual(decisions, [
+            {"action": "buy", "source_wallet": "cold", "amount": 4.0},
+            {"action": "sell", "source_wallet": "hot", "amount": 5.0},
+            {"action": "hold", "source_wallet": "hot", "amount": 0.0},
+        ])
+        self.assertEqual(decider.decide_action([0.2, 0.9, 0.1]),
+                         {"action": "sell", "source_wallet": "hot", "amount": 2.0})
+
+    def test_market_features_keep_numeric_fields_in_key_order(self):
+        features = market_features({"spread": 0.5, "price": 10, "pool": "0xabc", "live": True})
+        np.testing.assert_array_equal(features, np.array([10, 0.5], dtype=np.float32))
+
+    @unittest.skipUnless(HAS_SB3, "stable-baselines3 is not installed")
+    def test_agent_decides_on_gymnasium_env_observations(self):
+        prices = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 50))
+        policy = ScorePolicy()
+        agent = RLTradingAgent(TradingEnv(prices, window=3), policy=policy)
+        actions = agent.decide_actions([[0.1, 0.9, 0.0], [0.8, 0.2, 0.0]])
+        self.assertEqual(actions, [1, 0])
+        self.assertEqual(policy.calls, [(2, 3)])
+
+
 if __name__ == '__main__':
     unittest.main()
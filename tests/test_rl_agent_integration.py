@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from unittest.mock import Mock
 from src.ai.rl_agent import RLTradingAgent
 from src.ai.environment import TradingEnv
@@ -9,7 +10,8 @@ class TestRLAgentIntegration(unittest.TestCase):
     def setUp(self):
         """Set up mock environment and RL agent."""
         # Create a mock environment using the actual TradingEnv class
-        self.env = TradingEnv(market_data='mock_data')
+        prices = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, 200)))
+        self.env = TradingEnv(market_data=prices)
 
         # Initialize RLTradingAgent with the environment
         self.rl_agent = RLTradingAgent(self.env)
@@ -0,0 +1,61 @@
+import threading
+import unittest
+from src.ai.models.sentiment_analysis import SentimentAnalysis, SentimentCache
+
+
+class FakePipeline:
+    """Scores texts by their length; records every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.batches.append(list(texts))
+        return [{"label": "NEGATIVE" if text.startswith("-") else "POSITIVE", "score": len(text) / 100}
+                for text in texts]
+
+
+class TestSentimentAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = FakePipeline()
+        self.model = SentimentAnalysis(self.pipeline, batch_size=4, max_latency_ms=20)
+
+    def tearDown(self):
+        self.model.close()
+
+    def test_scores_are_aligned_deduplicated_and_batched(self):
+        texts = ["up", "-down", "up", "sideways", "moon", "-dump", "up", "flat"]
+        scores = self.model.score_texts(texts, timeout=5)
+        self.assertEqual(list(scores), [0.02, -0.05, 0.02, 0.08, 0.04, -0.05, 0.02, 0.04])
+        scored = [text for batch in self.pipeline.batches for text in batch]
+        self.assertEqual(sorted(scored), sorted(set(texts)))
+        self.assertLessEqual(max(len(batch) for batch in self.pipeline.batches), 4)
+
+    def test_repeats_are_served_from_cache(self):
+        self.model.score_texts(["news a", "news b"], timeout=5)
+        calls = len(self.pipeline.batches)
+        self.assertAlmostEqual(self.model.get_sentiment_score("news a"), 0.06)
+        self.assertEqual(len(self.pipeline.batches), calls)
+        self.assertGreaterEqual(self.model.cache.hits, 1)
+
+
+class TestSentimentCache(unittest.TestCase):
+
+    def test_lru_and_ttl(self):
+        now = [0.0]
+        cache = SentimentCache(max_size=2, ttl=10, clock=lambda: now[0])
+        cache.put("a", 1.0)
+        cache.put("b", 2.0)
+        cache.get("a")
+        cache.put("c", 3.0)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1.0)
+        now[0] = 11
+        self.assertIsNone(cache.get("c"))
+
+
+if __name__ == '__main__':
+    unittest.main()
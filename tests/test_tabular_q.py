@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+from src.ai.agents.tabular_q import BinningStateDiscretizer, StateDiscretizer, TabularQEngine
+
+
+class TestTabularQEngine(unittest.TestCase):
+
+    def test_hashable_states_get_contiguous_ids_and_array_grows(self):
+        engine = TabularQEngine(["buy", "sell", "hold"], initial_states=2, seed=0)
+        ids = engine.state_ids([("ETH", "up"), ("BTC", "down"), ("ETH", "up"), ("SOL", "flat")])
+        np.testing.assert_array_equal(ids, [0, 1, 0, 2])
+        self.assertGreaterEqual(len(engine.q), 3)
+        self.assertEqual(engine.num_states, 3)
+
+    def test_update_matches_q_learning_rule(self):
+        engine = TabularQEngine(["buy", "sell", "hold"], seed=0)
+        engine.q[engine.state_id("s1")] = [0.0, 2.0, 1.0]
+        td_error = engine.update("s0", "sell", 1.0, "s1", learning_rate=0.5, discount_factor=0.9)
+        self.assertAlmostEqual(td_error, 1.0 + 0.9 * 2.0)
+        self.assertAlmostEqual(engine.q_values("s0")[engine.action_id("sell")], 0.5 * 2.8)
+        with self.assertRaises(ValueError):
+            engine.action_id("short")
+
+    def test_vectorized_epsilon_greedy(self):
+        engine = TabularQEngine(["buy", "sell", "hold"], seed=0)
+        states = [f"asset{i}" for i in range(1000)]
+        engine.q[engine.state_ids(states), 2] = 1.0
+        self.assertTrue(np.all(engine.select_actions(states, epsilon=0.0) == 2))
+        explored = engine.select_actions(states, epsilon=1.0)
+        self.assertEqual(set(explored.tolist()), {0, 1, 2})
+        # Unseen states have all-zero rows; ties are broken at random instead of always picking "buy"
+        fresh = engine.select_actions([f"new{i}" for i in range(300)], epsilon=0.0)
+        self.assertEqual(set(fresh.tolist()), {0, 1, 2})
+
+    def test_binning_discretizer(self):
+        discretizer = BinningStateDiscretizer([[-0.01, 0.01], [30, 70]])
+        ids = discretizer.ids([[-0.05, 20], [0.0, 50], [0.05, 80]])
+        np.testing.assert_array_equal(ids, [0, 4, 8])
+        self.assertEqual(discretizer.size, 9)
+        self.assertEqual(discretizer.id([0.0, 50]), 4)
+        self.assertEqual(StateDiscretizer().ids(["a", "b", "a"]).tolist(), [0, 1, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
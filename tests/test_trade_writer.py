@@ -0,0 +1,138 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from src.database.trade_writer import TradeWriteBehindQueue
+
+
+class FlakyConnection:
+    """Wraps a SQLite connection and fails every write while `down` is set."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.down = False
+
+    def __enter__(self):
+        if self.down:
+            raise sqlite3.OperationalError("database unavailable")
+        return self.connection.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self.connection.__exit__(*exc_info)
+
+
+class TestTradeWriteBehindQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.spill_path = os.path.join(self.tmpdir.name, "spill.jsonl")
+        self.db = sqlite3.connect(":memory:", check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE trades (symbol TEXT, trade_action TEXT, trade_size REAL, price REAL, timestamp TEXT)"
+        )
+        self.connection = FlakyConnection(self.db)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_writer(self, **options):
+        options.setdefault("batch_size", 10)
+        options.setdefault("flush_interval", 0.05)
+        writer = TradeWriteBehindQueue(lambda: self.connection, spill_path=self.spill_path, placeholder="?", **options)
+        self.addCleanup(writer.close)
+        return writer
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+
+    def trade(self, i):
+        return ("BTC", "buy", 0.1, 50000.0 + i, "2024-01-01 00:00:00")
+
+    def test_rows_are_batched(self):
+        writer = self.make_writer(flush_interval=10)
+        for i in range(25):
+            writer.submit(self.trade(i))
+        writer.flush()
+        self.assertEqual(self.count(), 25)
+        self.assertLessEqual(writer.stats()["batches"], 4)
+
+    def test_time_threshold_flushes_partial_batch(self):
+        writer = self.make_writer(batch_size=1000)
+        writer.submit(self.trade(0))
+        time.sleep(0.3)
+        self.assertEqual(self.count(), 1)
+
+    def test_close_drains_queue(self):
+        writer = self.make_writer(flush_interval=10)
+        for i in range(7):
+            writer.submit(self.trade(i))
+        writer.close()
+        self.assertEqual(self.count(), 7)
+
+    def test_flush_after_close_returns_immediately(self):
+        writer = self.make_writer()
+        writer.submit(self.trade(0))
+        writer.close()
+        started = time.monotonic()
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_failed_batches_spill_and_replay(self):
+        writer = self.make_writer()
+        self.connection.down = True
+        for i in range(5):
+            writer.submit(self.trade(i))
+        writer.flush()
+        self.assertEqual(self.count(), 0)
+        self.assertTrue(os.path.exists(self.spill_path))
+
+        self.connection.down = False
+        writer.submit(self.trade(5))
+        writer.flush()
+        self.assertEqual(self.count(), 6)
+        self.assertFalse(os.path.exists(self.spill_path))
+        self.assertEqual(writer.stats()["replayed"], 5)
+
+    def test_writers_sharing_a_spill_file_lose_no_rows(self):
+        first, second = self.make_writer(), self.make_writer()
+        self.assertIs(first._spill_lock, second._spill_lock)
+        stop = threading.Event()
+
+        def flap():
+            while not stop.is_set():
+                self.connection.down = not self.connection.down
+                time.sleep(0.005)
+
+        flapper = threading.Thread(target=flap)
+        flapper.start()
+        for i in range(200):
+            (first if i % 2 else second).submit(self.trade(i))
+            time.sleep(0.001)
+        stop.set()
+        flapper.join()
+        self.connection.down = False
+        first.close()
+        second.close()
+        prices = {row[0] for row in self.db.execute("SELECT price FROM trades")}
+        self.assertEqual(prices, {self.trade(i)[3] for i in range(200)})
+
+    def test_submit_after_close_raises(self):
+        writer = self.make_writer()
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.submit(self.trade(0))
+
+    def test_full_queue_spills_instead_of_growing(self):
+        writer = self.make_writer(max_queue=1, put_timeout=0)
+        self.connection.down = True
+        accepted = [writer.submit(self.trade(i)) for i in range(50)]
+        self.assertIn(False, accepted)
+        self.connection.down = False
+        writer.close()
+        self.assertEqual(self.count(), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
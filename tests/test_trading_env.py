@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.ai.environment import TradingEnv
+from src.ai.vec_env import BUY, HOLD, SELL
+
+
+class TestTradingEnv(unittest.TestCase):
+
+    def setUp(self):
+        self.prices = np.array([100.0, 101.0, 102.0, 99.0, 100.0, 103.0, 104.0, 102.0])
+
+    def test_observations_are_views_of_the_data(self):
+        env = TradingEnv(self.prices, window=3)
+        obs, info = env.reset()
+        np.testing.assert_array_equal(obs, self.prices[:3])
+        self.assertTrue(np.shares_memory(obs, env.market_data))
+        obs, *_ = env.step(HOLD)
+        np.testing.assert_array_equal(obs, self.prices[1:4])
+
+    def test_pnl_reward_with_fees_and_slippage(self):
+        env = TradingEnv(self.prices, window=3, fee=0.001, slippage=0.001)
+        env.reset()
+        _, reward, terminated, truncated, info = env.step(BUY)  # long from 102 to 99
+        self.assertAlmostEqual(reward, 99 / 102 - 1 - 0.002)
+        _, reward, *_ = env.step(HOLD)  # still long, 99 to 100, no costs
+        self.assertAlmostEqual(reward, 100 / 99 - 1)
+        _, reward, *_ = env.step(SELL)  # flip to short, 100 to 103, costs on 2 units
+        self.assertAlmostEqual(reward, -(103 / 100 - 1) - 0.004)
+        self.assertEqual(info["position"], 1.0)
+        self.assertFalse(terminated or truncated)
+
+    def test_indicators_follow_the_current_bar(self):
+        prices = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 200))
+        env = TradingEnv(prices, window=5)
+        env.reset()
+        for _ in range(30):
+            env.step(HOLD)
+        self.assertEqual(env.get_current_price(), prices[env.t])
+        self.assertAlmostEqual(env.get_moving_average(), prices[env.t - 19:env.t + 1].mean())
+        self.assertAlmostEqual(env.get_momentum(), prices[env.t] - prices[env.t - 10])
+        env.reset()  # Back to bar 4: too little history for the 20-bar average
+        self.assertTrue(np.isnan(env.get_moving_average()))
+        for _ in range(20):
+            env.step(HOLD)
+        self.assertAlmostEqual(env.get_moving_average(), prices[env.t - 19:env.t + 1].mean())
+
+    def test_episode_ends_at_end_of_data(self):
+        env = TradingEnv(self.prices, window=3)
+        env.reset()
+        steps, done = 0, False
+        while not done:
+            _, _, terminated, truncated, _ = env.step(HOLD)
+            done = terminated or truncated
+            steps += 1
+        self.assertEqual(steps, len(self.prices) - 3)
+
+    def test_memmapped_feature_matrix(self):
+        features = np.column_stack([self.prices, np.arange(len(self.prices), dtype=np.float64)])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bars.npy")
+            np.save(path, features)
+            env = TradingEnv(path, window=4, price_column=0)
+            obs, _ = env.reset()
+            self.assertIsInstance(env.market_data, np.memmap)
+            self.assertEqual(obs.shape, (4, 2))
+            np.testing.assert_array_equal(obs[:, 1], [0, 1, 2, 3])
+            del env, obs
+
+    def test_unusable_market_data_raises(self):
+        for market_data in ("mock_data", None, [100.0], np.zeros((2, 2, 2)), ["a", "b"]):
+            with self.assertRaises(ValueError):
+                TradingEnv(market_data=market_data)
+
+    def test_short_history_gets_short_window(self):
+        self.assertEqual(TradingEnv(np.array([100, 102, 105, 107])).window, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
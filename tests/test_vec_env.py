@@ -0,0 +1,62 @@
+import importlib.util
+import unittest
+import numpy as np
+from src.ai.vec_env import BUY, HOLD, SELL, VectorizedTradingEnv, pnl_reward, target_positions
+
+
+class TestVectorizedTradingEnv(unittest.TestCase):
+
+    def setUp(self):
+        self.prices = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, 2000)))
+
+    def test_batched_shapes_and_observation_window(self):
+        env = VectorizedTradingEnv(self.prices, num_envs=16, window=5, seed=0)
+        obs = env.reset()
+        self.assertEqual(obs.shape, (16, 6))
+        i = 3
+        expected = np.diff(np.log(self.prices))[env.t[i] - 5:env.t[i]]
+        np.testing.assert_allclose(obs[i, :5], expected, rtol=1e-5)
+        self.assertTrue(np.all(obs[:, -1] == 0))
+
+        obs, rewards, dones, infos = env.step(np.full(16, BUY))
+        self.assertEqual((obs.shape, rewards.shape, dones.shape, len(infos)), ((16, 6), (16,), (16,), 16))
+        self.assertTrue(np.all(obs[:, -1] == 1))
+
+    def test_rewards_are_pnl_minus_costs(self):
+        env = VectorizedTradingEnv(self.prices, num_envs=2, window=5, fee=0.001, slippage=0.0005, seed=0)
+        env.reset()
+        start = env.t.copy()
+        _, rewards, _, _ = env.step(np.array([BUY, HOLD]))
+        growth = self.prices[start + 1] / self.prices[start] - 1
+        self.assertAlmostEqual(float(rewards[0]), growth[0] - 0.0015, places=6)
+        self.assertEqual(float(rewards[1]), 0.0)
+
+        np.testing.assert_array_equal(target_positions([BUY, SELL, HOLD], [0.0, 1.0, -1.0]), [1.0, -1.0, -1.0])
+        np.testing.assert_array_equal(target_positions([SELL], [1.0], allow_short=False), [0.0])
+        self.assertAlmostEqual(float(pnl_reward(np.array([1.0]), np.array([-1.0]), 100.0, 90.0, 0.001, 0.0)[0]),
+                               0.1 - 0.002)
+
+    def test_auto_reset_after_episode_length(self):
+        env = VectorizedTradingEnv(self.prices, num_envs=4, window=5, episode_length=3, seed=0)
+        env.reset()
+        for _ in range(2):
+            _, _, dones, _ = env.step(np.full(4, BUY))
+            self.assertFalse(dones.any())
+        obs, _, dones, infos = env.step(np.full(4, BUY))
+        self.assertTrue(dones.all())
+        self.assertEqual(infos[0]["terminal_observation"][-1], 1.0)
+        self.assertTrue(np.all(obs[:, -1] == 0))  # fresh episodes start flat
+        self.assertTrue(np.all(env.steps == 0))
+
+    @unittest.skipUnless(importlib.util.find_spec("stable_baselines3"), "stable-baselines3 is not installed")
+    def test_sb3_seed_applies_to_next_reset_only(self):
+        env = VectorizedTradingEnv(self.prices, num_envs=4, window=5, seed=0).as_sb3_vec_env()
+        env.seed(7)
+        first = env.reset()
+        env.seed(7)
+        np.testing.assert_array_equal(env.reset(), first)
+        self.assertFalse(np.array_equal(env.reset(), first))
+
+
+if __name__ == "__main__":
+    unittest.main()